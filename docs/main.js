@@ -18,40 +18,76 @@ function getDraftSettings() {
 // --- Player Names ---
 const playerNamesByPos = {};
 
-async function fetchCsvRows(file) {
-    try {
-        // Enhanced path handling for GitHub Pages
-        const baseUrl = window.location.hostname === 'arkokush.github.io' ? '/FantasyFootball' : '';
-        const possiblePaths = [
-            `${baseUrl}/docs/data/2025/${file}`,
-            `${baseUrl}/data/2025/${file}`,
-            `./data/2025/${file}`,
-            `/FantasyFootball/docs/data/2025/${file}`, // GitHub Pages path
-            `/docs/data/2025/${file}`
-        ];
-
-        let response;
-        let lastError;
-        let successPath;
-
-        for (const path of possiblePaths) {
-            try {
-                console.log(`Trying to fetch from path: ${path}`);
-                response = await fetch(path);
-                if (response.ok) {
-                    successPath = path;
-                    console.log(`Successfully fetched from: ${path}`);
-                    break;
-                }
-            } catch (error) {
-                lastError = error;
-                console.warn(`Failed to fetch from path: ${path}`, error);
-                continue;
+// Directory the first successful fetch came from; later files go straight there.
+let dataBasePath = null;
+
+async function fetchDataFile(file) {
+    // Enhanced path handling for GitHub Pages
+    const baseUrl = window.location.hostname === 'arkokush.github.io' ? '/FantasyFootball' : '';
+    const possibleBases = [
+        `${baseUrl}/docs/data/2025/`,
+        `${baseUrl}/data/2025/`,
+        `./data/2025/`,
+        `/FantasyFootball/docs/data/2025/`, // GitHub Pages path
+        `/docs/data/2025/`
+    ];
+    if (dataBasePath) {
+        possibleBases.unshift(dataBasePath);
+    }
+
+    let lastError;
+    for (const base of new Set(possibleBases)) {
+        const path = `${base}${file}`;
+        try {
+            console.log(`Trying to fetch from path: ${path}`);
+            const response = await fetch(path);
+            if (response.ok) {
+                console.log(`Successfully fetched from: ${path}`);
+                dataBasePath = base;
+                return response;
             }
+        } catch (error) {
+            lastError = error;
+            console.warn(`Failed to fetch from path: ${path}`, error);
+        }
+    }
+    console.error(`Could not fetch ${file} from any path. Last error:`, lastError);
+    return null;
+}
+
+// Splits one CSV line, honouring double-quoted fields ("Smith, Jr.").
+function parseCsvLine(line) {
+    const values = [];
+    let current = '';
+    let inQuotes = false;
+    for (let i = 0; i < line.length; i++) {
+        const ch = line[i];
+        if (inQuotes) {
+            if (ch === '"' && line[i + 1] === '"') {
+                current += '"';
+                i++;
+            } else if (ch === '"') {
+                inQuotes = false;
+            } else {
+                current += ch;
+            }
+        } else if (ch === '"') {
+            inQuotes = true;
+        } else if (ch === ',') {
+            values.push(current.trim());
+            current = '';
+        } else {
+            current += ch;
         }
+    }
+    values.push(current.trim());
+    return values;
+}
 
-        if (!response || !response.ok) {
-            console.error(`Could not fetch ${file} from any path. Last error:`, lastError);
+async function fetchCsvRows(file) {
+    try {
+        const response = await fetchDataFile(file);
+        if (!response) {
             return [];
         }
 
@@ -61,17 +97,17 @@ async function fetchCsvRows(file) {
             return [];
         }
 
-        const lines = text.trim().split('\n');
+        const lines = text.trim().split(/\r?\n/);
         if (lines.length < 2) {
             console.warn(`File ${file} has no data rows`);
             return [];
         }
 
         const [header, ...rows] = lines;
-        const keys = header.split(',').map(key => key.trim());
+        const keys = parseCsvLine(header);
 
         return rows.map(row => {
-            const vals = row.split(',').map(val => val.trim());
+            const vals = parseCsvLine(row);
             const obj = {};
             keys.forEach((k, i) => {
                 obj[k] = vals[i] || '';
@@ -85,7 +121,93 @@ async function fetchCsvRows(file) {
     }
 }
 
+// --- Precompiled Player Bundle ---
+// Built by scripts/build_frontend_bundle.py: every position with numeric
+// projections and orderings already sorted per scoring type, plus the
+// normalization stats, in one gzipped request. Add ?bundle=0 to the URL
+// to use the per-position CSVs instead.
+const DATA_BUNDLE = 'bundle.json.gz';
+const SCORING_KEYS = {0: 'std', 0.5: 'half_ppr', 1: 'ppr'};
+const presortedPlayers = {}; // position -> scoring key -> players, best first
+const bundlePlayerNames = {};
+const pickSurvival = {}; // scoring key -> player_id -> [adp, sd, drafted share]
+let normalizationStatsLoaded = false;
+let bundlePromise = null;
+
+async function readBundle(response) {
+    const bytes = new Uint8Array(await response.arrayBuffer());
+    // GitHub Pages serves .gz files as-is; other servers may already have decoded them.
+    if (bytes[0] === 0x1f && bytes[1] === 0x8b) {
+        const stream = new Blob([bytes]).stream().pipeThrough(new DecompressionStream('gzip'));
+        return new Response(stream).json();
+    }
+    return JSON.parse(new TextDecoder().decode(bytes));
+}
+
+function applyBundle(bundle) {
+    for (const [position, block] of Object.entries(bundle.positions)) {
+        const players = block.name.map((name, i) => ({
+            name,
+            team: block.team[i],
+            position: block.position[i],
+            player_id: block.player_id[i],
+            BYE: block.bye[i] === null ? 'N/A' : block.bye[i],
+            std: block.std[i],
+            half_ppr: block.half_ppr[i],
+            ppr: block.ppr[i]
+        }));
+        playerDataCache[position] = players;
+        presortedPlayers[position] = {};
+        for (const [key, order] of Object.entries(block.order)) {
+            presortedPlayers[position][key] = order.map(i => players[i]);
+        }
+    }
+    presortedPlayers.flex = {};
+    for (const [key, order] of Object.entries(bundle.flex.order)) {
+        presortedPlayers.flex[key] = order.map(([position, i]) => playerDataCache[position][i]);
+    }
+    Object.assign(bundlePlayerNames, bundle.names || {});
+    Object.assign(pickSurvival, bundle.survival || {});
+    if (bundle.normalization) {
+        minMax = bundle.normalization.minmax;
+        vorStats = bundle.normalization.standard;
+        normalizationStatsLoaded = true;
+    }
+}
+
+function loadFrontendBundle() {
+    if (!bundlePromise) {
+        bundlePromise = (async () => {
+            if (new URLSearchParams(window.location.search).get('bundle') === '0') return false;
+            if (typeof DecompressionStream === 'undefined') return false;
+            try {
+                const response = await fetchDataFile(DATA_BUNDLE);
+                if (!response) return false;
+                const bundle = await readBundle(response);
+                applyBundle(bundle);
+                console.log(`Loaded ${bundle.season} player bundle`);
+                return true;
+            } catch (error) {
+                console.warn('Could not load player bundle, falling back to CSV files', error);
+                return false;
+            }
+        })();
+    }
+    return bundlePromise;
+}
+
 async function loadPlayerNames(position) {
+    if (await loadFrontendBundle()) {
+        if (position === 'FLEX') {
+            return [...new Set(['rb', 'wr', 'te'].flatMap(pos => playerDataCache[pos].map(p => p.name)))];
+        }
+        if (position === 'Bench' && bundlePlayerNames.Bench) {
+            return bundlePlayerNames.Bench;
+        }
+        const players = playerDataCache[position.toLowerCase()];
+        if (players) return players.map(p => p.name);
+    }
+
     const fileMap = {
         QB: 'qb_projections.csv',
         RB: 'rb_projections.csv',
@@ -331,6 +453,31 @@ function getProjectedPoints(player, scoringType) {
     return 0;
 }
 
+// --- Pick Survival ---
+function normalCdf(x) {
+    // Abramowitz-Stegun 7.1.26; error below 1.5e-7.
+    const t = 1 / (1 + 0.3275911 * Math.abs(x) / Math.SQRT2);
+    const poly = t * (0.254829592 + t * (-0.284496736 + t * (1.421413741 + t * (-1.453152027 + t * 1.061405429))));
+    const erf = 1 - poly * Math.exp(-x * x / 2);
+    return x >= 0 ? (1 + erf) / 2 : (1 - erf) / 2;
+}
+
+// Probability the player is still on the board at pickNo, from the
+// historical ADP and spread in the bundle (scripts/pick_survival.py).
+function survivalProbability(player, pickNo, scoringType) {
+    const stats = (pickSurvival[SCORING_KEYS[scoringType]] || {})[player.player_id];
+    if (!stats) return 1;
+    const [adp, sd, drafted] = stats;
+    return 1 - drafted * normalCdf((pickNo - 0.5 - adp) / sd);
+}
+
+// The same team's following pick in a snake draft.
+function nextPickNo(pickNo, numTeams) {
+    const roundIndex = Math.floor((pickNo - 1) / numTeams);
+    const pos = (pickNo - 1) % numTeams;
+    return roundIndex % 2 === 0 ? pickNo + 2 * (numTeams - pos) - 1 : pickNo + 2 * pos + 1;
+}
+
 // --- VOR Calculation ---
 function getBaseValue(position, availablePlayers, numRequired, scoringType) {
     const idx = numRequired;
@@ -357,6 +504,9 @@ async function loadPlayersForPosition(position) {
         k: 'k_projections.csv',
         dst: 'dst_projections.csv'
     };
+    if (await loadFrontendBundle() && position === 'flex') {
+        return [...playerDataCache.rb, ...playerDataCache.wr, ...playerDataCache.te];
+    }
     if (playerDataCache[position]) return playerDataCache[position];
 
     let files = [];
@@ -392,22 +542,35 @@ function filterAndSortPlayers(arr, scoringType) {
         .sort((a, b) => getProjectedPoints(b, scoringType) - getProjectedPoints(a, scoringType));
 }
 
+function getAvailableAtPosition(position, scoringType) {
+    // Bundle orderings are already sorted, so only drafted players need removing.
+    const presorted = presortedPlayers[position] && presortedPlayers[position][SCORING_KEYS[scoringType]];
+    if (presorted) {
+        return presorted.filter(p => !unavailablePlayers.has(p.name));
+    }
+    if (position === 'flex') {
+        return (playerDataCache.rb && playerDataCache.wr && playerDataCache.te)
+            ? filterAndSortPlayers([...playerDataCache.rb, ...playerDataCache.wr, ...playerDataCache.te], scoringType)
+            : [];
+    }
+    return playerDataCache[position] ? filterAndSortPlayers(playerDataCache[position], scoringType) : [];
+}
+
 function getAvailablePlayersSync() {
     const scoringType = getScoringType();
     return {
-        qb: playerDataCache.qb ? filterAndSortPlayers(playerDataCache.qb, scoringType) : [],
-        rb: playerDataCache.rb ? filterAndSortPlayers(playerDataCache.rb, scoringType) : [],
-        wr: playerDataCache.wr ? filterAndSortPlayers(playerDataCache.wr, scoringType) : [],
-        te: playerDataCache.te ? filterAndSortPlayers(playerDataCache.te, scoringType) : [],
-        k: playerDataCache.k ? filterAndSortPlayers(playerDataCache.k, scoringType) : [],
-        dst: playerDataCache.dst ? filterAndSortPlayers(playerDataCache.dst, scoringType) : [],
-        flex: (playerDataCache.rb && playerDataCache.wr && playerDataCache.te)
-            ? filterAndSortPlayers([...playerDataCache.rb, ...playerDataCache.wr, ...playerDataCache.te], scoringType)
-            : []
+        qb: getAvailableAtPosition('qb', scoringType),
+        rb: getAvailableAtPosition('rb', scoringType),
+        wr: getAvailableAtPosition('wr', scoringType),
+        te: getAvailableAtPosition('te', scoringType),
+        k: getAvailableAtPosition('k', scoringType),
+        dst: getAvailableAtPosition('dst', scoringType),
+        flex: getAvailableAtPosition('flex', scoringType)
     };
 }
 
 async function getAvailablePlayersAsync() {
+    await loadFrontendBundle();
     await Promise.all([
         loadPlayersForPosition('qb'),
         loadPlayersForPosition('rb'),
@@ -470,10 +633,11 @@ const vor_cols = [
     'qb_vor', 'rb_vor', 'wr_vor', 'te_vor', 'k_vor', 'flex_vor'
 ];
 
-// Updated with actual min/max/mean/std from training data
-const minMax = {
-    pick_no: {min: 1, max: 150},
-    round: {min: 1, max: 15},
+// Fallback min/max/mean/std; replaced at startup by normalization_stats.json,
+// which is written by scripts/calculate_stats.py from the training rows.
+let minMax = {
+    pick_no: {min: 1, max: 130},
+    round: {min: 1, max: 13},
     qb_need: {min: 0, max: 1},
     rb_need: {min: 0, max: 2},
     wr_need: {min: 0, max: 2},
@@ -484,21 +648,35 @@ const minMax = {
     other_wr_need: {min: 0, max: 18},
     other_te_need: {min: 0, max: 9},
     other_flex_need: {min: 0, max: 18},
-    qb_available: {min: 4, max: 22},
-    rb_available: {min: 12, max: 48},
+    qb_available: {min: 3, max: 22},
+    rb_available: {min: 10, max: 48},
     wr_available: {min: 23, max: 71},
-    te_available: {min: 17, max: 32},
+    te_available: {min: 16, max: 32},
     flex_available: {min: 52, max: 151}
 };
-const vorStats = {
-    qb_vor: {mean: 35.0, std: 25.0},
-    rb_vor: {mean: 90.0, std: 45.0},
-    wr_vor: {mean: 80.0, std: 35.0},
-    te_vor: {mean: 45.0, std: 25.0},
-    k_vor: {mean: 17.0, std: 5.0},
-    flex_vor: {mean: 95.0, std: 45.0}
+let vorStats = {
+    qb_vor: {mean: 31.8, std: 28.2},
+    rb_vor: {mean: 92.9, std: 38.4},
+    wr_vor: {mean: 75.7, std: 28.1},
+    te_vor: {mean: 56.7, std: 29.7},
+    k_vor: {mean: 17.0, std: 0.0},
+    flex_vor: {mean: 93.2, std: 38.5}
 };
 
+async function loadNormalizationStats() {
+    if (await loadFrontendBundle() && normalizationStatsLoaded) return;
+    try {
+        const response = await fetchDataFile('normalization_stats.json');
+        if (!response) return;
+        const stats = await response.json();
+        minMax = stats.minmax;
+        vorStats = stats.standard;
+        console.log(`Loaded normalization stats ${stats.fingerprint}`);
+    } catch (error) {
+        console.warn('Using built-in normalization stats', error);
+    }
+}
+
 function minMaxScale(val, min, max) {
     if (max === min) return 0;
     return (val - min) / (max - min);
@@ -509,12 +687,24 @@ function standardScale(val, mean, std) {
 }
 
 // --- Model Prediction Helper ---
-// Replace this with your actual model API call or JS inference
+// Local inference server (scripts/inference_server.py). Falls back to the VOR
+// heuristic below when it is not running, e.g. on GitHub Pages.
+const PREDICT_URL = 'http://127.0.0.1:8000/predict';
+
 async function predictBestPosition(featureVector) {
-    // Example: POST to /predict endpoint
-    // const res = await fetch('/predict', {method: 'POST', body: JSON.stringify({features: featureVector})});
-    // const {best_position} = await res.json();
-    // return best_position;
+    try {
+        const res = await fetch(PREDICT_URL, {
+            method: 'POST',
+            headers: {'Content-Type': 'application/json'},
+            body: JSON.stringify({features: featureVector.slice(0, bounded_cols.length)})
+        });
+        if (res.ok) {
+            const {best_position} = await res.json();
+            return best_position;
+        }
+    } catch (error) {
+        console.warn('Prediction server unavailable, using VOR heuristic', error);
+    }
 
     // Dummy logic for demo: pick the position with highest VOR
     const posOrder = ['QB', 'RB', 'WR', 'TE', 'K', 'FLEX'];
@@ -788,6 +978,14 @@ function createRecommendationBox(numTeams, teamSelectRef) {
             const recDiv = recBox.querySelector('#assist-recommendation');
             if (recommendedPlayer) {
                 const projectedPoints = getProjectedPoints(recommendedPlayer, scoringType).toFixed(1);
+                // How likely the player lasts until this team picks again.
+                const nextPick = nextPickNo(pick_no, settings.numTeams);
+                const totalPicks = parseInt(pickInput.max, 10);
+                const survivalHtml = nextPick <= totalPicks ? `
+                            <div class="survival-projection">
+                                <span class="label">Still Available at Pick ${nextPick}:</span>
+                                <span class="value">${Math.round(survivalProbability(recommendedPlayer, nextPick, scoringType) * 100)}%</span>
+                            </div>` : '';
                 recDiv.innerHTML = `
                     <div class="recommendation-result success">
                         <div class="result-header">
@@ -807,7 +1005,7 @@ function createRecommendationBox(numTeams, teamSelectRef) {
                             <div class="points-projection">
                                 <span class="label">Projected Points:</span>
                                 <span class="value points">${projectedPoints}</span>
-                            </div>
+                            </div>${survivalHtml}
                         </div>
                     </div>
                 `;
@@ -1525,8 +1723,8 @@ async function startDraftAssistant() {
         submitBtn.innerHTML = '<i class="fas fa-spinner fa-spin"></i><span>Setting up draft...</span>';
         submitBtn.disabled = true;
 
-        // Load player data if not already loaded
-        await getAvailablePlayersAsync();
+        // Load player data and scaling stats if not already loaded
+        await Promise.all([getAvailablePlayersAsync(), loadNormalizationStats()]);
 
         // Show player rankings section
         const playerRankingsSection = document.getElementById('player-rankings');
@@ -1,5 +1,9 @@
-import pandas as pd
+import argparse
+import io
 import os
+import sys
+
+import pandas as pd
 
 # Define bye weeks for each team
 bye_weeks = {
@@ -28,42 +32,69 @@ files = [
     'dst_projections.csv'
 ]
 
-# Process each file
-data_dir = '/Users/arkadykokush/WebstormProjects/FantasyFootball/data/2025/'
-for filename in files:
-    filepath = os.path.join(data_dir, filename)
+DATA_DIR = '../data/2025/'
+
+
+def add_byes(filepath):
+    # Returns True if the file was rewritten; files whose BYE column is
+    # already current are left untouched so their hashes and mtimes hold.
+    original = pd.read_csv(filepath)
+    df = original.copy()
+
+    # Check if team column exists
+    if 'team' not in df.columns:
+        print(f"  No team column in {os.path.basename(filepath)}, skipping")
+        return False
+
+    if 'BYE' in df.columns:
+        df.drop('BYE', axis=1, inplace=True)
+
+    # Add BYE column, with 'N/A' for teams without a bye week
+    bye = df['team'].map(bye_weeks)
+    if bye.isna().any():
+        bye = bye.astype('Int64').astype(object).where(bye.notna(), 'N/A')
+    df['BYE'] = bye
+
+    text = df.to_csv(index=False)
+    if pd.read_csv(io.StringIO(text)).equals(original):
+        return False
+    with open(filepath, 'w') as f:
+        f.write(text)
+    return True
 
-    try:
-        # Check if file exists
-        if not os.path.exists(filepath):
-            print(f"File not found: {filename}")
-            continue
 
-        # Read the CSV file
-        print(f"Processing {filename}...")
-        df = pd.read_csv(filepath)
+def main():
+    parser = argparse.ArgumentParser(description='Add bye weeks to the projection CSVs.')
+    parser.add_argument('files', nargs='*', default=files)
+    parser.add_argument('--data-dir', default=DATA_DIR)
+    args = parser.parse_args()
 
-        # Check if team column exists
-        if 'team' not in df.columns:
-            print(f"  No team column in {filename}, skipping")
-            continue
+    failed = []
+    for filename in args.files:
+        filepath = os.path.join(args.data_dir, filename)
 
-        # Check if BYE column already exists
-        if 'BYE' in df.columns:
-            print(f"  BYE column already exists in {filename}, updating values")
-            df.drop('BYE', axis=1, inplace=True)
+        try:
+            # Check if file exists
+            if not os.path.exists(filepath):
+                print(f"File not found: {filename}")
+                failed.append(filename)
+                continue
 
-        # Add BYE column
-        df['BYE'] = df['team'].map(bye_weeks)
+            print(f"Processing {filename}...")
+            if add_byes(filepath):
+                print(f"  Added BYE column to {filename}")
+            else:
+                print(f"  BYE column already up to date in {filename}")
 
-        # Fill NaN values with 'N/A'
-        df['BYE'].fillna('N/A', inplace=True)
+        except Exception as e:
+            print(f"Error processing {filename}: {str(e)}")
+            failed.append(filename)
 
-        # Save the updated file
-        df.to_csv(filepath, index=False)
-        print(f"  Added BYE column to {filename}")
+    if failed:
+        # Non-zero exit so the pipeline doesn't record the stage as done.
+        sys.exit(f"Failed to process {len(failed)} of {len(args.files)} files: {', '.join(failed)}")
+    print("\nAll files processed successfully!")
 
-    except Exception as e:
-        print(f"Error processing {filename}: {str(e)}")
 
-print("\nAll files processed successfully!")
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,238 @@
+import argparse
+import json
+import os
+import time
+
+import numpy as np
+import pandas as pd
+
+from add_byes import bye_weeks
+from batch_replay import cached_draft_paths
+from cleaning_past_data import DATA_DIR, read_inputs, season_paths
+from draft_simulator import DEFAULT_SETTINGS, SLOT_SETTINGS, STRATEGIES, DraftSimulator, lineup_totals
+from draft_state import POSITIONS, SCORING_MAP
+from live_draft_tracker import load_player_names
+from player_index import normalize_name, normalize_position, normalize_team
+from sleeper_client import CACHE_DIR
+
+SEASON_WEEKS = 18
+SEASON_GAMES = 17
+# The 2022/2023 exports drop the (Recieving) suffix; the first REC column is
+# receptions in both layouts.
+RECEPTION_COLUMNS = ['REC(Recieving)', 'REC']
+
+
+def player_key(name, position, team=None):
+    position = normalize_position(position)
+    # Defenses are matched by team, since every source names them differently.
+    if position == 'DEF':
+        return f'DEF|{normalize_team(team)}'
+    return f'{position}|{normalize_name(name)}'
+
+
+class SeasonActuals:
+    # Actual season points per player under each scoring type, plus the bye
+    # week add_byes.py assigns the player's team. The last row is an empty
+    # sentinel that unmatched roster spots point at.
+    def __init__(self, season, data_dir=DATA_DIR, byes=None):
+        byes = bye_weeks if byes is None else byes
+        frames = []
+        for i, pos in enumerate(POSITIONS):
+            if not os.path.exists(season_paths(season, pos, data_dir)['actual']):
+                continue
+            actual, _, _ = read_inputs(season, pos, data_dir)
+            actual = actual.dropna(subset=['Player'])
+            rec_col = next((col for col in RECEPTION_COLUMNS if col in actual.columns), None)
+            frames.append(pd.DataFrame({
+                'key': [player_key(name, pos, team) for name, team in zip(actual['Player'], actual['Team'])],
+                'pos': i,
+                'fpts': pd.to_numeric(actual['FPTS'], errors='coerce').fillna(0.0).to_numpy(),
+                'receptions': pd.to_numeric(actual[rec_col], errors='coerce').fillna(0.0).to_numpy()
+                if rec_col else 0.0,
+                'bye': [byes.get(team, byes.get(normalize_team(team), 0)) for team in actual['Team']]
+            }))
+        if not frames:
+            raise ValueError(f"No actual stats for {season} in {data_dir}")
+        # Exports rank by points, so a duplicated name keeps the better player.
+        players = pd.concat(frames, ignore_index=True).drop_duplicates('key')
+
+        self.season = season
+        self.keys = players['key'].tolist()
+        self.rows = {key: i for i, key in enumerate(self.keys)}
+        self.missing = len(self.keys)
+        self.pos = np.append(players['pos'].to_numpy(), -1)
+        self.bye = np.append(players['bye'].to_numpy(dtype=int), 0)
+        # FantasyPros season exports are standard scoring.
+        fpts = players['fpts'].to_numpy(dtype=float)
+        receptions = players['receptions'].to_numpy(dtype=float)
+        self.points = {scoring: np.append(fpts + ppr * receptions, 0.0) for scoring, ppr in SCORING_MAP.items()}
+
+    def rows_for(self, keys):
+        return np.array([self.rows.get(key, self.missing) for key in keys], dtype=int)
+
+    def score(self, rosters, scoring_type='ppr', slots=None, flex_slots=None, superflex_slots=0):
+        # Season total of the best weekly lineup, for any array of rosters
+        # (rows along the last axis). A player is worth points/17 in every
+        # week except the team's bye, so byes only change the lineup in the
+        # handful of bye weeks; every other week scores the same and is
+        # computed once.
+        slots = np.array([DEFAULT_SETTINGS[key] for key in SLOT_SETTINGS]) if slots is None else slots
+        flex_slots = DEFAULT_SETTINGS['slots_flex'] if flex_slots is None else flex_slots
+        weekly = self.points[scoring_type][rosters] / SEASON_GAMES
+        pos = self.pos[rosters]
+        bye = self.bye[rosters]
+        weeks = np.unique(self.bye[self.bye > 0])
+        total = lineup_totals(weekly, pos, slots, flex_slots, superflex_slots) * (SEASON_WEEKS - len(weeks))
+        for week in weeks:
+            total += lineup_totals(weekly, np.where(bye == week, -1, pos), slots, flex_slots, superflex_slots)
+        return total
+
+    def match_rate(self, rosters):
+        return float((rosters != self.missing).mean()) if rosters.size else 0.0
+
+
+def draft_settings(draft):
+    settings = draft['settings']
+    return (np.array([settings.get(key, 0) for key in SLOT_SETTINGS]), settings.get('slots_flex', 0),
+            settings.get('slots_super_flex', 0))
+
+
+def draft_rosters(paths, actuals, scoring_type=None):
+    # Cached Sleeper drafts grouped by scoring and lineup settings, one
+    # (teams x rounds) block of actuals rows per draft.
+    groups = {}
+    for path in paths:
+        with open(path) as f:
+            raw = json.load(f)
+        draft, picks = raw['draft'], raw['picks']
+        if not picks:
+            continue
+        slots, flex_slots, superflex_slots = draft_settings(draft)
+        scoring = scoring_type or draft.get('metadata', {}).get('scoring_type')
+        if scoring not in SCORING_MAP:
+            continue
+        teams, rounds = draft['settings']['teams'], draft['settings']['rounds']
+        rosters = np.full((teams, rounds), actuals.missing, dtype=int)
+        keys = [player_key(f"{(p.get('metadata') or {}).get('first_name', '')} "
+                           f"{(p.get('metadata') or {}).get('last_name', '')}",
+                           (p.get('metadata') or {}).get('position'), p['player_id']) for p in picks]
+        for p, row in zip(picks, actuals.rows_for(keys)):
+            rosters[p['draft_slot'] - 1, p['round'] - 1] = row
+        group = groups.setdefault((scoring, tuple(slots), flex_slots, superflex_slots, rounds),
+                                  {'rosters': [], 'labels': []})
+        group['rosters'].extend(rosters)
+        group['labels'].extend((draft['draft_id'], slot + 1) for slot in range(teams))
+    return [{'scoring': scoring, 'slots': np.array(slots), 'flex_slots': flex_slots,
+             'superflex_slots': superflex_slots, 'rosters': np.array(group['rosters']), 'labels': group['labels']}
+            for (scoring, slots, flex_slots, superflex_slots, _), group in groups.items()]
+
+
+def pool_rows(simulator, actuals, data_dir):
+    # Simulator pool index -> actuals row, so simulated rosters map with
+    # one fancy index.
+    pool = simulator.pool
+    names = load_player_names(data_dir)
+    keys = [player_key(names.get(str(pid), ''), POSITIONS[pos], str(pid))
+            for pid, pos in zip(pool.player_ids, pool.pos)]
+    return actuals.rows_for(keys)
+
+
+def backtest_drafts(actuals, cache_dir=CACHE_DIR, scoring_type=None):
+    rows = []
+    for group in draft_rosters(cached_draft_paths(cache_dir), actuals, scoring_type):
+        points = actuals.score(group['rosters'], group['scoring'], group['slots'], group['flex_slots'],
+                               group['superflex_slots'])
+        matched = (group['rosters'] != actuals.missing).mean(axis=1)
+        for (draft_id, slot), total, share in zip(group['labels'], points, matched):
+            rows.append({'draft_id': draft_id, 'draft_slot': slot, 'scoring_type': group['scoring'],
+                         'points': total, 'matched': share})
+    df = pd.DataFrame(rows, columns=['draft_id', 'draft_slot', 'scoring_type', 'points', 'matched'])
+    if len(df):
+        df['rank'] = df.groupby('draft_id')['points'].rank(ascending=False, method='min').astype(int)
+    return df
+
+
+def backtest_strategies(actuals, simulator, strategies, n_sims, opponents='adp', seed=0,
+                        data_dir='../data/2025'):
+    # Every strategy drafts from the same seeded boards (as in
+    # draft_simulator.compare_strategies); whole leagues are then rescored
+    # with actual points so ranks are against real outcomes.
+    rows_map = pool_rows(simulator, actuals, data_dir)
+    slots, flex_slots, superflex_slots = simulator.slots, simulator.flex_slots, simulator.superflex_slots
+    results = {}
+    for strategy in strategies:
+        result = simulator.run(n_sims, strategy, opponents, seed)
+        rosters = rows_map[result['rosters']]
+        league = actuals.score(rosters, simulator.scoring_type, slots, flex_slots, superflex_slots)
+        sims = np.arange(n_sims)
+        mine = league[sims, result['my_slots']]
+        results[strategy] = {
+            'points': mine,
+            'rank': (league > mine[:, None]).sum(axis=1) + 1,
+            'projected': result['points'],
+            'matched': actuals.match_rate(rosters[sims, result['my_slots']])
+        }
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Score drafted rosters with actual season points.')
+    parser.add_argument('source', choices=['drafts', 'simulate'],
+                        help='Cached Sleeper drafts, or fresh simulator drafts per strategy')
+    parser.add_argument('--season', type=int, default=2024, help='Season whose actual points are used')
+    parser.add_argument('--data-dir', default=DATA_DIR)
+    parser.add_argument('--scoring', choices=list(SCORING_MAP), default=None,
+                        help="Default: each draft's own scoring type (ppr for simulations)")
+    parser.add_argument('--cache-dir', default=CACHE_DIR)
+    parser.add_argument('--sims', type=int, default=2000)
+    parser.add_argument('--strategies', nargs='+', choices=STRATEGIES, default=['adp', 'bpa', 'vor'])
+    parser.add_argument('--opponents', choices=STRATEGIES, default='adp')
+    parser.add_argument('--teams', type=int, default=DEFAULT_SETTINGS['teams'])
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--output', help='Write per-roster scores to this CSV')
+    args = parser.parse_args()
+
+    t0 = time.perf_counter()
+    actuals = SeasonActuals(args.season, args.data_dir)
+
+    if args.source == 'drafts':
+        df = backtest_drafts(actuals, args.cache_dir, args.scoring)
+        if df.empty:
+            print(f"No cached drafts in {args.cache_dir}")
+            return
+        seconds = time.perf_counter() - t0
+        print(f"{len(df)} rosters from {df['draft_id'].nunique()} drafts scored with {args.season} actuals "
+              f"in {seconds:.2f}s ({df['matched'].mean() * 100:.0f}% of picks matched)")
+        summary = df.groupby('draft_slot')['points'].agg(['mean', 'std', 'count'])
+        print(f"{'slot':>4} {'points':>8} {'sd':>6} {'rosters':>8}")
+        for slot, row in summary.iterrows():
+            print(f"{slot:>4} {row['mean']:>8.1f} {row['std']:>6.1f} {int(row['count']):>8}")
+        if args.output:
+            df.to_csv(args.output, index=False)
+        return
+
+    model = minmax = None
+    if 'model' in args.strategies or args.opponents == 'model':
+        from normalization_stats import training_minmax
+        from numpy_model import NumpyDraftModel
+        model = NumpyDraftModel()
+        minmax = training_minmax()
+    simulator = DraftSimulator({'teams': args.teams}, args.scoring or 'ppr', model=model, minmax=minmax)
+    results = backtest_strategies(actuals, simulator, args.strategies, args.sims, args.opponents, args.seed)
+    print(f"{args.sims} drafts per strategy scored with {args.season} actuals in {time.perf_counter() - t0:.2f}s, "
+          f"{simulator.scoring_type}, opponents: {args.opponents}")
+    print(f"{'strategy':<8} {'projected':>9} {'actual':>8} {'+/-':>6} {'rank':>5} {'win %':>6} {'matched':>8}")
+    rows = []
+    for strategy, result in results.items():
+        points = result['points']
+        print(f"{strategy:<8} {result['projected'].mean():>9.1f} {points.mean():>8.1f} "
+              f"{1.96 * points.std(ddof=1) / np.sqrt(len(points)):>6.1f} {result['rank'].mean():>5.2f} "
+              f"{(result['rank'] == 1).mean() * 100:>6.1f} {result['matched'] * 100:>7.0f}%")
+        rows.append(pd.DataFrame({'strategy': strategy, 'sim': np.arange(len(points)), 'points': points,
+                                  'rank': result['rank'], 'projected': result['projected']}))
+    if args.output:
+        pd.concat(rows, ignore_index=True).to_csv(args.output, index=False)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+import argparse
+import glob
+import json
+import os
+import shutil
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from draft_state import DATA_DIR, FEATURE_COLUMNS, replay_columns
+from feature_store import CSV_PATH, STORE_DIR, open_store
+from instrumentation import stage
+from sleeper_client import CACHE_DIR, picks_to_df
+
+COLUMNS = FEATURE_COLUMNS + ['draft_id']
+
+
+def cached_draft_paths(cache_dir=CACHE_DIR):
+    # Sorted by draft id so shard contents (and the merged output) never
+    # depend on directory listing order.
+    paths = glob.glob(os.path.join(cache_dir, 'drafts', '*.json'))
+    return sorted(paths, key=lambda p: int(os.path.splitext(os.path.basename(p))[0]))
+
+
+def shard(items, n_shards):
+    n_shards = max(1, min(n_shards, len(items)))
+    bounds = np.linspace(0, len(items), n_shards + 1).astype(int)
+    return [items[bounds[i]:bounds[i + 1]] for i in range(n_shards)]
+
+
+def replay_shard(shard_no, paths, out_dir, data_dir=DATA_DIR):
+    parts = {col: [] for col in COLUMNS}
+    for path in paths:
+        with open(path) as f:
+            raw = json.load(f)
+        columns = replay_columns(raw['draft'], picks_to_df(raw['picks']), data_dir)
+        n_picks = len(columns['pick_no'])
+        for col in FEATURE_COLUMNS:
+            parts[col].append(columns[col])
+        parts['draft_id'].append(np.full(n_picks, int(raw['draft']['draft_id']), dtype=np.int64))
+
+    arrays = {}
+    for col, chunks in parts.items():
+        if col == 'position_drafted':
+            # Fixed-width unicode keeps the shard loadable without pickle.
+            arrays[col] = np.concatenate(chunks).astype(str) if chunks else np.array([], dtype=str)
+        elif col == 'scoring_type':
+            arrays[col] = np.concatenate(chunks).astype(float) if chunks else np.array([], dtype=float)
+        else:
+            arrays[col] = np.concatenate(chunks) if chunks else np.array([], dtype=np.int64)
+
+    out_path = os.path.join(out_dir, f'shard_{shard_no:05d}.npz')
+    np.savez(out_path, **arrays)
+    return out_path
+
+
+def merge_shards(shard_paths):
+    parts = {col: [] for col in COLUMNS}
+    for path in shard_paths:
+        with np.load(path) as shard_data:
+            for col in COLUMNS:
+                parts[col].append(shard_data[col])
+    df = pd.DataFrame({col: np.concatenate(chunks) for col, chunks in parts.items()}, columns=COLUMNS)
+    df['position_drafted'] = df['position_drafted'].astype(object).replace('None', None)
+    return df
+
+
+def replay_drafts(paths, workers=None, shards_per_worker=4, data_dir=DATA_DIR, shard_dir=None):
+    workers = workers or os.cpu_count()
+    out_dir = shard_dir or tempfile.mkdtemp(prefix='draft_shards_')
+    try:
+        shards = shard(paths, workers * shards_per_worker)
+        # Workers keep no report of their own, so the parent times the pool
+        # as a whole; per-pick profiles come from single-process replays.
+        with stage('replay_drafts') as s, ProcessPoolExecutor(max_workers=workers) as executor:
+            # map() yields in submission order, so the merge is deterministic
+            # regardless of which worker finishes first.
+            shard_paths = list(executor.map(
+                replay_shard,
+                range(len(shards)), shards, [out_dir] * len(shards), [data_dir] * len(shards)
+            ))
+            s.add(items=len(paths))
+        with stage('merge') as s:
+            df = merge_shards(shard_paths)
+            s.add(items=len(df))
+        return df
+    finally:
+        if shard_dir is None:
+            shutil.rmtree(out_dir, ignore_errors=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Replay cached Sleeper drafts into training features.')
+    parser.add_argument('--cache-dir', default=CACHE_DIR)
+    parser.add_argument('--workers', type=int, default=None)
+    parser.add_argument('--store', default=STORE_DIR)
+    parser.add_argument('--output', default=CSV_PATH)
+    parser.add_argument('--rebuild', action='store_true',
+                        help='Replay every cached draft and overwrite stored rows, e.g. after a feature change')
+    args = parser.parse_args()
+
+    store = open_store(args.store, args.output)
+    known = set() if args.rebuild else store.draft_ids
+    paths = [p for p in cached_draft_paths(args.cache_dir)
+             if int(os.path.splitext(os.path.basename(p))[0]) not in known]
+    if not paths:
+        print("No new cached drafts to replay.")
+        return
+    df = replay_drafts(paths, args.workers)
+    store.append(df, overwrite=args.rebuild)
+    store.export_csv(args.output)
+    print(f"Replayed {len(paths)} drafts ({len(df)} picks) into {args.store} and {args.output}")
+
+
+if __name__ == "__main__":
+    main()
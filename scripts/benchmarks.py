@@ -0,0 +1,240 @@
+import argparse
+import gc
+import glob
+import json
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+
+from batch_replay import cached_draft_paths, replay_drafts
+from draft_model import MODEL_FEATURES
+from draft_state import POSITIONS, load_projections, replay_columns
+from normalization_stats import compute_stats
+from numpy_model import NumpyDraftModel
+from player_index import FANTASY_POSITIONS, PlayerIndex
+from player_universe import frame_from_payload
+from sleeper_client import picks_to_df
+from synthetic_corpus import BASE_DRAFTS, CORPUS_DIR, write_corpus
+
+# The committed baseline was recorded on a 1-CPU machine, so throughput
+# comparisons only hold on similar hardware; re-record it per machine with
+# --save-baseline before using compare as a gate.
+BASELINE_PATH = 'benchmark_baseline.json'
+# Differences below these are timer and allocator noise, whatever the ratio.
+MIN_SECONDS = 0.005
+MIN_MB = 1.0
+# Rows the real all_draft_data.csv holds at 1x.
+BASE_ROWS = 4500
+MAX_SAMPLE_DRAFTS = 500
+SINGLE_PREDICTIONS = 2000
+
+
+def features_csv(corpus, workers=None):
+    # The corpus rebuilt once into the all_draft_data.csv layout, as input
+    # for the stats benchmark.
+    path = os.path.join(os.path.dirname(corpus['data_dir']), 'all_draft_data.csv')
+    if not os.path.exists(path):
+        df = replay_drafts(cached_draft_paths(corpus['cache_dir']), workers, data_dir=corpus['data_dir'])
+        df.drop(columns=['draft_id']).to_csv(path, index=False)
+    return path
+
+
+# Each setup returns a zero-argument callable that runs the hot path once
+# and returns the number of units it processed; setup cost is not timed.
+
+def setup_features_per_draft(corpus, workers):
+    raws = []
+    for path in cached_draft_paths(corpus['cache_dir'])[:MAX_SAMPLE_DRAFTS]:
+        with open(path) as f:
+            raw = json.load(f)
+        raws.append((raw['draft'], picks_to_df(raw['picks'])))
+    for scoring in ['std', 'half_ppr', 'ppr']:
+        load_projections(scoring, corpus['data_dir'])
+
+    def run():
+        for draft, picks in raws:
+            replay_columns(draft, picks, corpus['data_dir'])
+        return len(raws)
+    return run, 'drafts'
+
+
+def setup_corpus_rebuild(corpus, workers):
+    paths = cached_draft_paths(corpus['cache_dir'])
+
+    def run():
+        return len(replay_drafts(paths, workers, data_dir=corpus['data_dir']))
+    return run, 'rows'
+
+
+def setup_stats(corpus, workers):
+    csv_path = features_csv(corpus, workers)
+    empty_store = tempfile.mkdtemp(prefix='bench_store_')
+
+    def run():
+        return compute_stats(store_dir=empty_store, csv_path=csv_path)['rows']
+    return run, 'rows'
+
+
+def setup_player_match(corpus, workers):
+    with open(corpus['players_path']) as f:
+        universe = frame_from_payload(json.load(f))
+    players = universe[universe['position'].isin(FANTASY_POSITIONS)]
+    projections = pd.concat([pd.read_csv(os.path.join(corpus['data_dir'], f'{pos}_projections.csv'),
+                                         usecols=['name', 'team', 'position'])
+                             for pos in POSITIONS if pos != 'dst'], ignore_index=True)
+
+    def run():
+        index = PlayerIndex.build(players)
+        index.match_frame(projections)
+        return len(projections)
+    return run, 'players'
+
+
+def setup_inference_single(corpus, workers):
+    model = NumpyDraftModel()
+    rows = np.random.default_rng(0).random((SINGLE_PREDICTIONS, len(MODEL_FEATURES)), dtype=np.float32)
+
+    def run():
+        for row in rows:
+            model.predict(row)
+        return len(rows)
+    return run, 'predictions'
+
+
+def setup_inference_batch(corpus, workers):
+    model = NumpyDraftModel()
+    rows = np.random.default_rng(0).random((BASE_ROWS * corpus['scale'], len(MODEL_FEATURES)), dtype=np.float32)
+
+    def run():
+        return len(model.predict(rows))
+    return run, 'rows'
+
+
+BENCHMARKS = {
+    'features_per_draft': setup_features_per_draft,
+    'corpus_rebuild': setup_corpus_rebuild,
+    'stats': setup_stats,
+    'player_match': setup_player_match,
+    'inference_single': setup_inference_single,
+    'inference_batch': setup_inference_batch
+}
+
+
+def measure(run, repeat):
+    # Timed runs go untraced (tracemalloc slows Python-heavy code several
+    # times over); one extra traced run gives the peak allocation.
+    seconds = []
+    for _ in range(repeat):
+        gc.collect()
+        t0 = time.perf_counter()
+        units = run()
+        seconds.append(time.perf_counter() - t0)
+    gc.collect()
+    tracemalloc.start()
+    run()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    median = float(np.median(seconds))
+    return {'units': units, 'seconds': round(median, 4), 'throughput': round(units / median, 1),
+            'peak_mb': round(peak / 2 ** 20, 1)}
+
+
+def run_suite(scales, names, repeat=3, seed=0, workers=None, root=CORPUS_DIR):
+    results = {}
+    for scale in scales:
+        corpus = write_corpus(scale, seed, root)
+        results[f'{scale}x'] = {}
+        for name in names:
+            run, unit = BENCHMARKS[name](corpus, workers)
+            result = measure(run, repeat)
+            result['unit'] = unit
+            results[f'{scale}x'][name] = result
+            print(f"{scale:>5}x {name:<19} {result['throughput']:>12.1f} {unit}/s  {result['seconds']:>8.3f}s  "
+                  f"{result['peak_mb']:>8.1f} MB", flush=True)
+    return results
+
+
+def compare(results, baseline, tolerance):
+    # Lower throughput or higher peak memory than the baseline by more than
+    # the tolerance, and by more than the absolute floors, counts as a
+    # regression.
+    rows = []
+    for scale, benches in results.items():
+        for name, result in benches.items():
+            base = baseline.get(scale, {}).get(name)
+            if base is None:
+                rows.append((scale, name, None, None, 'no baseline'))
+                continue
+            speed = result['throughput'] / base['throughput'] if base['throughput'] else float('inf')
+            memory = result['peak_mb'] / base['peak_mb'] if base['peak_mb'] else 1.0
+            status = 'ok'
+            if speed < 1 - tolerance and result['seconds'] - base['seconds'] >= MIN_SECONDS:
+                status = 'SLOWER'
+            elif memory > 1 + tolerance and result['peak_mb'] - base['peak_mb'] >= MIN_MB:
+                status = 'MORE MEMORY'
+            rows.append((scale, name, speed, memory, status))
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the data and inference hot paths on synthetic corpora.')
+    parser.add_argument('--scales', nargs='+', type=int, default=[10],
+                        help=f'Multiples of the current data ({BASE_DRAFTS} drafts); 1000 needs ~1 GB of disk')
+    parser.add_argument('--benchmarks', nargs='+', default=list(BENCHMARKS))
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--workers', type=int, default=None)
+    parser.add_argument('--root', default=CORPUS_DIR)
+    parser.add_argument('--baseline', default=BASELINE_PATH)
+    parser.add_argument('--save-baseline', action='store_true', help='Store this run as the new baseline')
+    parser.add_argument('--tolerance', type=float, default=0.2)
+    parser.add_argument('--output', help='Write the results as JSON')
+    args = parser.parse_args()
+    unknown = set(args.benchmarks) - set(BENCHMARKS)
+    if unknown:
+        parser.error(f"unknown benchmarks: {', '.join(sorted(unknown))}")
+
+    results = run_suite(args.scales, args.benchmarks, args.repeat, args.seed, args.workers, args.root)
+    report = {'created': time.strftime('%Y-%m-%dT%H:%M:%S'), 'python': sys.version.split()[0],
+              'cpus': os.cpu_count(), 'results': results}
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2)
+
+    baseline = {}
+    if os.path.exists(args.baseline):
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+    if args.save_baseline:
+        merged = dict(baseline.get('results', {}))
+        for scale, benches in results.items():
+            merged[scale] = {**merged.get(scale, {}), **benches}
+        with open(args.baseline, 'w') as f:
+            json.dump({**report, 'results': merged}, f, indent=2)
+        print(f"Saved baseline to {args.baseline}")
+        return
+    if not baseline:
+        print(f"No baseline at {args.baseline}; run with --save-baseline to record one")
+        return
+
+    print(f"\nvs baseline from {baseline.get('created')} (tolerance {args.tolerance:.0%})")
+    if baseline.get('cpus') != os.cpu_count():
+        print(f"Baseline was recorded with {baseline.get('cpus')} CPUs, this machine has {os.cpu_count()}; "
+              f"re-record it with --save-baseline for a meaningful comparison")
+    rows = compare(results, baseline['results'], args.tolerance)
+    for scale, name, speed, memory, status in rows:
+        if speed is None:
+            print(f"{scale:>6} {name:<19} {status}")
+        else:
+            print(f"{scale:>6} {name:<19} {speed:>6.2f}x speed {memory:>6.2f}x memory  {status}")
+    if any(status in ('SLOWER', 'MORE MEMORY') for *_, status in rows):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,141 @@
+import argparse
+import gzip
+import json
+import os
+
+import numpy as np
+import pandas as pd
+
+from normalization_stats import load_stats
+from pick_survival import SCORING_TYPES, PickSurvival
+
+DATA_DIR = '../data'
+BUNDLE_NAME = 'bundle.json.gz'
+BUNDLE_VERSION = 1
+
+POSITIONS = ['qb', 'rb', 'wr', 'te', 'k', 'dst']
+FLEX_POSITIONS = ['rb', 'wr', 'te']
+SCORING_COLUMNS = ['std', 'half_ppr', 'ppr']
+
+
+def projected_points(df):
+    # Same fallback as getProjectedPoints in main.js: a missing half/ppr
+    # projection falls back to std, and a missing std to 0.
+    def column(name):
+        return pd.to_numeric(df[name], errors='coerce') if name in df.columns else pd.Series(np.nan, index=df.index)
+
+    std = column('std').fillna(0.0)
+    return {
+        'std': std,
+        'half_ppr': column('half_ppr').fillna(std),
+        'ppr': column('ppr').fillna(std)
+    }
+
+
+def descending_order(points):
+    # Stable, like Array.prototype.sort, so ties keep their CSV order.
+    return np.argsort(-points.to_numpy(dtype=float), kind='stable')
+
+
+def position_block(df, position):
+    points = projected_points(df)
+    bye = pd.to_numeric(df['BYE'], errors='coerce') if 'BYE' in df.columns else pd.Series(np.nan, index=df.index)
+    block = {
+        'name': df['name'].tolist(),
+        'team': df['team'].fillna('').tolist(),
+        'position': df['position'].tolist() if 'position' in df.columns else [position.upper()] * len(df),
+        'player_id': df['player_id'].astype(str).tolist(),
+        'bye': [None if np.isnan(b) else int(b) for b in bye],
+        'order': {}
+    }
+    for scoring in SCORING_COLUMNS:
+        block[scoring] = [round(float(p), 2) for p in points[scoring]]
+        block['order'][scoring] = descending_order(points[scoring]).tolist()
+    return block
+
+
+def flex_order(frames):
+    rows = [(pos, i) for pos in FLEX_POSITIONS for i in range(len(frames[pos]))]
+    order = {}
+    for scoring in SCORING_COLUMNS:
+        points = pd.concat([projected_points(frames[pos])[scoring] for pos in FLEX_POSITIONS], ignore_index=True)
+        order[scoring] = [list(rows[i]) for i in descending_order(points)]
+    return order
+
+
+def survival_block(index, player_ids):
+    # ADP, spread and drafted share per player; the page evaluates the
+    # normal part of the survival model instead of shipping full tables.
+    block = {}
+    for scoring in SCORING_TYPES:
+        table = index.tables[scoring]
+        n_drafts = max(int(table['n_drafts']), 1)
+        entries = {}
+        for pid in player_ids:
+            row = index.rows.get(pid)
+            if row is not None and table['count'][row]:
+                entries[pid] = [round(float(table['adp'][row]), 1), round(float(table['sd'][row]), 1),
+                                round(int(table['count'][row]) / n_drafts, 3)]
+        block[scoring] = entries
+    return block
+
+
+def build_bundle(season, data_dir=DATA_DIR):
+    season_dir = os.path.join(data_dir, str(season))
+    frames = {}
+    for pos in POSITIONS:
+        df = pd.read_csv(os.path.join(season_dir, f'{pos}_projections.csv'), dtype={'player_id': str})
+        frames[pos] = df[df['name'].notna()].reset_index(drop=True)
+
+    bundle = {
+        'version': BUNDLE_VERSION,
+        'season': season,
+        'positions': {pos: position_block(frames[pos], pos) for pos in POSITIONS},
+        'flex': {'order': flex_order(frames)},
+        'names': {}
+    }
+    full_path = os.path.join(season_dir, 'projections_full.csv')
+    if os.path.exists(full_path):
+        bundle['names']['Bench'] = pd.read_csv(full_path, usecols=['name'])['name'].dropna().tolist()
+    stats_path = os.path.join(season_dir, 'normalization_stats.json')
+    bundle['normalization'] = load_stats(stats_path) if os.path.exists(stats_path) else None
+    survival_path = os.path.join(season_dir, 'pick_survival.npz')
+    if os.path.exists(survival_path):
+        player_ids = [pid for block in bundle['positions'].values() for pid in block['player_id']]
+        bundle['survival'] = survival_block(PickSurvival.load(survival_path), player_ids)
+    return bundle
+
+
+def write_bundle(bundle, path):
+    payload = json.dumps(bundle, separators=(',', ':')).encode()
+    tmp_path = f'{path}.tmp'
+    # mtime=0 keeps the output byte-identical for identical inputs.
+    with open(tmp_path, 'wb') as f:
+        f.write(gzip.compress(payload, compresslevel=9, mtime=0))
+    os.replace(tmp_path, path)
+    return len(payload), os.path.getsize(path)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Build the compressed player bundle the draft page loads.')
+    parser.add_argument('--seasons', nargs='+', type=int, default=[2025])
+    parser.add_argument('--data-dir', default=DATA_DIR)
+    args = parser.parse_args()
+
+    for season in args.seasons:
+        season_dir = os.path.join(args.data_dir, str(season))
+        csvs = [os.path.join(season_dir, f'{pos}_projections.csv') for pos in POSITIONS]
+        missing = [p for p in csvs if not os.path.exists(p)]
+        if missing:
+            print(f"{season}: no per-position projections ({os.path.basename(missing[0])}), skipping")
+            continue
+        bundle = build_bundle(season, args.data_dir)
+        raw_bytes, gz_bytes = write_bundle(bundle, os.path.join(season_dir, BUNDLE_NAME))
+        csv_bytes = sum(os.path.getsize(p) for p in csvs + [os.path.join(season_dir, 'projections_full.csv')]
+                        if os.path.exists(p))
+        players = sum(len(block['name']) for block in bundle['positions'].values())
+        print(f"{season}: {players} players, {gz_bytes} bytes gzipped ({raw_bytes} raw) vs {csv_bytes} bytes of CSV")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,34 +1,50 @@
-import pandas as pd
+import argparse
+import hashlib
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
 
-qb24actual = pd.read_csv('../data/2024/qb_actual24.csv')
-rb24actual = pd.read_csv('../data/2024/rb_actual24.csv')
-wr24actual = pd.read_csv('../data/2024/wr_actual24.csv')
-te24actual = pd.read_csv('../data/2024/te_actual24.csv')
-k24actual = pd.read_csv('../data/2024/k_actual24.csv')
-dst24actual = pd.read_csv('../data/2024/dst_actual24.csv')
+import pandas as pd
 
-qb24projections = pd.read_csv('../data/2024/qb_projections24.csv')
-rb24projections = pd.read_csv('../data/2024/rb_projections24.csv')
-wr24projections = pd.read_csv('../data/2024/wr_projections24.csv')
-te24projections = pd.read_csv('../data/2024/te_projections24.csv')
-k24projections = pd.read_csv('../data/2024/k_projections24.csv')
-dst24projections = pd.read_csv('../data/2024/dst_projections24.csv')
+DATA_DIR = '../data'
+SEASONS = [2022, 2023, 2024]
+POSITIONS = ['qb', 'rb', 'wr', 'te', 'k', 'dst']
+
+# Bump when the cleaning logic changes, so cached seasons are rebuilt.
+ETL_VERSION = 1
+
+# One row per player per season; the per-position stat columns stay in the
+# {pos}{yy}full.csv files.
+SEASON_DTYPES = {
+    'season': 'int64',
+    'position': 'str',
+    'player': 'str',
+    'team': 'str',
+    'actual_rank': 'float64',
+    'games': 'float64',
+    'actual_fpts': 'float64',
+    'actual_fpts_per_game': 'float64',
+    'roster_pct': 'float64',
+    'projected_fpts': 'float64',
+    'adp': 'float64'
+}
 
-adp24 = pd.read_csv('../data/2024/adp24.csv', usecols=['Player', 'AVG'])
-adp24.rename(columns={'AVG': 'ADP'}, inplace=True)
 
 def remove_symbols(df):
     return df.replace([',', '%'], '', regex=True)
 
+
 def split_player_team(df):
     if 'Team' not in df.columns and 'Player' in df.columns and 'SAFETY' not in df.columns:
         df[['Player', 'Team']] = df['Player'].str.extract(r'^(.*) \((.*)\)$')
     return df
 
+
 def rename_columns(df, keyword):
     df.columns = [f"{keyword}{col}" if col not in ['Player', 'Team'] else col for col in df.columns]
     return df
 
+
 def merge_dataframes(df1, df2):
     if df1.empty:
         return df2
@@ -37,80 +53,183 @@ def merge_dataframes(df1, df2):
     if 'Team' in df1.columns or 'Team' not in df2.columns:
         return pd.merge(df1, df2, on=['Player'], how='outer')
     else:
-       return pd.merge(df1, df2, on=['Player', 'Team'], how='outer')
-
-dataframes = [
-    qb24actual, rb24actual, wr24actual, te24actual, k24actual, dst24actual,
-    qb24projections, rb24projections, wr24projections, te24projections, k24projections, dst24projections
-]
-
-dataframes = [remove_symbols(df) for df in dataframes]
-dataframes = [split_player_team(df) for df in dataframes]
-
-for i in range(0, len(dataframes)):
-    if i < len(dataframes)/2:
-        dataframes[i] = rename_columns(dataframes[i], 'actual_')
-    else:
-        dataframes[i] = rename_columns(dataframes[i], 'projections_')
-
-(qb24actual, rb24actual, wr24actual, te24actual, k24actual, dst24actual,
- qb24projections, rb24projections, wr24projections, te24projections, k24projections, dst24projections) = dataframes
-
-qb24full = merge_dataframes(qb24actual, qb24projections).dropna()
-rb24full = merge_dataframes(rb24actual, rb24projections).dropna()
-wr24full = merge_dataframes(wr24actual, wr24projections).dropna()
-te24full = merge_dataframes(te24actual, te24projections).dropna()
-k24full = merge_dataframes(k24actual, k24projections).dropna()
-dst24full = merge_dataframes(dst24actual, dst24projections).dropna()
-
-qb24full.drop(columns=['Team_y'], inplace=True)
-qb24full.rename(columns={'Team_x': 'Team'}, inplace=True)
-
-rb24full.drop(columns=['Team_y'], inplace=True)
-rb24full.rename(columns={'Team_x': 'Team'}, inplace=True)
-
-wr24full.drop(columns=['Team_y'], inplace=True)
-wr24full.rename(columns={'Team_x': 'Team'}, inplace=True)
-
-te24full.drop(columns=['Team_y'], inplace=True)
-te24full.rename(columns={'Team_x': 'Team'}, inplace=True)
-
-k24full.drop(columns=['Team_y'], inplace=True)
-k24full.rename(columns={'Team_x': 'Team'}, inplace=True)
-
-dst24full = dst24full[['Player', 'Team', 'actual_Rank'] + [col for col in dst24full.columns if col not in ['Player', 'Team', 'actual_Rank']]]
-qb24full = qb24full[['Player', 'Team', 'actual_Rank'] + [col for col in qb24full.columns if col not in ['Player', 'Team', 'actual_Rank']]]
-rb24full = rb24full[['Player', 'Team', 'actual_Rank'] + [col for col in rb24full.columns if col not in ['Player', 'Team', 'actual_Rank']]]
-wr24full = wr24full[['Player', 'Team', 'actual_Rank'] + [col for col in wr24full.columns if col not in ['Player', 'Team', 'actual_Rank']]]
-te24full = te24full[['Player', 'Team', 'actual_Rank'] + [col for col in te24full.columns if col not in ['Player', 'Team', 'actual_Rank']]]
-k24full = k24full[['Player', 'Team', 'actual_Rank'] + [col for col in k24full.columns if col not in ['Player', 'Team', 'actual_Rank']]]
-
-dst24full = dst24full.sort_values(by='actual_Rank')
-qb24full = qb24full.sort_values(by='actual_Rank')
-rb24full = rb24full.sort_values(by='actual_Rank')
-wr24full = wr24full.sort_values(by='actual_Rank')
-te24full = te24full.sort_values(by='actual_Rank')
-k24full = k24full.sort_values(by='actual_Rank')
-
-qb24full = pd.merge(qb24full, adp24[['Player', 'ADP']], on='Player', how='left')
-rb24full = pd.merge(rb24full, adp24[['Player', 'ADP']], on='Player', how='left')
-wr24full = pd.merge(wr24full, adp24[['Player', 'ADP']], on='Player', how='left')
-te24full = pd.merge(te24full, adp24[['Player', 'ADP']], on='Player', how='left')
-k24full = pd.merge(k24full, adp24[['Player', 'ADP']], on='Player', how='left')
-dst24full = pd.merge(dst24full, adp24[['Player', 'ADP']], on='Player', how='left')
-
-qb24full['ADP'] = qb24full['ADP'].fillna(0)
-rb24full['ADP'] = rb24full['ADP'].fillna(0)
-wr24full['ADP'] = wr24full['ADP'].fillna(0)
-te24full['ADP'] = te24full['ADP'].fillna(0)
-k24full['ADP'] = k24full['ADP'].fillna(0)
-dst24full['ADP'] = dst24full['ADP'].fillna(0)
-
-qb24full.to_csv('../data/qb24full.csv', index=False)
-rb24full.to_csv('../data/rb24full.csv', index=False)
-wr24full.to_csv('../data/wr24full.csv', index=False)
-te24full.to_csv('../data/te24full.csv', index=False)
-k24full.to_csv('../data/k24full.csv', index=False)
-dst24full.to_csv('../data/dst24full.csv', index=False)
-
-print("Done!")
\ No newline at end of file
+        return pd.merge(df1, df2, on=['Player', 'Team'], how='outer')
+
+
+def season_paths(season, position, data_dir=DATA_DIR):
+    yy = str(season)[-2:]
+    season_dir = os.path.join(data_dir, str(season))
+    return {
+        'actual': os.path.join(season_dir, f'{position}_actual{yy}.csv'),
+        'projections': os.path.join(season_dir, f'{position}_projections{yy}.csv'),
+        'adp': os.path.join(season_dir, f'adp{yy}.csv'),
+        'full': os.path.join(season_dir, f'{position}{yy}full.csv')
+    }
+
+
+def season_output_path(season, data_dir=DATA_DIR):
+    return os.path.join(data_dir, str(season), f'season{str(season)[-2:]}full.csv')
+
+
+def manifest_path(season, data_dir=DATA_DIR):
+    return os.path.join(data_dir, str(season), 'etl_manifest.json')
+
+
+def input_hash(season, position, data_dir=DATA_DIR):
+    paths = season_paths(season, position, data_dir)
+    h = hashlib.sha256(f'{ETL_VERSION}'.encode())
+    for name in ['actual', 'projections', 'adp']:
+        if os.path.exists(paths[name]):
+            h.update(name.encode())
+            with open(paths[name], 'rb') as f:
+                h.update(f.read())
+    return h.hexdigest()
+
+
+def read_inputs(season, position, data_dir=DATA_DIR):
+    paths = season_paths(season, position, data_dir)
+    actual = split_player_team(remove_symbols(pd.read_csv(paths['actual'])))
+    projections = adp = None
+    if os.path.exists(paths['projections']):
+        projections = split_player_team(remove_symbols(pd.read_csv(paths['projections'])))
+    if os.path.exists(paths['adp']):
+        adp = pd.read_csv(paths['adp'], usecols=['Player', 'AVG']).rename(columns={'AVG': 'ADP'})
+    return actual, projections, adp
+
+
+def full_position_frame(actual, projections, adp):
+    # Wide actual-vs-projection table, as the single-season script built it.
+    full = merge_dataframes(rename_columns(actual.copy(), 'actual_'),
+                            rename_columns(projections.copy(), 'projections_')).dropna()
+    if 'Team_y' in full.columns:
+        full = full.drop(columns=['Team_y']).rename(columns={'Team_x': 'Team'})
+    full = full[['Player', 'Team', 'actual_Rank'] + [col for col in full.columns
+                                                     if col not in ['Player', 'Team', 'actual_Rank']]]
+    full = full.sort_values(by='actual_Rank')
+    if adp is not None:
+        full = pd.merge(full, adp[['Player', 'ADP']], on='Player', how='left')
+        full['ADP'] = full['ADP'].fillna(0)
+    return full
+
+
+def tidy_position_frame(season, position, actual, projections, adp):
+    tidy = pd.DataFrame({
+        'player': actual['Player'],
+        'team': actual['Team'],
+        'actual_rank': pd.to_numeric(actual['Rank'], errors='coerce'),
+        'games': pd.to_numeric(actual['G'], errors='coerce'),
+        'actual_fpts': pd.to_numeric(actual['FPTS'], errors='coerce'),
+        'actual_fpts_per_game': pd.to_numeric(actual['FPTS/G'], errors='coerce'),
+        'roster_pct': pd.to_numeric(actual['ROST'], errors='coerce')
+    }).dropna(subset=['player'])
+    if projections is not None:
+        projected = pd.DataFrame({
+            'player': projections['Player'],
+            'projected_team': projections['Team'] if 'Team' in projections.columns else pd.NA,
+            'projected_fpts': pd.to_numeric(projections['FPTS'], errors='coerce')
+        }).dropna(subset=['player'])
+        tidy = pd.merge(tidy, projected, on='player', how='outer')
+        tidy['team'] = tidy['team'].fillna(tidy.pop('projected_team'))
+    if adp is not None:
+        tidy = pd.merge(tidy, adp.rename(columns={'Player': 'player', 'ADP': 'adp'}), on='player', how='left')
+    tidy['season'] = season
+    tidy['position'] = position.upper()
+    return tidy.reindex(columns=list(SEASON_DTYPES)).sort_values(['actual_rank', 'player'], na_position='last')
+
+
+def process_position(season, position, data_dir=DATA_DIR):
+    actual, projections, adp = read_inputs(season, position, data_dir)
+    if projections is not None:
+        full_position_frame(actual, projections, adp).to_csv(season_paths(season, position, data_dir)['full'],
+                                                             index=False)
+    return season, position, tidy_position_frame(season, position, actual, projections, adp)
+
+
+def load_season(season, data_dir=DATA_DIR):
+    return pd.read_csv(season_output_path(season, data_dir), dtype=SEASON_DTYPES, keep_default_na=False,
+                       na_values=[''])
+
+
+def load_manifest(season, data_dir=DATA_DIR):
+    path = manifest_path(season, data_dir)
+    if not os.path.exists(path) or not os.path.exists(season_output_path(season, data_dir)):
+        return {}
+    with open(path) as f:
+        return json.load(f)
+
+
+def check_projections(season, positions, data_dir=DATA_DIR):
+    # {pos}{yy}full.csv needs projections. Seasons with none at all are
+    # actuals-only (backtests still use them); a season missing only some
+    # is an incomplete download, and caching it would hide that.
+    have = [p for p in positions if os.path.exists(season_paths(season, p, data_dir)['projections'])]
+    missing = [p for p in positions if p not in have]
+    if have and missing:
+        raise ValueError(f"{season}: projections for {', '.join(have)} but not {', '.join(missing)}")
+    if not have:
+        print(f"{season}: no projections, writing actuals only (no per-position full files)")
+
+
+def run_etl(seasons=SEASONS, positions=POSITIONS, data_dir=DATA_DIR, workers=None, force=False):
+    manifests = {season: load_manifest(season, data_dir) for season in seasons}
+    hashes = {}
+    tasks = []
+    for season in seasons:
+        present = []
+        for position in positions:
+            if not os.path.exists(season_paths(season, position, data_dir)['actual']):
+                print(f"{season} {position}: no actuals, skipping")
+                continue
+            present.append(position)
+        check_projections(season, present, data_dir)
+        for position in present:
+            hashes[season, position] = input_hash(season, position, data_dir)
+            if force or manifests[season].get(position) != hashes[season, position]:
+                tasks.append((season, position))
+
+    results = {}
+    if tasks:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(process_position, season, position, data_dir) for season, position in tasks]
+            for future in futures:
+                season, position, frame = future.result()
+                results.setdefault(season, {})[position] = frame
+
+    for season, frames in results.items():
+        # Unchanged positions keep their rows from the previous run.
+        if manifests[season]:
+            previous = load_season(season, data_dir)
+            for position in manifests[season]:
+                if position not in frames:
+                    frames[position] = previous[previous['position'] == position.upper()]
+        order = [p for p in POSITIONS if p in frames]
+        season_frame = pd.concat([frames[p] for p in order], ignore_index=True).astype(SEASON_DTYPES)
+        season_frame.to_csv(season_output_path(season, data_dir), index=False)
+
+        manifest = {p: manifests[season].get(p) for p in order}
+        manifest.update({p: hashes[season, p] for season_, p in tasks if season_ == season})
+        with open(manifest_path(season, data_dir), 'w') as f:
+            json.dump(manifest, f, indent=2)
+        print(f"{season}: rebuilt {', '.join(p for s, p in tasks if s == season)} ({len(season_frame)} players)")
+
+    for season in seasons:
+        if season not in results:
+            print(f"{season}: up to date")
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Clean historical actuals and projections into one dataset per season.')
+    parser.add_argument('--seasons', nargs='+', type=int, default=SEASONS)
+    parser.add_argument('--positions', nargs='+', default=POSITIONS, choices=POSITIONS)
+    parser.add_argument('--data-dir', default=DATA_DIR)
+    parser.add_argument('--workers', type=int, default=None)
+    parser.add_argument('--force', action='store_true', help='Rebuild even if the inputs are unchanged')
+    args = parser.parse_args()
+
+    run_etl(args.seasons, args.positions, args.data_dir, args.workers, args.force)
+    print("Done!")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+MODEL_DIR = '../models'
+WEIGHTS_PATH = '../models/best_model.weights.h5'
+
+# Label order from the notebook's LabelEncoder.
+POSITION_CLASSES = ['QB', 'RB', 'TE', 'WR']
+
+# Model inputs, in training column order (min-max scaled).
+MODEL_FEATURES = [
+    'pick_no', 'round',
+    'qb_need', 'rb_need', 'wr_need', 'te_need', 'flex_need',
+    'other_qb_need', 'other_rb_need', 'other_wr_need', 'other_te_need', 'other_flex_need',
+    'qb_available', 'rb_available', 'wr_available', 'te_available', 'flex_available'
+]
+
+HIDDEN_UNITS = [1028, 512, 256, 128]
+
+
+def build_model(n_features=len(MODEL_FEATURES), n_classes=len(POSITION_CLASSES), hidden_units=HIDDEN_UNITS,
+                dropout=0.2):
+    from tensorflow.keras import layers, Model, Input
+
+    inputs = Input(shape=(n_features,))
+    blocks = [inputs]
+    x = inputs
+    for units in hidden_units:
+        x = layers.Dense(units)(x)
+        x = layers.LeakyReLU()(x)
+        x = layers.LayerNormalization()(x)
+        x = layers.Dropout(dropout)(x)
+        blocks.append(x)
+
+    concat = layers.Concatenate()(blocks)
+    outputs = layers.Dense(n_classes, activation='softmax')(concat)
+
+    model = Model(inputs, outputs)
+    model.compile(
+        loss="sparse_categorical_crossentropy",
+        optimizer="adam",
+        metrics=["accuracy"]
+    )
+    return model
+
+
+def read_h5_weights(path=WEIGHTS_PATH):
+    # Reads the Keras 2 HDF5 weights layout that best_model.weights.h5 was
+    # saved in, as {layer: [arrays]} in layer order, without TensorFlow.
+    import h5py
+
+    weights = {}
+    with h5py.File(path, 'r') as f:
+        for layer in f.attrs['layer_names']:
+            layer = layer.decode() if isinstance(layer, bytes) else layer
+            names = f[layer].attrs.get('weight_names', [])
+            if len(names):
+                weights[layer] = [f[layer][n.decode() if isinstance(n, bytes) else n][()] for n in names]
+    return weights
+
+
+def set_h5_weights(model, path=WEIGHTS_PATH):
+    # Layer names differ between sessions (dense_35 vs dense), so weights are
+    # matched to layers by order.
+    saved = list(read_h5_weights(path).values())
+    layers = [layer for layer in model.layers if layer.weights]
+    if len(saved) != len(layers):
+        raise ValueError(f"{path} has weights for {len(saved)} layers, model has {len(layers)}")
+    for layer, values in zip(layers, saved):
+        layer.set_weights(values)
+
+
+class KerasDraftModel:
+    def __init__(self, weights_path=WEIGHTS_PATH):
+        self.model = build_model()
+        set_h5_weights(self.model, weights_path)
+
+    def predict(self, features):
+        return self.model.predict_on_batch(features)
@@ -0,0 +1,345 @@
+import argparse
+import time
+
+import numpy as np
+
+from draft_model import MODEL_FEATURES, POSITION_CLASSES
+from draft_state import (DATA_DIR, NUMERIC_COLUMNS, POSITIONS, SCORING_MAP, league_format, load_projections,
+                         replacement_levels)
+
+QB, RB, WR, TE, K, DST = range(len(POSITIONS))
+FLEX_POSITIONS = [RB, WR, TE]
+SUPERFLEX_POSITIONS = [QB, RB, WR, TE]
+SLOT_SETTINGS = ['slots_qb', 'slots_rb', 'slots_wr', 'slots_te', 'slots_k', 'slots_def']
+# Simulator position index -> Sleeper's pick metadata label.
+POSITION_LABELS = np.array(['QB', 'RB', 'WR', 'TE', 'K', 'DEF'], dtype=object)
+
+# Model classes (QB, RB, TE, WR) -> simulator position index.
+MODEL_POSITIONS = np.array([POSITIONS.index(pos.lower()) for pos in POSITION_CLASSES])
+
+DEFAULT_SETTINGS = {
+    'teams': 12,
+    'rounds': 15,
+    'slots_qb': 1,
+    'slots_rb': 2,
+    'slots_wr': 2,
+    'slots_te': 1,
+    'slots_k': 1,
+    'slots_def': 1,
+    'slots_flex': 2,
+    'slots_super_flex': 0
+}
+
+STRATEGIES = ['adp', 'bpa', 'vor', 'model']
+
+
+def lineup_totals(points, pos, slots, flex_slots, superflex_slots=0):
+    # Best starting lineup per roster; rosters run along the last axis, with
+    # every leading axis kept. Players at pos -1 never start.
+    total = np.zeros(points.shape[:-1])
+    bench = []
+    qb_bench = None
+    for p, n_slots in enumerate(slots):
+        # Sorted descending, unfilled entries as -inf.
+        ranked = -np.sort(-np.where(pos == p, points, -np.inf), axis=-1)
+        starters = ranked[..., :n_slots]
+        total += np.where(np.isfinite(starters), starters, 0).sum(axis=-1)
+        if p in FLEX_POSITIONS:
+            bench.append(ranked[..., n_slots:])
+        elif p == QB:
+            qb_bench = ranked[..., n_slots:]
+    ranked = -np.sort(-np.concatenate(bench, axis=-1), axis=-1)
+    flex = ranked[..., :flex_slots]
+    total += np.where(np.isfinite(flex), flex, 0).sum(axis=-1)
+    if superflex_slots:
+        # Filled after flex: every flex player can play superflex too.
+        rest = np.concatenate([ranked[..., flex_slots:], qb_bench], axis=-1)
+        superflex = -np.sort(-rest, axis=-1)[..., :superflex_slots]
+        total += np.where(np.isfinite(superflex), superflex, 0).sum(axis=-1)
+    return total
+
+
+class PlayerPool:
+    # Every projected player in one flat array, grouped by position so
+    # per-position maxima are a single reduceat over the player axis.
+    def __init__(self, scoring_type, settings, data_dir=DATA_DIR):
+        tables = load_projections(scoring_type, data_dir)
+        # dst_projections.csv has a rank but no points, which DraftState
+        # also leaves NaN. Any other position without the scoring column is
+        # a broken projections file, not a player worth 0.
+        unprojected = [p for p in POSITIONS if len(tables[p]) and np.isnan(tables[p].points).all()]
+        missing = [p for p in unprojected if p != 'dst']
+        if missing:
+            raise ValueError(f"No {scoring_type} projections for {', '.join(missing)} in {data_dir}")
+        self.pos = np.concatenate([np.full(len(tables[p]), i) for i, p in enumerate(POSITIONS)])
+        self.points = np.nan_to_num(np.concatenate([tables[p].points for p in POSITIONS]))
+        self.player_ids = np.concatenate([tables[p].player_ids for p in POSITIONS])
+        self.starts = np.searchsorted(self.pos, np.arange(len(POSITIONS)))
+        self.counts = np.bincount(self.pos, minlength=len(POSITIONS))
+
+        bases = replacement_levels(scoring_type, league_format(settings), data_dir)
+        self.bases = np.array([np.nan_to_num(bases.get(p, 0.0)) for p in POSITIONS])
+
+        # ADP stand-in: projected points over each position's replacement
+        # level, so superflex leagues push quarterbacks up the board.
+        self.adp_value = self.points - self.bases[self.pos]
+        # Unprojected defenses score nothing in lineups; on the board they go
+        # in rank order instead of all tying at zero.
+        for p in unprojected:
+            rows = self.pos == POSITIONS.index(p)
+            self.adp_value[rows] = -np.arange(rows.sum())
+
+    def best_by_position(self, values):
+        return np.maximum.reduceat(values, self.starts, axis=1)
+
+
+class DraftSimulator:
+    def __init__(self, settings=None, scoring_type='ppr', data_dir=DATA_DIR, model=None, minmax=None,
+                 adp_noise=12.0):
+        self.settings = dict(DEFAULT_SETTINGS, **(settings or {}))
+        self.scoring_type = scoring_type
+        self.pool = PlayerPool(scoring_type, self.settings, data_dir)
+        self.slots = np.array([self.settings[key] for key in SLOT_SETTINGS])
+        self.flex_slots = self.settings['slots_flex']
+        self.superflex_slots = self.settings['slots_super_flex']
+        self.teams = self.settings['teams']
+        self.rounds = self.settings['rounds']
+        self.adp_noise = adp_noise
+        self.model = model
+        self.minmax = minmax
+
+    def run(self, n_sims, strategy='vor', opponents='adp', seed=0, my_slot=None, record_features=False):
+        pool = self.pool
+        S, T, R, P = n_sims, self.teams, self.rounds, len(pool.points)
+        rng = np.random.default_rng(seed)
+        sims = np.arange(S)
+
+        board = pool.adp_value + rng.normal(0, self.adp_noise, (S, P))
+        my_slots = rng.integers(0, T, S) if my_slot is None else np.full(S, my_slot - 1)
+
+        avail = np.ones((S, P), dtype=bool)
+        avail_count = np.tile(pool.counts, (S, 1))
+        needs = np.tile(self.slots, (S, T, 1))
+        flex_needs = np.full((S, T), self.flex_slots)
+        superflex_needs = np.full((S, T), self.superflex_slots)
+        roster_counts = np.zeros((S, T, len(POSITIONS)), dtype=int)
+        rosters = np.empty((S, T, R), dtype=int)
+        if record_features:
+            features = np.empty((S, T * R, len(NUMERIC_COLUMNS)))
+
+        for pick in range(T * R):
+            rnd, idx = divmod(pick, T)
+            team = idx if rnd % 2 == 0 else T - 1 - idx
+            allowed = self._allowed_positions(needs[:, team], flex_needs[:, team], superflex_needs[:, team],
+                                              roster_counts[:, team], avail_count, rnd)
+            # Superflex spots count as flex need, as in DraftState.features.
+            any_flex = flex_needs + superflex_needs
+            if record_features:
+                features[:, pick] = self._pick_features(pick, rnd, team, avail, avail_count, needs, any_flex)
+
+            choice = np.empty(S, dtype=int)
+            mine = my_slots == team
+            for kind, which in ((strategy, mine), (opponents, ~mine)):
+                if which.any():
+                    choice[which] = self._choose(kind, pick, rnd, team, allowed[which], avail[which],
+                                                 board[which], avail_count[which], needs[which], any_flex[which])
+
+            chosen_pos = pool.pos[choice]
+            avail[sims, choice] = False
+            avail_count[sims, chosen_pos] -= 1
+            roster_counts[sims, team, chosen_pos] += 1
+            rosters[:, team, rnd] = choice
+
+            # Same need bookkeeping as DraftState.pick: own slot first, then
+            # flex, then superflex.
+            has_slot = needs[sims, team, chosen_pos] > 0
+            needs[sims[has_slot], team, chosen_pos[has_slot]] -= 1
+            to_flex = ~has_slot & np.isin(chosen_pos, FLEX_POSITIONS) & (flex_needs[:, team] > 0)
+            flex_needs[to_flex, team] -= 1
+            to_superflex = (~has_slot & ~to_flex & np.isin(chosen_pos, SUPERFLEX_POSITIONS)
+                            & (superflex_needs[:, team] > 0))
+            superflex_needs[to_superflex, team] -= 1
+
+        points = self.lineup_points(rosters)
+        my_points = points[sims, my_slots]
+        rank = (points > my_points[:, None]).sum(axis=1) + 1
+        result = {'points': my_points, 'rank': rank, 'league_points': points, 'rosters': rosters,
+                  'my_slots': my_slots}
+        if record_features:
+            result['features'] = features
+            result['picks'] = self.pick_order(rosters)
+        return result
+
+    def pick_order(self, rosters):
+        # (sims, teams, rounds) rosters -> pool index of every pick in draft
+        # order, undoing the snake.
+        T, R = self.teams, self.rounds
+        rnd, idx = np.divmod(np.arange(T * R), T)
+        team = np.where(rnd % 2 == 0, idx, T - 1 - idx)
+        return rosters[:, team, rnd]
+
+    def _pick_features(self, pick, rnd, team, avail, avail_count, needs, flex_needs):
+        # The NUMERIC_COLUMNS row DraftState.features builds for the team on
+        # the clock, for every simulation at once.
+        pool = self.pool
+        n = len(needs)
+        own = needs[:, team].copy()
+        other = needs.sum(axis=1) - own
+        own_flex = flex_needs[:, team]
+        other_flex = flex_needs.sum(axis=1) - own_flex
+        # Replayed drafts label defenses 'DEF', which DraftState.pick skips,
+        # so the stored defense need and availability never move.
+        own[:, DST] = self.slots[DST]
+        other[:, DST] = (self.teams - 1) * self.slots[DST]
+        avail_count = avail_count.copy()
+        avail_count[:, DST] = pool.counts[DST]
+        best = pool.best_by_position(np.where(avail, pool.points, -np.inf))
+        vor = np.where(np.isfinite(best), best - pool.bases, np.nan)
+        return np.column_stack([
+            np.full(n, pick + 1), np.full(n, rnd + 1), np.full(n, SCORING_MAP[self.scoring_type]),
+            own, own_flex, other, other_flex,
+            avail_count, avail_count[:, FLEX_POSITIONS].sum(axis=1),
+            vor[:, [QB, RB, WR, TE, K]], np.fmax.reduce(vor[:, FLEX_POSITIONS], axis=1)
+        ])
+
+    def _allowed_positions(self, needs, flex_needs, superflex_needs, roster_counts, avail_count, rnd):
+        S = len(needs)
+        allowed = np.zeros((S, len(POSITIONS)), dtype=bool)
+        # Kicker in the second-to-last round and defense in the last, like the
+        # recommendation box on the draft page.
+        late = {self.rounds - 2: K, self.rounds - 1: DST}
+        if rnd in late:
+            allowed[:, late[rnd]] = True
+        else:
+            allowed[:, [QB, RB, WR, TE]] = True
+            allowed[:, QB] &= roster_counts[:, QB] < self.slots[QB] + self.superflex_slots + 1
+            allowed[:, TE] &= roster_counts[:, TE] < self.slots[TE] + 1
+            # Once the remaining skill picks only just cover open starting
+            # spots, restrict to positions that fill one.
+            unfilled = needs[:, [QB, RB, WR, TE]].sum(axis=1) + flex_needs + superflex_needs
+            forced = (self.rounds - 2 - rnd) <= unfilled
+            fills = needs > 0
+            fills[:, FLEX_POSITIONS] |= (flex_needs > 0)[:, None]
+            fills[:, SUPERFLEX_POSITIONS] |= (superflex_needs > 0)[:, None]
+            allowed[forced] &= fills[forced]
+        allowed &= avail_count > 0
+        # Never leave a team without a legal pick.
+        stuck = ~allowed.any(axis=1)
+        allowed[stuck] = avail_count[stuck] > 0
+        return allowed
+
+    def _choose(self, kind, pick, rnd, team, allowed, avail, board, avail_count, needs, flex_needs):
+        pool = self.pool
+        player_ok = avail & allowed[:, pool.pos]
+        if kind == 'adp':
+            return np.where(player_ok, board, -np.inf).argmax(axis=1)
+        points = np.where(player_ok, pool.points, -np.inf)
+        if kind == 'bpa':
+            return points.argmax(axis=1)
+
+        best = pool.best_by_position(points)
+        if kind == 'vor':
+            score = np.where(allowed, best - pool.bases, -np.inf)
+        elif kind == 'model':
+            probs = self.model.predict(self._model_features(pick, rnd, team, needs, flex_needs, avail_count))
+            score = np.full(allowed.shape, -np.inf)
+            score[:, MODEL_POSITIONS] = probs
+            score = np.where(allowed, score, -np.inf)
+            # K/DST rounds (or nothing the model covers is legal): take the
+            # best legal player by projection instead.
+            fallback = ~np.isfinite(score).any(axis=1)
+            score[fallback] = np.where(allowed[fallback], best[fallback], -np.inf)
+        else:
+            raise ValueError(f"Unknown strategy {kind}")
+
+        position = score.argmax(axis=1)
+        return np.where(pool.pos == position[:, None], points, -np.inf).argmax(axis=1)
+
+    def _model_features(self, pick, rnd, team, needs, flex_needs, avail_count):
+        # Same columns, in the same order, as draft_model.MODEL_FEATURES.
+        n = len(needs)
+        own = needs[:, team]
+        other = needs.sum(axis=1) - own
+        own_flex = flex_needs[:, team]
+        other_flex = flex_needs.sum(axis=1) - own_flex
+        features = np.column_stack([
+            np.full(n, pick + 1), np.full(n, rnd + 1),
+            own[:, QB], own[:, RB], own[:, WR], own[:, TE], own_flex,
+            other[:, QB], other[:, RB], other[:, WR], other[:, TE], other_flex,
+            avail_count[:, QB], avail_count[:, RB], avail_count[:, WR], avail_count[:, TE],
+            avail_count[:, FLEX_POSITIONS].sum(axis=1)
+        ]).astype(np.float32)
+        lo = np.array([self.minmax[col][0] for col in MODEL_FEATURES], dtype=np.float32)
+        hi = np.array([self.minmax[col][1] for col in MODEL_FEATURES], dtype=np.float32)
+        return (features - lo) / np.where(hi > lo, hi - lo, 1)
+
+    def lineup_points(self, rosters):
+        return lineup_totals(self.pool.points[rosters], self.pool.pos[rosters], self.slots, self.flex_slots,
+                             self.superflex_slots)
+
+
+def compare_strategies(simulator, strategies, n_sims, opponents='adp', seed=0):
+    # Every strategy sees the same seed, so ADP boards and draft slots are
+    # shared and differences are paired.
+    results = {}
+    for strategy in strategies:
+        t0 = time.perf_counter()
+        result = simulator.run(n_sims, strategy, opponents, seed)
+        result['seconds'] = time.perf_counter() - t0
+        results[strategy] = result
+    return results
+
+
+def summarize(results):
+    baseline = next(iter(results.values()))['points']
+    rows = []
+    for strategy, result in results.items():
+        points = result['points']
+        diff = points - baseline
+        n = len(points)
+        rows.append({
+            'strategy': strategy,
+            'mean_points': float(points.mean()),
+            'ci95': float(1.96 * points.std(ddof=1) / np.sqrt(n)),
+            'mean_rank': float(result['rank'].mean()),
+            'win_league_pct': float((result['rank'] == 1).mean() * 100),
+            'diff_vs_first': float(diff.mean()),
+            'diff_ci95': float(1.96 * diff.std(ddof=1) / np.sqrt(n)),
+            'drafts_per_min': n / result['seconds'] * 60
+        })
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Monte Carlo draft simulator for comparing pick strategies.')
+    parser.add_argument('--sims', type=int, default=10000)
+    parser.add_argument('--teams', type=int, default=DEFAULT_SETTINGS['teams'])
+    parser.add_argument('--rounds', type=int, default=DEFAULT_SETTINGS['rounds'])
+    parser.add_argument('--scoring', choices=['std', 'half_ppr', 'ppr'], default='ppr')
+    parser.add_argument('--strategies', nargs='+', choices=STRATEGIES, default=['adp', 'bpa', 'vor'])
+    parser.add_argument('--opponents', choices=STRATEGIES, default='adp')
+    parser.add_argument('--adp-noise', type=float, default=12.0)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    model = minmax = None
+    if 'model' in args.strategies or args.opponents == 'model':
+        from normalization_stats import training_minmax
+        from numpy_model import NumpyDraftModel
+        model = NumpyDraftModel()
+        minmax = training_minmax()
+
+    simulator = DraftSimulator({'teams': args.teams, 'rounds': args.rounds}, args.scoring,
+                               model=model, minmax=minmax, adp_noise=args.adp_noise)
+    results = compare_strategies(simulator, args.strategies, args.sims, args.opponents, args.seed)
+
+    print(f"{args.sims} drafts, {args.teams} teams, {args.scoring}, opponents: {args.opponents}")
+    print(f"{'strategy':<8} {'points':>8} {'+/-':>6} {'rank':>5} {'win %':>6} {'vs first':>9} {'+/-':>6} {'drafts/min':>11}")
+    for row in summarize(results):
+        print(f"{row['strategy']:<8} {row['mean_points']:>8.1f} {row['ci95']:>6.1f} {row['mean_rank']:>5.2f} "
+              f"{row['win_league_pct']:>6.1f} {row['diff_vs_first']:>+9.1f} {row['diff_ci95']:>6.1f} "
+              f"{row['drafts_per_min']:>11.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,322 @@
+import math
+import os
+import warnings
+
+import numpy as np
+import pandas as pd
+
+from instrumentation import stage
+
+DATA_DIR = '../data/2025'
+
+POSITIONS = ['qb', 'rb', 'wr', 'te', 'k', 'dst']
+
+# Sleeper position -> projection table. 'DEF' picks are not in this map, so
+# (as in the original DataFrame loop) they never touch availability or needs.
+PICK_TABLES = {
+    'QB': 'qb',
+    'RB': 'rb',
+    'WR': 'wr',
+    'TE': 'te',
+    'K': 'k',
+    'DST': 'dst'
+}
+
+SLOT_KEYS = {
+    'QB': 'qb_slots',
+    'RB': 'rb_slots',
+    'WR': 'wr_slots',
+    'TE': 'te_slots',
+    'K': 'k_slots',
+    'DEF': 'dst_slots'
+}
+
+SCORING_MAP = {
+    'std': 0,
+    'half_ppr': 0.5,
+    'ppr': 1
+}
+
+# Everything replacement levels depend on besides projections and scoring.
+# Sleeper calls the QB/RB/WR/TE slot 'super_flex'.
+FORMAT_SETTINGS = ['teams', 'slots_qb', 'slots_rb', 'slots_wr', 'slots_te', 'slots_k', 'slots_def', 'slots_flex',
+                   'slots_super_flex']
+VOR_POSITIONS = ['qb', 'rb', 'wr', 'te', 'k']
+FLEX_TABLES = ['rb', 'wr', 'te']
+SUPERFLEX_TABLES = ['qb', 'rb', 'wr', 'te']
+
+FEATURE_COLUMNS = [
+    'pick_no', 'round', 'scoring_type',
+    'qb_need', 'rb_need', 'wr_need', 'te_need', 'k_need', 'dst_need', 'flex_need',
+    'other_qb_need', 'other_rb_need', 'other_wr_need', 'other_te_need', 'other_k_need', 'other_dst_need',
+    'other_flex_need',
+    'qb_available', 'rb_available', 'wr_available', 'te_available', 'k_available', 'dst_available',
+    'flex_available',
+    'qb_vor', 'rb_vor', 'wr_vor', 'te_vor', 'k_vor', 'flex_vor',
+    'position_drafted'
+]
+
+
+def get_team_total_needs(draft_data):
+    teams = draft_data['settings']['teams']
+    wr_slots = draft_data['settings']['slots_wr']
+    te_slots = draft_data['settings']['slots_te']
+    rb_slots = draft_data['settings']['slots_rb']
+    qb_slots = draft_data['settings']['slots_qb']
+    k_slots = draft_data['settings']['slots_k']
+    flex_slots = draft_data['settings']['slots_flex']
+    dst_slots = draft_data['settings']['slots_def']
+    superflex_slots = draft_data['settings'].get('slots_super_flex', 0)
+    bn_slots = draft_data['settings']['rounds']-(qb_slots+rb_slots+wr_slots+te_slots+k_slots+dst_slots+flex_slots
+                                                 +superflex_slots)
+    team_needs = []
+    for i in range(teams):
+        team_needs.append({
+            'team_id': i,
+            'qb_slots': qb_slots,
+            'rb_slots': rb_slots,
+            'wr_slots': wr_slots,
+            'te_slots': te_slots,
+            'k_slots': k_slots,
+            'flex_slots': flex_slots,
+            'superflex_slots': superflex_slots,
+            'dst_slots': dst_slots,
+            'total_slots': bn_slots+qb_slots+rb_slots+wr_slots+te_slots+k_slots+dst_slots
+        })
+    total_needs = {
+        'qb_slots': qb_slots*teams,
+        'rb_slots': rb_slots*teams,
+        'wr_slots': wr_slots*teams,
+        'te_slots': te_slots*teams,
+        'k_slots': k_slots*teams,
+        'flex_slots': flex_slots*teams,
+        'superflex_slots': superflex_slots*teams,
+        'dst_slots': dst_slots*teams,
+        'total_slots': (bn_slots+qb_slots+rb_slots+wr_slots+te_slots+k_slots+dst_slots)*teams
+    }
+    return team_needs, total_needs
+
+
+class ProjectionTable:
+    # Immutable per-position projections for one scoring type, shared by every
+    # draft replayed in the process.
+    def __init__(self, player_ids, points):
+        self.player_ids = player_ids
+        self.points = points
+        # Rows by descending points with NaNs last, so the best undrafted
+        # player is always at or after the draft's cursor.
+        self.order = np.argsort(-points, kind='stable')
+        self.descending = points[self.order]
+        # Preprocessing zero-fills missing projections, so only positive
+        # points count as projected; they lead the descending order.
+        self.projected = int(np.count_nonzero(points > 0))
+        self.rows_by_id = {}
+        for row, player_id in enumerate(player_ids):
+            self.rows_by_id.setdefault(player_id, []).append(row)
+
+    def __len__(self):
+        return len(self.player_ids)
+
+
+_projection_cache = {}
+
+
+def load_projections(scoring_type, data_dir=DATA_DIR):
+    key = (os.path.abspath(data_dir), scoring_type)
+    if key not in _projection_cache:
+        tables = {}
+        for pos in POSITIONS:
+            path = os.path.join(data_dir, f'{pos}_projections.csv')
+            with stage('csv_read') as s:
+                df = pd.read_csv(path)
+                s.add_file(path)
+            player_ids = df['player_id'].astype(str).to_numpy()
+            if scoring_type in df.columns:
+                points = df[scoring_type].to_numpy(dtype=float)
+            else:
+                points = np.full(len(df), np.nan)
+            tables[pos] = ProjectionTable(player_ids, points)
+        _projection_cache[key] = tables
+    return _projection_cache[key]
+
+
+def league_format(settings):
+    return tuple(int(settings.get(key) or 0) for key in FORMAT_SETTINGS)
+
+
+def starter_counts(tables, fmt):
+    # League-wide starters per position. Flex and then superflex spots go to
+    # the best players left over once every dedicated slot is filled;
+    # superflex goes last because it also takes anyone flex could.
+    teams, qb, rb, wr, te, k, dst, flex, superflex = fmt
+    counts = {'qb': qb * teams, 'rb': rb * teams, 'wr': wr * teams, 'te': te * teams, 'k': k * teams,
+              'dst': dst * teams}
+    for eligible, spots in ((FLEX_TABLES, flex * teams), (SUPERFLEX_TABLES, superflex * teams)):
+        for _ in range(spots):
+            next_best = {pos: tables[pos].descending[counts[pos]] for pos in eligible
+                         if counts[pos] < tables[pos].projected}
+            if not next_best:
+                break
+            counts[max(next_best, key=next_best.get)] += 1
+    return counts
+
+
+def replacement_level(table, starters):
+    # The best player left once every starter is taken, or the worst
+    # projected one when the league starts more than are projected.
+    if table.projected == 0:
+        return np.nan
+    return table.descending[min(starters, table.projected - 1)]
+
+
+_level_cache = {}
+
+
+def replacement_levels(scoring_type, fmt, data_dir=DATA_DIR):
+    # Cached per (projections, scoring type, league format), so drafts in a
+    # known format pay one dict lookup and VOR is O(1) per position.
+    key = (os.path.abspath(data_dir), scoring_type, fmt)
+    if key not in _level_cache:
+        tables = load_projections(scoring_type, data_dir)
+        counts = starter_counts(tables, fmt)
+        for pos in VOR_POSITIONS:
+            if counts[pos] >= tables[pos].projected:
+                warnings.warn(f"{fmt} {scoring_type}: the league starts {counts[pos]} {pos} but only "
+                              f"{tables[pos].projected} are projected; using the worst projected as replacement")
+        _level_cache[key] = {pos: replacement_level(tables[pos], counts[pos]) for pos in VOR_POSITIONS}
+    return _level_cache[key]
+
+
+class PositionState:
+    def __init__(self, table):
+        self.table = table
+        self.drafted = np.zeros(len(table), dtype=bool)
+        self.available = len(table)
+        self.cursor = 0
+
+    def mark_drafted(self, player_id):
+        for row in self.table.rows_by_id.get(player_id, ()):
+            if not self.drafted[row]:
+                self.drafted[row] = True
+                self.available -= 1
+
+    def best_row(self):
+        # The cursor only moves forward, so this is amortised O(1) per pick.
+        order = self.table.order
+        while self.cursor < len(order) and self.drafted[order[self.cursor]]:
+            self.cursor += 1
+        if self.cursor == len(order):
+            return None
+        return order[self.cursor]
+
+    def best(self):
+        row = self.best_row()
+        return np.nan if row is None else self.table.points[row]
+
+
+class DraftState:
+    def __init__(self, draft_data, data_dir=DATA_DIR):
+        self.team_needs, self.total_needs = get_team_total_needs(draft_data)
+        self.scoring_type = draft_data['metadata']['scoring_type']
+        self.scoring = SCORING_MAP.get(self.scoring_type, 0)
+        tables = load_projections(self.scoring_type, data_dir)
+        self.positions = {pos: PositionState(table) for pos, table in tables.items()}
+
+        self.bases = replacement_levels(self.scoring_type, league_format(draft_data['settings']), data_dir)
+
+    def vor(self, pos):
+        return self.positions[pos].best() - self.bases[pos]
+
+    def features(self, draft_slot, pick_no, round_num):
+        needs = self.team_needs[draft_slot - 1]
+        total = self.total_needs
+        qb_available = self.positions['qb'].available
+        rb_available = self.positions['rb'].available
+        wr_available = self.positions['wr'].available
+        te_available = self.positions['te'].available
+        rb_vor = self.vor('rb')
+        wr_vor = self.vor('wr')
+        te_vor = self.vor('te')
+        return (
+            pick_no,
+            round_num,
+            self.scoring,
+            needs['qb_slots'],
+            needs['rb_slots'],
+            needs['wr_slots'],
+            needs['te_slots'],
+            needs['k_slots'],
+            needs['dst_slots'],
+            # Superflex spots count as flex need; the model has no column
+            # of their own.
+            needs['flex_slots'] + needs['superflex_slots'],
+            total['qb_slots'] - needs['qb_slots'],
+            total['rb_slots'] - needs['rb_slots'],
+            total['wr_slots'] - needs['wr_slots'],
+            total['te_slots'] - needs['te_slots'],
+            total['k_slots'] - needs['k_slots'],
+            total['dst_slots'] - needs['dst_slots'],
+            total['flex_slots'] + total['superflex_slots'] - needs['flex_slots'] - needs['superflex_slots'],
+            qb_available,
+            rb_available,
+            wr_available,
+            te_available,
+            self.positions['k'].available,
+            self.positions['dst'].available,
+            rb_available + wr_available + te_available,
+            self.vor('qb'),
+            rb_vor,
+            wr_vor,
+            te_vor,
+            self.vor('k'),
+            # Positions with nobody left drop out instead of turning it NaN.
+            max([vor for vor in (rb_vor, wr_vor, te_vor) if not math.isnan(vor)], default=np.nan)
+        )
+
+    def pick(self, draft_slot, position, player_id):
+        table_key = PICK_TABLES.get(position)
+        if table_key is None:
+            return
+        needs = self.team_needs[draft_slot - 1]
+        slot_key = SLOT_KEYS.get(position)
+        if slot_key and needs[slot_key] > 0:
+            needs[slot_key] -= 1
+            self.total_needs[slot_key] -= 1
+        elif position in ['RB', 'WR', 'TE'] and needs['flex_slots'] > 0:
+            needs['flex_slots'] -= 1
+            self.total_needs['flex_slots'] -= 1
+        elif position in ['QB', 'RB', 'WR', 'TE'] and needs['superflex_slots'] > 0:
+            needs['superflex_slots'] -= 1
+            self.total_needs['superflex_slots'] -= 1
+        self.positions[table_key].mark_drafted(str(player_id))
+
+
+NUMERIC_COLUMNS = FEATURE_COLUMNS[:-1]
+FLOAT_COLUMNS = ['qb_vor', 'rb_vor', 'wr_vor', 'te_vor', 'k_vor', 'flex_vor']
+
+
+def replay_columns(draft_data, picks_data, data_dir=DATA_DIR):
+    state = DraftState(draft_data, data_dir)
+    n_picks = len(picks_data)
+    features = np.empty((n_picks, len(NUMERIC_COLUMNS)), dtype=float)
+    positions = picks_data['position'].to_numpy(dtype=object)
+    with stage('feature_loop', profile=True) as s:
+        for i, (pick_no, round_num, draft_slot, player_id, position) in enumerate(zip(
+                picks_data['pick_no'], picks_data['round'], picks_data['draft_slot'],
+                picks_data['player_id'], positions)):
+            features[i] = state.features(draft_slot, pick_no, round_num)
+            state.pick(draft_slot, position, player_id)
+        s.add(items=n_picks)
+
+    columns = {}
+    for j, col in enumerate(NUMERIC_COLUMNS):
+        if col in FLOAT_COLUMNS or (col == 'scoring_type' and isinstance(state.scoring, float)):
+            columns[col] = features[:, j]
+        else:
+            columns[col] = features[:, j].astype(np.int64)
+    columns['position_drafted'] = positions
+    return columns
+
+
+def replay_draft(draft_data, picks_data, data_dir=DATA_DIR):
+    return pd.DataFrame(replay_columns(draft_data, picks_data, data_dir), columns=FEATURE_COLUMNS)
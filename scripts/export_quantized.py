@@ -0,0 +1,157 @@
+import argparse
+import gzip
+import json
+import os
+import time
+
+import numpy as np
+
+from draft_model import MODEL_DIR, WEIGHTS_PATH, read_h5_weights
+from model_data import load_training_arrays, notebook_split
+from normalization_stats import training_minmax
+from numpy_model import NumpyDraftModel, load_weights
+
+OUTPUT_DIR = '../models/quantized'
+SHARD_NAME = 'group1-shard1of1.bin'
+
+VARIANTS = ['float32', 'float16', 'uint8']
+
+
+def quantize(values, variant):
+    # Returns (bytes, quantization spec) in the TensorFlow.js weights format,
+    # so tf.loadLayersModel can read every variant directly.
+    values = np.asarray(values, dtype=np.float32)
+    if variant == 'float32':
+        return values.tobytes(), None
+    if variant == 'float16':
+        return values.astype(np.float16).tobytes(), {'dtype': 'float16'}
+    if variant == 'uint8':
+        lo, hi = float(values.min()), float(values.max())
+        scale = (hi - lo) / 255 if hi > lo else 1.0
+        q = np.clip(np.round((values - lo) / scale), 0, 255).astype(np.uint8)
+        return q.tobytes(), {'dtype': 'uint8', 'min': lo, 'scale': scale}
+    raise ValueError(f"Unknown variant {variant}")
+
+
+def read_tfjs_weights(model_dir):
+    # A TF.js model directory (models/ or a train_model.py run) as
+    # {layer: [arrays]} in manifest order, like read_h5_weights.
+    weights = {}
+    for name, value in load_weights(model_dir).items():
+        weights.setdefault(name.rsplit('/', 1)[0], []).append(np.array(value))
+    return weights
+
+
+def export_weights(weights, out_dir, variant='float32', template_path=os.path.join(MODEL_DIR, 'model.json')):
+    # weights: {layer: [arrays]} as returned by read_h5_weights. Names and
+    # ordering follow the template manifest exported by the TF.js converter.
+    with open(template_path) as f:
+        manifest = json.load(f)
+    specs = manifest['weightsManifest'][0]['weights']
+    arrays = [value for values in weights.values() for value in values]
+    if len(arrays) != len(specs):
+        raise ValueError(f"Expected {len(specs)} weight arrays, got {len(arrays)}")
+
+    chunks = []
+    new_specs = []
+    for spec, value in zip(specs, arrays):
+        if list(value.shape) != spec['shape']:
+            raise ValueError(f"{spec['name']}: expected shape {spec['shape']}, got {list(value.shape)}")
+        data, quantization = quantize(value, variant)
+        chunks.append(data)
+        new_spec = {'name': spec['name'], 'shape': spec['shape'], 'dtype': 'float32'}
+        if quantization:
+            new_spec['quantization'] = quantization
+        new_specs.append(new_spec)
+
+    os.makedirs(out_dir, exist_ok=True)
+    with open(os.path.join(out_dir, SHARD_NAME), 'wb') as f:
+        f.write(b''.join(chunks))
+    manifest['weightsManifest'] = [{'paths': [SHARD_NAME], 'weights': new_specs}]
+    with open(os.path.join(out_dir, 'model.json'), 'w') as f:
+        json.dump(manifest, f)
+
+
+def evaluate(model_dir, X_test, y_test, repeats=5):
+    from sklearn.metrics import accuracy_score, balanced_accuracy_score, cohen_kappa_score
+
+    load_times = []
+    for _ in range(repeats):
+        t0 = time.perf_counter()
+        model = NumpyDraftModel(model_dir)
+        load_times.append(time.perf_counter() - t0)
+
+    model.predict(X_test)
+    infer_times = []
+    for _ in range(repeats):
+        t0 = time.perf_counter()
+        probs = model.predict(X_test)
+        infer_times.append(time.perf_counter() - t0)
+    y_pred = probs.argmax(axis=1)
+
+    shard = os.path.join(model_dir, SHARD_NAME)
+    with open(shard, 'rb') as f:
+        raw = f.read()
+    return {
+        'shard_bytes': len(raw),
+        'shard_gzip_bytes': len(gzip.compress(raw, compresslevel=9)),
+        'load_ms': round(float(np.median(load_times)) * 1000, 3),
+        'inference_us_per_row': round(float(np.median(infer_times)) / len(X_test) * 1e6, 3),
+        'accuracy': float(accuracy_score(y_test, y_pred)),
+        'balanced_accuracy': float(balanced_accuracy_score(y_test, y_pred)),
+        'kappa': float(cohen_kappa_score(y_test, y_pred)),
+        'probs': probs
+    }
+
+
+def export_report(weights, output, X_test, y_test, variants=VARIANTS,
+                  template_path=os.path.join(MODEL_DIR, 'model.json')):
+    # Exports every variant under output/ and compares each against the
+    # first (float32) on the test split; written to output/report.json.
+    report = {}
+    reference = None
+    for variant in variants:
+        out_dir = os.path.join(output, variant)
+        export_weights(weights, out_dir, variant, template_path)
+        result = evaluate(out_dir, X_test, y_test)
+        probs = result.pop('probs')
+        if reference is None:
+            reference = result, probs
+        base, base_probs = reference
+        result['max_prob_diff'] = float(np.abs(probs - base_probs).max())
+        result['prediction_agreement'] = float((probs.argmax(axis=1) == base_probs.argmax(axis=1)).mean())
+        result['accuracy_change'] = result['accuracy'] - base['accuracy']
+        result['kappa_change'] = result['kappa'] - base['kappa']
+        report[variant] = result
+
+    with open(os.path.join(output, 'report.json'), 'w') as f:
+        json.dump(report, f, indent=2)
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Export float16/uint8 variants of the draft model and compare them.')
+    source = parser.add_mutually_exclusive_group()
+    source.add_argument('--weights', default=WEIGHTS_PATH, help='Keras HDF5 weights')
+    source.add_argument('--model-dir', help='TF.js model.json directory instead, e.g. ../models/trained')
+    parser.add_argument('--output', default=OUTPUT_DIR)
+    args = parser.parse_args()
+
+    if args.model_dir:
+        weights = read_tfjs_weights(args.model_dir)
+        template_path = os.path.join(args.model_dir, 'model.json')
+    else:
+        weights = read_h5_weights(args.weights)
+        template_path = os.path.join(MODEL_DIR, 'model.json')
+    X, y, _ = load_training_arrays(training_minmax())
+    X_test, y_test = notebook_split(X, y)['test']
+    report = export_report(weights, args.output, X_test, y_test, template_path=template_path)
+
+    print(f"{'variant':<8} {'bytes':>9} {'gzip':>9} {'load ms':>8} {'us/row':>7} {'bal acc':>8} {'kappa':>7} {'d kappa':>8}")
+    for variant, r in report.items():
+        print(f"{variant:<8} {r['shard_bytes']:>9} {r['shard_gzip_bytes']:>9} {r['load_ms']:>8.2f} "
+              f"{r['inference_us_per_row']:>7.2f} {r['balanced_accuracy']:>8.4f} {r['kappa']:>7.4f} {r['kappa_change']:>+8.4f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,152 @@
+import argparse
+import glob
+import hashlib
+import json
+import os
+import re
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# Local stand-in for the parts of api.sleeper.app the scripts use. Fixtures use
+# the same {'draft': ..., 'picks': [...]} layout as the SleeperClient cache, so
+# a cache directory can be served back as-is.
+
+DRAFT_PATH = re.compile(r'^/v1/draft/(\d+)(/picks)?$')
+PLAYERS_PATH = '/v1/players/nfl'
+
+
+def load_fixtures(fixtures_dir):
+    fixtures = {}
+    for path in glob.glob(os.path.join(fixtures_dir, '*.json')):
+        with open(path) as f:
+            raw = json.load(f)
+        fixtures[str(raw['draft']['draft_id'])] = raw
+    return fixtures
+
+
+class FakeSleeperServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, fixtures, port=0, throttle_every=0, replay=False, picks_per_poll=1, players=None):
+        super().__init__(('127.0.0.1', port), FakeSleeperHandler)
+        self.fixtures = fixtures
+        # Every Nth request answers 429 so client retry paths get exercised.
+        self.throttle_every = throttle_every
+        self.request_count = 0
+        self.lock = threading.Lock()
+        # Replay mode plays each draft back as if live: every /picks request
+        # reveals picks_per_poll more picks, and the draft reports
+        # 'drafting' until all of them are out.
+        self.replay = replay
+        self.picks_per_poll = picks_per_poll
+        self.revealed = {}
+        self.bytes_sent = 0
+        self.set_players(players)
+
+    def set_players(self, players):
+        # /players/nfl answers If-None-Match with a 304 while the payload is
+        # unchanged, like a CDN-fronted endpoint.
+        with self.lock:
+            self.players_body = None if players is None else json.dumps(players).encode()
+            self.players_etag = None if players is None else f'"{hashlib.sha1(self.players_body).hexdigest()}"'
+
+    def visible_picks(self, draft_id, advance=False):
+        picks = self.fixtures[draft_id]['picks']
+        if not self.replay:
+            return picks
+        with self.lock:
+            n = self.revealed.get(draft_id, 0)
+            if advance:
+                n = min(n + self.picks_per_poll, len(picks))
+                self.revealed[draft_id] = n
+        return picks[:n]
+
+    def draft_status(self, draft_id):
+        raw = self.fixtures[draft_id]
+        if not self.replay:
+            return raw['draft']
+        done = len(self.visible_picks(draft_id)) == len(raw['picks'])
+        return {**raw['draft'], 'status': 'complete' if done else 'drafting'}
+
+    @property
+    def base_url(self):
+        return f'http://127.0.0.1:{self.server_address[1]}/v1'
+
+    def start(self):
+        thread = threading.Thread(target=self.serve_forever, daemon=True)
+        thread.start()
+        return self
+
+    def stop(self):
+        self.shutdown()
+        self.server_close()
+
+
+class FakeSleeperHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        server = self.server
+        with server.lock:
+            server.request_count += 1
+            throttled = server.throttle_every and server.request_count % server.throttle_every == 0
+        if throttled:
+            self._send_json(429, {'error': 'rate limited'}, {'Retry-After': '0'})
+            return
+
+        if self.path == PLAYERS_PATH and server.players_body is not None:
+            with server.lock:
+                body, etag = server.players_body, server.players_etag
+            if self.headers.get('If-None-Match') == etag:
+                self._send_body(304, b'', {'ETag': etag})
+            else:
+                self._send_body(200, body, {'ETag': etag})
+            return
+
+        match = DRAFT_PATH.match(self.path)
+        if not match or match.group(1) not in server.fixtures:
+            self._send_json(404, None)
+        elif match.group(2):
+            self._send_json(200, server.visible_picks(match.group(1), advance=True))
+        else:
+            self._send_json(200, server.draft_status(match.group(1)))
+
+    def _send_json(self, status, payload, headers=None):
+        self._send_body(status, json.dumps(payload).encode(), headers)
+
+    def _send_body(self, status, body, headers=None):
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        if status != 304:
+            self.send_header('Content-Length', str(len(body)))
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.end_headers()
+        self.wfile.write(body)
+        with self.server.lock:
+            self.server.bytes_sent += len(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Serve recorded Sleeper drafts locally.')
+    parser.add_argument('--fixtures', default='../data/cache/sleeper/drafts')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--throttle-every', type=int, default=0)
+    parser.add_argument('--replay', action='store_true', help='Reveal picks progressively, as in a live draft')
+    parser.add_argument('--picks-per-poll', type=int, default=1)
+    parser.add_argument('--players', help='JSON payload to serve at /players/nfl')
+    args = parser.parse_args()
+
+    players = None
+    if args.players:
+        with open(args.players) as f:
+            players = json.load(f)
+    server = FakeSleeperServer(load_fixtures(args.fixtures), args.port, args.throttle_every, args.replay,
+                               args.picks_per_poll, players)
+    print(f"Serving {len(server.fixtures)} drafts at {server.base_url}")
+    server.serve_forever()
+
+
+if __name__ == "__main__":
+    main()
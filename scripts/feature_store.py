@@ -0,0 +1,186 @@
+import argparse
+import json
+import os
+import shutil
+
+import numpy as np
+import pandas as pd
+
+from draft_state import FEATURE_COLUMNS, SCORING_MAP
+from instrumentation import stage
+
+STORE_DIR = '../data/2025/feature_store'
+CSV_PATH = '../data/2025/all_draft_data.csv'
+MANIFEST = 'manifest.json'
+STORE_VERSION = 1
+
+COLUMN_DTYPES = {col: 'int64' for col in FEATURE_COLUMNS}
+COLUMN_DTYPES.update({col: 'float64' for col in ['scoring_type', 'qb_vor', 'rb_vor', 'wr_vor', 'te_vor', 'k_vor', 'flex_vor']})
+COLUMN_DTYPES['position_drafted'] = '<U3'
+COLUMN_DTYPES['draft_id'] = 'int64'
+
+SCORING_NAMES = {value: name for name, value in SCORING_MAP.items()}
+
+
+class FeatureStore:
+    # One directory of .npy columns per (scoring type, draft id) partition plus
+    # a manifest. Appends only write new partitions, and reads memory-map just
+    # the columns and partitions asked for.
+    def __init__(self, root=STORE_DIR):
+        self.root = root
+        self.manifest = self._load_manifest()
+
+    def _load_manifest(self):
+        path = os.path.join(self.root, MANIFEST)
+        if os.path.exists(path):
+            with open(path) as f:
+                manifest = json.load(f)
+            if manifest['version'] != STORE_VERSION:
+                raise ValueError(f"Unsupported feature store version {manifest['version']} in {self.root}")
+            return manifest
+        return {'version': STORE_VERSION, 'columns': COLUMN_DTYPES, 'partitions': []}
+
+    def _save_manifest(self):
+        os.makedirs(self.root, exist_ok=True)
+        path = os.path.join(self.root, MANIFEST)
+        tmp_path = f'{path}.tmp'
+        with open(tmp_path, 'w') as f:
+            json.dump(self.manifest, f, indent=1)
+        os.replace(tmp_path, path)
+
+    @property
+    def columns(self):
+        return list(self.manifest['columns'])
+
+    @property
+    def draft_ids(self):
+        return {p['draft_id'] for p in self.manifest['partitions']}
+
+    def __len__(self):
+        return sum(p['rows'] for p in self.manifest['partitions'])
+
+    def append(self, df, overwrite=False):
+        written = []
+        existing = {p['draft_id']: p for p in self.manifest['partitions']}
+        for draft_id, draft_df in df.groupby('draft_id', sort=False):
+            draft_id = int(draft_id)
+            if draft_id in existing:
+                if not overwrite:
+                    continue
+                self.manifest['partitions'].remove(existing[draft_id])
+                shutil.rmtree(os.path.join(self.root, existing[draft_id]['path']), ignore_errors=True)
+
+            scoring = SCORING_NAMES[float(draft_df['scoring_type'].iloc[0])]
+            rel_path = os.path.join(scoring, str(draft_id))
+            part_dir = os.path.join(self.root, rel_path)
+            os.makedirs(part_dir, exist_ok=True)
+            for col, dtype in self.manifest['columns'].items():
+                values = draft_df[col].to_numpy()
+                if col == 'position_drafted':
+                    values = np.array(['' if v is None else v for v in values])
+                np.save(os.path.join(part_dir, f'{col}.npy'), values.astype(dtype))
+            self.manifest['partitions'].append({
+                'draft_id': draft_id,
+                'scoring_type': scoring,
+                'rows': len(draft_df),
+                'path': rel_path
+            })
+            written.append(draft_id)
+        if written:
+            self._save_manifest()
+        return written
+
+    def partitions(self, scoring_types=None, draft_ids=None):
+        draft_ids = set(int(d) for d in draft_ids) if draft_ids is not None else None
+        for part in self.manifest['partitions']:
+            if scoring_types is not None and part['scoring_type'] not in scoring_types:
+                continue
+            if draft_ids is not None and part['draft_id'] not in draft_ids:
+                continue
+            yield part
+
+    def read_partition(self, part, columns=None):
+        columns = columns or self.columns
+        part_dir = os.path.join(self.root, part['path'])
+        return {col: np.load(os.path.join(part_dir, f'{col}.npy'), mmap_mode='r') for col in columns}
+
+    def iter_chunks(self, columns=None, scoring_types=None, draft_ids=None):
+        for part in self.partitions(scoring_types, draft_ids):
+            yield self.read_partition(part, columns)
+
+    def read_arrays(self, columns=None, scoring_types=None, draft_ids=None, where=None):
+        columns = columns or self.columns
+        needed = columns + [col for col in (where or {}) if col not in columns]
+        parts = {col: [] for col in columns}
+        for chunk in self.iter_chunks(needed, scoring_types, draft_ids):
+            mask = None
+            for col, predicate in (where or {}).items():
+                col_mask = predicate(chunk[col])
+                mask = col_mask if mask is None else mask & col_mask
+            for col in columns:
+                parts[col].append(chunk[col] if mask is None else chunk[col][mask])
+        return {
+            col: np.concatenate(chunks) if chunks else np.array([], dtype=self.manifest['columns'][col])
+            for col, chunks in parts.items()
+        }
+
+    def read(self, columns=None, scoring_types=None, draft_ids=None, where=None):
+        columns = columns or self.columns
+        return pd.DataFrame(self.read_arrays(columns, scoring_types, draft_ids, where), columns=columns)
+
+    def export_csv(self, path):
+        # all_draft_data.csv is the only copy of drafts that have left the
+        # local cache, so never replace it with fewer drafts than it holds.
+        if os.path.exists(path) and 'draft_id' in pd.read_csv(path, nrows=0).columns:
+            exported = pd.read_csv(path, usecols=['draft_id'])['draft_id'].nunique()
+            if exported > len(self.draft_ids):
+                raise ValueError(f"{path} holds {exported} drafts but the store only {len(self.draft_ids)}; "
+                                 f"import it first (feature_store.py import)")
+        df = self.read()
+        df['scoring_type'] = df['scoring_type'].astype(float)
+        with stage('csv_write') as s:
+            df.to_csv(path, index=False)
+            s.add(items=len(df))
+            s.add_file(path)
+        return len(df)
+
+
+def open_store(root=STORE_DIR, csv_path=CSV_PATH):
+    # An empty store starts from the exported CSV, so collection runs only
+    # add drafts on top of what was already collected.
+    store = FeatureStore(root)
+    if not store.manifest['partitions'] and os.path.exists(csv_path):
+        written = store.append(pd.read_csv(csv_path))
+        print(f"Seeded {root} with {len(written)} drafts from {csv_path}")
+    return store
+
+
+def import_csv(csv_path, root=STORE_DIR):
+    store = FeatureStore(root)
+    written = store.append(pd.read_csv(csv_path))
+    print(f"Imported {len(written)} drafts from {csv_path} into {root}")
+    return store
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Manage the columnar draft feature store.')
+    parser.add_argument('command', choices=['import', 'export', 'info'])
+    parser.add_argument('--store', default=STORE_DIR)
+    parser.add_argument('--csv', default=CSV_PATH)
+    args = parser.parse_args()
+
+    if args.command == 'import':
+        import_csv(args.csv, args.store)
+    elif args.command == 'export':
+        rows = FeatureStore(args.store).export_csv(args.csv)
+        print(f"Exported {rows} rows to {args.csv}")
+    else:
+        store = FeatureStore(args.store)
+        by_scoring = {}
+        for part in store.partitions():
+            by_scoring[part['scoring_type']] = by_scoring.get(part['scoring_type'], 0) + 1
+        print(f"{len(store.draft_ids)} drafts, {len(store)} rows: {by_scoring}")
+
+
+if __name__ == "__main__":
+    main()
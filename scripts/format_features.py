@@ -0,0 +1,95 @@
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+
+from draft_simulator import DEFAULT_SETTINGS, POSITION_LABELS, DraftSimulator
+from draft_state import (DATA_DIR, FEATURE_COLUMNS, FLOAT_COLUMNS, FORMAT_SETTINGS, NUMERIC_COLUMNS, SCORING_MAP,
+                         VOR_POSITIONS, league_format, replacement_levels)
+
+OUTPUT_PATH = '../data/2025/format_draft_data.csv'
+LEVELS_PATH = '../data/2025/replacement_levels.csv'
+TEAM_COUNTS = list(range(8, 15))
+# Synthetic draft ids are format_no * DRAFT_ID_STRIDE + draft, far below
+# Sleeper's 19-digit ids.
+DRAFT_ID_STRIDE = 10 ** 6
+
+
+def format_grid(team_counts=TEAM_COUNTS, superflex=(0, 1), rounds=DEFAULT_SETTINGS['rounds']):
+    return [dict(DEFAULT_SETTINGS, teams=teams, rounds=rounds, slots_super_flex=slots)
+            for teams in team_counts for slots in superflex]
+
+
+def level_table(formats, scoring_types, data_dir=DATA_DIR):
+    # Fills the replacement level cache for every format and returns it as
+    # one row per (format, scoring type).
+    rows = []
+    for settings in formats:
+        fmt = league_format(settings)
+        for scoring_type in scoring_types:
+            levels = replacement_levels(scoring_type, fmt, data_dir)
+            rows.append({**dict(zip(FORMAT_SETTINGS, fmt)), 'scoring_type': scoring_type,
+                         **{f'{pos}_level': levels[pos] for pos in VOR_POSITIONS}})
+    return pd.DataFrame(rows)
+
+
+def format_features(settings, scoring_type, n_drafts, seed=0, data_dir=DATA_DIR, draft_id_base=0, adp_noise=12.0):
+    # Simulated ADP drafts in one format, as all_draft_data.csv rows. The
+    # simulator builds each pick's row for every draft at once, matching
+    # DraftState.features on the same picks.
+    simulator = DraftSimulator(settings, scoring_type, data_dir, adp_noise=adp_noise)
+    result = simulator.run(n_drafts, 'adp', 'adp', seed, record_features=True)
+    n_picks = result['picks'].shape[1]
+    features = result['features'].reshape(-1, len(NUMERIC_COLUMNS))
+
+    columns = {}
+    for j, col in enumerate(NUMERIC_COLUMNS):
+        if col in FLOAT_COLUMNS or col == 'scoring_type':
+            columns[col] = features[:, j]
+        else:
+            columns[col] = features[:, j].astype(np.int64)
+    columns['position_drafted'] = POSITION_LABELS[simulator.pool.pos[result['picks']]].ravel()
+    df = pd.DataFrame(columns, columns=FEATURE_COLUMNS)
+    df['draft_id'] = draft_id_base + np.repeat(np.arange(n_drafts), n_picks)
+    df['teams'] = simulator.teams
+    df['superflex'] = simulator.superflex_slots
+    return df
+
+
+def generate(formats, scoring_types, n_drafts, seed=0, data_dir=DATA_DIR):
+    frames = []
+    for format_no, settings in enumerate(formats):
+        for scoring_no, scoring_type in enumerate(scoring_types):
+            block = format_no * len(scoring_types) + scoring_no
+            frames.append(format_features(settings, scoring_type, n_drafts, seed + block, data_dir,
+                                          draft_id_base=(block + 1) * DRAFT_ID_STRIDE))
+    return pd.concat(frames, ignore_index=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Generate draft features for league formats without scraped drafts.')
+    parser.add_argument('--teams', nargs='+', type=int, default=TEAM_COUNTS)
+    parser.add_argument('--superflex', nargs='+', type=int, choices=[0, 1], default=[0, 1])
+    parser.add_argument('--rounds', type=int, default=DEFAULT_SETTINGS['rounds'])
+    parser.add_argument('--scoring', nargs='+', choices=list(SCORING_MAP), default=list(SCORING_MAP))
+    parser.add_argument('--drafts', type=int, default=200, help='Simulated drafts per format and scoring type')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--data-dir', default=DATA_DIR)
+    parser.add_argument('--output', default=OUTPUT_PATH)
+    parser.add_argument('--levels-output', default=LEVELS_PATH)
+    args = parser.parse_args()
+
+    t0 = time.perf_counter()
+    formats = format_grid(args.teams, args.superflex, args.rounds)
+    levels = level_table(formats, args.scoring, args.data_dir)
+    levels.to_csv(args.levels_output, index=False)
+    df = generate(formats, args.scoring, args.drafts, args.seed, args.data_dir)
+    df.to_csv(args.output, index=False)
+    print(f"{len(formats)} formats x {len(args.scoring)} scoring types: {len(levels)} replacement levels to "
+          f"{args.levels_output}, {df['draft_id'].nunique()} drafts ({len(df)} picks) to {args.output} "
+          f"in {time.perf_counter() - t0:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+// Startup benchmark for docs/main.js: CSV files vs the precompiled bundle.
+//
+// Runs the page script in a VM with a stub DOM and a fetch that serves
+// docs/data/2025 the way GitHub Pages does, adding a fixed round trip per
+// request. Measures the page-load name preload, the data load behind
+// "Start Draft", and the getAvailablePlayersSync call every recommendation
+// makes.
+//
+// Usage: node frontend_startup_benchmark.js [--rtt ms] [--runs n] [--baseline old_main.js]
+
+const fs = require('fs');
+const path = require('path');
+const vm = require('vm');
+
+const DATA_DIR = path.join(__dirname, '..', 'docs', 'data', '2025');
+const SERVED_PREFIX = '/FantasyFootball/data/2025/';
+
+function parseArgs(argv) {
+    const args = {rtt: 40, runs: 5, syncCalls: 500, script: path.join(__dirname, '..', 'docs', 'main.js'), baseline: null};
+    for (let i = 0; i < argv.length; i += 2) {
+        const key = argv[i].replace(/^--/, '');
+        args[key === 'sync-calls' ? 'syncCalls' : key] = ['rtt', 'runs', 'sync-calls'].includes(key)
+            ? Number(argv[i + 1]) : argv[i + 1];
+    }
+    return args;
+}
+
+function makeContext(search, rtt, stats) {
+    const element = {value: '1', addEventListener() {}, classList: {add() {}, remove() {}}};
+    const document = {
+        body: element,
+        addEventListener() {},
+        getElementById: id => (id === 'scoring-type' ? {...element, value: 'ppr'} : element),
+        querySelector: () => null,
+        querySelectorAll: () => []
+    };
+    const sleep = ms => new Promise(resolve => setTimeout(resolve, ms));
+    async function fetch(url) {
+        stats.requests++;
+        await sleep(rtt);
+        const file = url.startsWith(SERVED_PREFIX) ? path.join(DATA_DIR, url.slice(SERVED_PREFIX.length)) : null;
+        if (!file || !fs.existsSync(file)) {
+            return new Response('Not found', {status: 404});
+        }
+        const body = fs.readFileSync(file);
+        stats.bytes += body.length;
+        return new Response(body, {status: 200});
+    }
+    const quiet = {log() {}, warn() {}, error() {}};
+    return vm.createContext({
+        document,
+        window: {location: {hostname: 'arkokush.github.io', search}, addEventListener() {}},
+        fetch,
+        console: quiet,
+        setTimeout,
+        Response,
+        Blob,
+        TextDecoder,
+        URLSearchParams,
+        DecompressionStream,
+        performance
+    });
+}
+
+async function measure(source, search, args) {
+    const stats = {requests: 0, bytes: 0};
+    const context = makeContext(search, args.rtt, stats);
+    vm.runInContext(source, context);
+    const result = await vm.runInContext(`(async () => {
+        const t0 = performance.now();
+        await preloadAllPlayerNames();
+        const t1 = performance.now();
+        await Promise.all([getAvailablePlayersAsync(), loadNormalizationStats()]);
+        const t2 = performance.now();
+        for (let i = 0; i < ${args.syncCalls}; i++) getAvailablePlayersSync();
+        const t3 = performance.now();
+        return {preload: t1 - t0, start: t2 - t1, sync: (t3 - t2) / ${args.syncCalls}};
+    })()`, context);
+    return {...result, ...stats};
+}
+
+function median(values) {
+    const sorted = [...values].sort((a, b) => a - b);
+    return sorted[Math.floor(sorted.length / 2)];
+}
+
+async function main() {
+    const args = parseArgs(process.argv.slice(2));
+    const source = fs.readFileSync(args.script, 'utf8');
+    const variants = [
+        ['csv', source, '?bundle=0'],
+        ['bundle', source, '']
+    ];
+    if (args.baseline) {
+        variants.unshift(['baseline', fs.readFileSync(args.baseline, 'utf8'), '']);
+    }
+
+    console.log(`rtt ${args.rtt} ms, ${args.runs} runs, ${args.syncCalls} getAvailablePlayersSync calls`);
+    console.log(`${'variant'.padEnd(9)} ${'requests'.padStart(8)} ${'bytes'.padStart(8)} ${'preload ms'.padStart(11)} ` +
+                `${'start ms'.padStart(9)} ${'sync us'.padStart(8)}`);
+    for (const [name, script, search] of variants) {
+        const runs = [];
+        for (let i = 0; i < args.runs; i++) {
+            runs.push(await measure(script, search, args));
+        }
+        const m = key => median(runs.map(r => r[key]));
+        console.log(`${name.padEnd(9)} ${String(m('requests')).padStart(8)} ${String(m('bytes')).padStart(8)} ` +
+                    `${m('preload').toFixed(1).padStart(11)} ${m('start').toFixed(1).padStart(9)} ` +
+                    `${(m('sync') * 1000).toFixed(1).padStart(8)}`);
+    }
+}
+
+main();
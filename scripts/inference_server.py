@@ -0,0 +1,176 @@
+import argparse
+import json
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import numpy as np
+
+from draft_model import MODEL_FEATURES, POSITION_CLASSES, KerasDraftModel
+from numpy_model import NumpyDraftModel
+
+
+class MicroBatcher:
+    # Collects feature rows from concurrent requests and runs them through the
+    # model as one batch. A batch closes when it is full or when the oldest
+    # request has waited max_wait_ms, so latency stays bounded at low load.
+    def __init__(self, model, max_batch=256, max_wait_ms=2.0):
+        self.model = model
+        self.max_batch = max_batch
+        self.max_wait = max_wait_ms / 1000
+        self.requests = queue.Queue()
+        self.batches = 0
+        self.rows = 0
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def submit(self, rows):
+        future = Future()
+        self.requests.put((rows, future))
+        return future
+
+    def _collect(self):
+        pending = [self.requests.get()]
+        n_rows = len(pending[0][0])
+        deadline = time.perf_counter() + self.max_wait
+        while n_rows < self.max_batch:
+            timeout = deadline - time.perf_counter()
+            if timeout <= 0:
+                break
+            try:
+                item = self.requests.get(timeout=timeout)
+            except queue.Empty:
+                break
+            pending.append(item)
+            n_rows += len(item[0])
+        return pending
+
+    def _run(self):
+        while True:
+            pending = self._collect()
+            try:
+                batch = np.concatenate([rows for rows, _ in pending]).astype(np.float32)
+                probs = np.asarray(self.model.predict(batch))
+            except Exception as e:
+                for _, future in pending:
+                    future.set_exception(e)
+                continue
+            self.batches += 1
+            self.rows += len(batch)
+            start = 0
+            for rows, future in pending:
+                future.set_result(probs[start:start + len(rows)])
+                start += len(rows)
+
+
+def parse_features(payload):
+    if 'instances' in payload:
+        rows = np.asarray(payload['instances'], dtype=np.float32)
+    else:
+        rows = np.asarray([payload['features']], dtype=np.float32)
+    if rows.ndim != 2 or rows.shape[1] != len(MODEL_FEATURES):
+        raise ValueError(f"Expected {len(MODEL_FEATURES)} features per row ({', '.join(MODEL_FEATURES)})")
+    return rows
+
+
+def format_predictions(probs):
+    return [
+        {
+            'probabilities': {pos: float(p) for pos, p in zip(POSITION_CLASSES, row)},
+            'best_position': POSITION_CLASSES[int(np.argmax(row))]
+        }
+        for row in probs
+    ]
+
+
+class InferenceServer(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 1024
+
+    def __init__(self, batcher, host='127.0.0.1', port=8000, timeout=5.0):
+        super().__init__((host, port), InferenceHandler)
+        self.batcher = batcher
+        self.timeout_s = timeout
+
+    @property
+    def url(self):
+        return f'http://{self.server_address[0]}:{self.server_address[1]}'
+
+    def start(self):
+        thread = threading.Thread(target=self.serve_forever, daemon=True)
+        thread.start()
+        return self
+
+    def stop(self):
+        self.shutdown()
+        self.server_close()
+
+
+class InferenceHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def do_OPTIONS(self):
+        self._send_json(204, None)
+
+    def do_GET(self):
+        if self.path != '/health':
+            self._send_json(404, {'error': 'not found'})
+            return
+        batcher = self.server.batcher
+        self._send_json(200, {'status': 'ok', 'batches': batcher.batches, 'rows': batcher.rows})
+
+    def do_POST(self):
+        if self.path != '/predict':
+            self._send_json(404, {'error': 'not found'})
+            return
+        try:
+            length = int(self.headers.get('Content-Length', 0))
+            payload = json.loads(self.rfile.read(length))
+            rows = parse_features(payload)
+        except (ValueError, KeyError, TypeError) as e:
+            self._send_json(400, {'error': str(e)})
+            return
+        try:
+            probs = self.server.batcher.submit(rows).result(timeout=self.server.timeout_s)
+        except Exception as e:
+            self._send_json(503, {'error': str(e)})
+            return
+        predictions = format_predictions(probs)
+        self._send_json(200, predictions[0] if 'features' in payload else {'predictions': predictions})
+
+    def _send_json(self, status, payload):
+        body = json.dumps(payload).encode() if payload is not None else b''
+        self.send_response(status)
+        # The draft page is served from GitHub Pages, so allow cross-origin calls.
+        self.send_header('Access-Control-Allow-Origin', '*')
+        self.send_header('Access-Control-Allow-Methods', 'POST, GET, OPTIONS')
+        self.send_header('Access-Control-Allow-Headers', 'Content-Type')
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Serve draft position predictions over HTTP.')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8000)
+    parser.add_argument('--max-batch', type=int, default=256)
+    parser.add_argument('--max-wait-ms', type=float, default=2.0)
+    parser.add_argument('--backend', choices=['numpy', 'keras'], default='numpy')
+    args = parser.parse_args()
+
+    model = NumpyDraftModel() if args.backend == 'numpy' else KerasDraftModel()
+    batcher = MicroBatcher(model, args.max_batch, args.max_wait_ms)
+    server = InferenceServer(batcher, args.host, args.port)
+    print(f"Serving /predict at {server.url}")
+    server.serve_forever()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,211 @@
+import atexit
+import json
+import os
+import signal
+import sys
+import threading
+import time
+from collections import Counter
+
+try:
+    import resource
+except ImportError:
+    # Windows has no resource module; stages still record times and bytes.
+    resource = None
+
+# Opt-in per process: FF_INSTRUMENT=1 records stages and writes a JSON run
+# report on exit into FF_INSTRUMENT_DIR (default REPORT_DIR); FF_PROFILE=1
+# also samples stacks inside stages marked profile=True. Child processes
+# inherit the environment, so pipeline.py runs get one report per script.
+ENABLED = os.environ.get('FF_INSTRUMENT', '') not in ('', '0')
+PROFILE = ENABLED and os.environ.get('FF_PROFILE', '') not in ('', '0') and hasattr(signal, 'setitimer')
+PROFILE_INTERVAL = float(os.environ.get('FF_PROFILE_INTERVAL', '0.005'))
+REPORT_DIR = os.environ.get('FF_INSTRUMENT_DIR') or '../data/cache/run_reports'
+
+
+def peak_rss_mb(children=False):
+    # ru_maxrss is KiB on Linux and bytes on macOS.
+    if resource is None:
+        return 0.0
+    scale = 1 if sys.platform == 'darwin' else 1024
+    who = resource.RUSAGE_CHILDREN if children else resource.RUSAGE_SELF
+    return resource.getrusage(who).ru_maxrss * scale / 2 ** 20
+
+
+class NullStage:
+    # Shared stand-in while instrumentation is off; every call is a no-op.
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def add(self, nbytes=0, items=0):
+        pass
+
+    def add_file(self, path):
+        pass
+
+
+NULL_STAGE = NullStage()
+
+
+class Stage:
+    def __init__(self, recorder, name, profile):
+        self.recorder = recorder
+        self.name = name
+        self.profile = profile
+        self.nbytes = 0
+        self.items = 0
+
+    def __enter__(self):
+        self.rss_before = peak_rss_mb()
+        if self.profile:
+            self.recorder.sampler.start()
+        self.t0 = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        seconds = time.perf_counter() - self.t0
+        if self.profile:
+            self.recorder.sampler.stop()
+        self.recorder.record(self.name, seconds, self.nbytes, self.items, self.rss_before, exc_type is not None)
+        return False
+
+    def add(self, nbytes=0, items=0):
+        self.nbytes += nbytes
+        self.items += items
+
+    def add_file(self, path):
+        if os.path.exists(path):
+            self.nbytes += os.path.getsize(path)
+
+
+class Sampler:
+    # SIGPROF stack sampler. The signal lands on the main thread, so it sees
+    # the per-pick loops, not the HTTP worker threads.
+    def __init__(self, interval=PROFILE_INTERVAL, max_depth=32):
+        self.interval = interval
+        self.max_depth = max_depth
+        self.stacks = Counter()
+        self.active = 0
+
+    def start(self):
+        if threading.current_thread() is not threading.main_thread():
+            return
+        self.active += 1
+        if self.active == 1:
+            signal.signal(signal.SIGPROF, self._sample)
+            signal.setitimer(signal.ITIMER_PROF, self.interval, self.interval)
+
+    def stop(self):
+        if threading.current_thread() is not threading.main_thread() or not self.active:
+            return
+        self.active -= 1
+        if self.active == 0:
+            signal.setitimer(signal.ITIMER_PROF, 0, 0)
+            signal.signal(signal.SIGPROF, signal.SIG_DFL)
+
+    def _sample(self, signum, frame):
+        stack = []
+        while frame is not None and len(stack) < self.max_depth:
+            code = frame.f_code
+            stack.append(f'{os.path.basename(code.co_filename)}:{code.co_name}:{frame.f_lineno}')
+            frame = frame.f_back
+        self.stacks[';'.join(reversed(stack))] += 1
+
+    def summary(self, top=25):
+        leaves = Counter()
+        for stack, count in self.stacks.items():
+            leaves[stack.rsplit(';', 1)[-1]] += count
+        total = sum(self.stacks.values())
+        return {
+            'interval_s': self.interval,
+            'samples': total,
+            'top_lines': [{'line': line, 'samples': n, 'share': round(n / total, 3)}
+                          for line, n in leaves.most_common(top)],
+            'top_stacks': [{'stack': stack, 'samples': n} for stack, n in self.stacks.most_common(top)]
+        }
+
+
+class Recorder:
+    def __init__(self, profile=PROFILE):
+        self.started = time.strftime('%Y-%m-%dT%H:%M:%S')
+        self.t0 = time.perf_counter()
+        self.stages = {}
+        self.lock = threading.Lock()
+        self.sampler = Sampler() if profile else None
+
+    def stage(self, name, profile=False):
+        return Stage(self, name, profile and self.sampler is not None)
+
+    def record(self, name, seconds, nbytes, items, rss_before, failed):
+        rss_after = peak_rss_mb()
+        with self.lock:
+            entry = self.stages.setdefault(name, {'calls': 0, 'seconds': 0.0, 'max_seconds': 0.0, 'bytes': 0,
+                                                  'items': 0, 'failures': 0, 'peak_rss_mb': 0.0,
+                                                  'rss_growth_mb': 0.0})
+            entry['calls'] += 1
+            entry['seconds'] += seconds
+            entry['max_seconds'] = max(entry['max_seconds'], seconds)
+            entry['bytes'] += nbytes
+            entry['items'] += items
+            entry['failures'] += failed
+            entry['peak_rss_mb'] = max(entry['peak_rss_mb'], rss_after)
+            # Growth of the process high-water mark while this stage ran.
+            entry['rss_growth_mb'] = max(entry['rss_growth_mb'], rss_after - rss_before)
+
+    def report(self):
+        wall = time.perf_counter() - self.t0
+        stages = {}
+        with self.lock:
+            for name, entry in sorted(self.stages.items(), key=lambda item: -item[1]['seconds']):
+                stages[name] = {key: round(value, 4) if isinstance(value, float) else value
+                                for key, value in entry.items()}
+                stages[name]['share_of_wall'] = round(entry['seconds'] / wall, 3) if wall else 0.0
+        report = {
+            'script': os.path.basename(sys.argv[0]) if sys.argv and sys.argv[0] else 'python',
+            'argv': sys.argv[1:],
+            'pid': os.getpid(),
+            'started': self.started,
+            'wall_seconds': round(wall, 4),
+            'peak_rss_mb': round(peak_rss_mb(), 1),
+            'children_peak_rss_mb': round(peak_rss_mb(children=True), 1),
+            # Stage times are inclusive, so nested stages overlap.
+            'stages': stages
+        }
+        if self.sampler is not None:
+            report['profile'] = self.sampler.summary()
+        return report
+
+    def write(self, path=None):
+        report = self.report()
+        if path is None:
+            stamp = time.strftime('%Y%m%d-%H%M%S')
+            path = os.path.join(REPORT_DIR, f"{os.path.splitext(report['script'])[0]}-{stamp}-{report['pid']}.json")
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        with open(path, 'w') as f:
+            json.dump(report, f, indent=2)
+        return path, report
+
+
+_recorder = Recorder() if ENABLED else None
+
+
+def stage(name, profile=False):
+    if _recorder is None:
+        return NULL_STAGE
+    return _recorder.stage(name, profile)
+
+
+def _write_at_exit():
+    path, report = _recorder.write()
+    top = ', '.join(f"{name} {entry['seconds']:.2f}s" for name, entry in list(report['stages'].items())[:4])
+    print(f"[instrumentation] {report['wall_seconds']:.2f}s wall, peak RSS {report['peak_rss_mb']:.0f} MB; "
+          f"{top or 'no stages'} -> {path}", file=sys.stderr)
+
+
+# Only the process that enabled instrumentation writes a report; pool
+# workers exit without running atexit hooks.
+if _recorder is not None:
+    atexit.register(_write_at_exit)
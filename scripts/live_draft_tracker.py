@@ -0,0 +1,241 @@
+import argparse
+import os
+import time
+
+import numpy as np
+import pandas as pd
+import requests
+
+from draft_model import MODEL_FEATURES, POSITION_CLASSES
+from draft_state import DATA_DIR, NUMERIC_COLUMNS, POSITIONS, DraftState
+from fake_sleeper_server import FakeSleeperServer, load_fixtures
+from normalization_stats import training_minmax
+from numpy_model import NumpyDraftModel
+from pick_survival import SURVIVAL_PATH, PickSurvival
+from sleeper_client import SLEEPER_API, SleeperClient
+
+MODEL_COLUMNS = np.array([NUMERIC_COLUMNS.index(col) for col in MODEL_FEATURES])
+FINISHED_STATUSES = ['complete']
+# Sleeper labels team defenses 'DEF'. DraftState.pick only marks the 'DST'
+# table, and replay keeps 'DEF' as-is so the stored columns stay unchanged;
+# live tracking must mark them, or the last-round defense recommendation
+# lands on one that is already gone.
+LIVE_POSITIONS = {'DEF': 'DST'}
+
+
+def slot_on_clock(pick_no, teams, draft_type='snake', reversal_round=0):
+    round_num, index = divmod(pick_no - 1, teams)
+    round_num += 1
+    forward = draft_type != 'snake' or round_num % 2 == 1
+    # Third-round reversal: from reversal_round on, the snake runs backwards.
+    if draft_type == 'snake' and reversal_round and round_num >= reversal_round:
+        forward = not forward
+    return (index + 1 if forward else teams - index), round_num
+
+
+def load_player_names(data_dir=DATA_DIR):
+    names = {}
+    for pos in POSITIONS:
+        path = os.path.join(data_dir, f'{pos}_projections.csv')
+        if os.path.exists(path):
+            df = pd.read_csv(path, usecols=['name', 'player_id'], dtype={'player_id': str}).dropna()
+            names.update(zip(df['player_id'], df['name']))
+    return names
+
+
+class LiveDraftTracker:
+    # Follows an in-progress Sleeper draft. Each poll only ingests picks past
+    # the last pick_no seen, so the DraftState is updated in place instead of
+    # replaying the whole draft.
+    def __init__(self, draft_id, client=None, model=None, my_slot=None, data_dir=DATA_DIR, minmax=None,
+                 survival=None):
+        self.draft_id = str(draft_id)
+        self.client = client or SleeperClient(cache_dir=None)
+        self.model = model or NumpyDraftModel()
+        self.my_slot = my_slot
+        self.names = load_player_names(data_dir)
+        self.survival = survival
+
+        self.draft = self.client.get_json(f'/draft/{self.draft_id}')
+        settings = self.draft['settings']
+        self.teams = settings['teams']
+        self.rounds = settings['rounds']
+        self.reversal_round = settings.get('reversal_round', 0)
+        self.state = DraftState(self.draft, data_dir)
+        self.last_pick_no = 0
+
+        minmax = minmax or training_minmax()
+        self.lo = np.array([minmax[col][0] for col in MODEL_FEATURES], dtype=np.float32)
+        span = np.array([minmax[col][1] - minmax[col][0] for col in MODEL_FEATURES], dtype=np.float32)
+        self.span = np.where(span > 0, span, 1.0)
+        self.latencies = []
+
+    @property
+    def total_picks(self):
+        return self.teams * self.rounds
+
+    def ingest(self, picks):
+        # Sleeper has no "since" parameter, so the full list comes back on
+        # every poll; anything at or below last_pick_no is already applied.
+        new = sorted((p for p in picks if p['pick_no'] > self.last_pick_no), key=lambda p: p['pick_no'])
+        for p in new:
+            position = (p.get('metadata') or {}).get('position')
+            position = LIVE_POSITIONS.get(position, position)
+            self.state.pick(p['draft_slot'], position, p['player_id'])
+            self.last_pick_no = p['pick_no']
+        return new
+
+    def on_clock(self, draft_slot=None, after=None):
+        # The next pick overall, or the next one belonging to draft_slot,
+        # after the last pick made (or after pick `after`).
+        pick_no = (self.last_pick_no if after is None else after) + 1
+        while True:
+            slot, round_num = slot_on_clock(pick_no, self.teams, self.draft.get('type', 'snake'),
+                                            self.reversal_round)
+            if draft_slot is None or slot == draft_slot or pick_no >= self.total_picks:
+                return pick_no, round_num, slot
+            pick_no += 1
+
+    def recommend(self, draft_slot=None):
+        pick_no, round_num, draft_slot = self.on_clock(draft_slot)
+        features = self.state.features(draft_slot, pick_no, round_num)
+        x = (np.asarray(features, dtype=np.float32)[MODEL_COLUMNS] - self.lo) / self.span
+        probs = self.model.predict(x)[0]
+
+        # Kicker in the second-to-last round and defense in the last, as on
+        # the draft page; otherwise the likeliest position with players left.
+        late = {self.rounds - 1: 'k', self.rounds: 'dst'}
+        if round_num in late:
+            position = late[round_num]
+        else:
+            available = np.array([self.state.positions[c.lower()].available > 0 for c in POSITION_CLASSES])
+            position = POSITION_CLASSES[int(np.where(available, probs, -1).argmax())].lower()
+        row = self.state.positions[position].best_row()
+        player_id = None if row is None else str(self.state.positions[position].table.player_ids[row])
+
+        # Chance the player is still on the board at this slot's following
+        # pick, from the historical pick-survival tables.
+        next_pick = survives = None
+        if self.survival is not None and player_id is not None and self.state.scoring_type in self.survival.tables:
+            next_no, _, next_slot = self.on_clock(draft_slot, after=pick_no)
+            if next_slot == draft_slot and pick_no < next_no <= self.total_picks:
+                next_pick = next_no
+                survives = float(self.survival.survival(player_id, next_no, self.state.scoring_type))
+        return {
+            'pick_no': pick_no,
+            'round': round_num,
+            'draft_slot': draft_slot,
+            'features': dict(zip(NUMERIC_COLUMNS, features)),
+            'probabilities': dict(zip(POSITION_CLASSES, probs.round(4).tolist())),
+            'position': position.upper(),
+            'player_id': player_id,
+            'player': self.names.get(player_id, player_id),
+            'vor': float(self.state.vor(position)) if position in self.state.bases else None,
+            'next_pick': next_pick,
+            'survives_to_next': survives
+        }
+
+    def finished(self):
+        return self.last_pick_no >= self.total_picks
+
+    def follow(self, on_update=None, min_interval=1.0, max_interval=10.0, backoff=1.5, max_errors=10):
+        # Poll quickly while picks are coming in and back off while the
+        # board is idle (or the API is failing) so a paused draft costs little.
+        interval = min_interval
+        errors = 0
+        while not self.finished():
+            try:
+                picks = self.client.get_json(f'/draft/{self.draft_id}/picks')
+            except (requests.RequestException, ValueError) as e:
+                errors += 1
+                if errors >= max_errors:
+                    raise
+                interval = min(interval * 2, max_interval)
+                print(f"Poll failed ({e}); retrying in {interval:.1f}s")
+                time.sleep(interval)
+                continue
+            errors = 0
+
+            t0 = time.perf_counter()
+            new = self.ingest(picks)
+            if new:
+                recommendation = None if self.finished() else self.recommend(self.my_slot)
+                latency = time.perf_counter() - t0
+                self.latencies.append(latency)
+                if on_update:
+                    on_update(new, recommendation, latency)
+                interval = min_interval
+            elif self.client.get_json(f'/draft/{self.draft_id}').get('status') in FINISHED_STATUSES:
+                break
+            else:
+                interval = min(interval * backoff, max_interval)
+            if not self.finished():
+                time.sleep(interval)
+        return self.latencies
+
+
+def print_update(tracker):
+    def on_update(new, recommendation, latency):
+        for p in new:
+            pid = str(p['player_id'])
+            print(f"#{p['pick_no']:<3} slot {p['draft_slot']:<2} {(p.get('metadata') or {}).get('position', ''):<3} "
+                  f"{tracker.names.get(pid, pid)}")
+        if recommendation:
+            survives = ''
+            if recommendation['survives_to_next'] is not None:
+                survives = (f" ({recommendation['survives_to_next'] * 100:.0f}% still there at pick "
+                            f"{recommendation['next_pick']})")
+            print(f"     -> pick {recommendation['pick_no']} (slot {recommendation['draft_slot']}): "
+                  f"{recommendation['position']} {recommendation['player']}{survives} "
+                  f"[{latency * 1000:.1f} ms]")
+    return on_update
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Follow a live Sleeper draft and recommend each pick.')
+    parser.add_argument('draft_id', nargs='?', help='Sleeper draft id (default: first fixture with --replay)')
+    parser.add_argument('--slot', type=int, default=None, help='Only recommend for this draft slot')
+    parser.add_argument('--base-url', default=SLEEPER_API)
+    parser.add_argument('--min-interval', type=float, default=None)
+    parser.add_argument('--max-interval', type=float, default=10.0)
+    parser.add_argument('--replay', metavar='FIXTURES_DIR',
+                        help='Replay recorded drafts from a local fake Sleeper server')
+    parser.add_argument('--picks-per-poll', type=int, default=1)
+    parser.add_argument('--quiet', action='store_true', help='Only print the latency summary')
+    parser.add_argument('--survival', default=SURVIVAL_PATH,
+                        help='Pick-survival tables from pick_survival.py (skipped if missing)')
+    args = parser.parse_args()
+
+    server = None
+    base_url = args.base_url
+    min_interval = args.min_interval
+    if args.replay:
+        fixtures = load_fixtures(args.replay)
+        if not fixtures:
+            parser.error(f"no fixtures in {args.replay}")
+        args.draft_id = args.draft_id or sorted(fixtures)[0]
+        server = FakeSleeperServer(fixtures, replay=True, picks_per_poll=args.picks_per_poll).start()
+        base_url = server.base_url
+        min_interval = 0.01 if min_interval is None else min_interval
+    elif not args.draft_id:
+        parser.error('draft_id is required without --replay')
+
+    try:
+        survival = PickSurvival.load(args.survival) if os.path.exists(args.survival) else None
+        tracker = LiveDraftTracker(args.draft_id, SleeperClient(base_url, cache_dir=None), my_slot=args.slot,
+                                   survival=survival)
+        t0 = time.perf_counter()
+        latencies = tracker.follow(None if args.quiet else print_update(tracker),
+                                   1.0 if min_interval is None else min_interval, args.max_interval)
+    finally:
+        if server:
+            server.stop()
+
+    if latencies:
+        ms = np.array(latencies) * 1000
+        print(f"{tracker.last_pick_no} picks in {time.perf_counter() - t0:.1f}s; update latency "
+              f"p50 {np.median(ms):.2f} ms, p95 {np.percentile(ms, 95):.2f} ms, max {ms.max():.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+import argparse
+import json
+import threading
+import time
+
+import numpy as np
+import requests
+
+from draft_model import MODEL_FEATURES
+
+
+def percentile_report(latencies, elapsed, errors):
+    latencies_ms = np.asarray(latencies) * 1000
+    report = {
+        'requests': len(latencies),
+        'errors': errors,
+        'elapsed_s': round(elapsed, 3),
+        'throughput_rps': round(len(latencies) / elapsed, 1) if elapsed else 0.0
+    }
+    if len(latencies_ms):
+        for p in [50, 90, 99]:
+            report[f'p{p}_ms'] = round(float(np.percentile(latencies_ms, p)), 2)
+        report['max_ms'] = round(float(latencies_ms.max()), 2)
+    return report
+
+
+def run_load(url, concurrency=100, requests_per_client=50, seed=0):
+    latencies = []
+    errors = [0]
+    lock = threading.Lock()
+    start_barrier = threading.Barrier(concurrency)
+
+    def client(client_no):
+        rng = np.random.default_rng(seed + client_no)
+        session = requests.Session()
+        local = []
+        failed = 0
+        start_barrier.wait()
+        for _ in range(requests_per_client):
+            payload = {'features': rng.random(len(MODEL_FEATURES)).tolist()}
+            t0 = time.perf_counter()
+            try:
+                response = session.post(f'{url}/predict', json=payload, timeout=10)
+                response.raise_for_status()
+                local.append(time.perf_counter() - t0)
+            except requests.RequestException:
+                failed += 1
+        with lock:
+            latencies.extend(local)
+            errors[0] += failed
+
+    threads = [threading.Thread(target=client, args=(i,)) for i in range(concurrency)]
+    t0 = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return percentile_report(latencies, time.perf_counter() - t0, errors[0])
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Load test the /predict inference server.')
+    parser.add_argument('--url', default='http://127.0.0.1:8000')
+    parser.add_argument('--concurrency', type=int, default=100)
+    parser.add_argument('--requests', type=int, default=50, help='requests per client')
+    args = parser.parse_args()
+
+    print(json.dumps(run_load(args.url, args.concurrency, args.requests), indent=2))
+
+
+if __name__ == "__main__":
+    main()
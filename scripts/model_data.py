@@ -0,0 +1,72 @@
+import numpy as np
+import pandas as pd
+
+from draft_model import MODEL_FEATURES, POSITION_CLASSES
+from feature_store import STORE_DIR, FeatureStore
+
+DRAFT_DATA_CSV = '../data/2025/all_draft_data.csv'
+
+# The notebook trains on rounds 1-13; the last two rounds are forced K/DEF.
+EXCLUDED_ROUNDS = [14, 15]
+# all_draft_data.csv row order, which the seeded notebook split depends on.
+CSV_ORDER = ['scoring_type', 'draft_id', 'pick_no']
+
+
+def load_draft_data(columns=None, store_dir=STORE_DIR, csv_path=DRAFT_DATA_CSV):
+    store = FeatureStore(store_dir)
+    if len(store):
+        # Partitions come back in append order; sort them into the CSV's.
+        needed = None if columns is None else list(dict.fromkeys(columns + CSV_ORDER))
+        df = store.read(needed).sort_values(CSV_ORDER, kind='stable', ignore_index=True)
+        return df if columns is None else df[columns]
+    return pd.read_csv(csv_path, usecols=columns)
+
+
+def training_frame(all_draft_data):
+    draft_data = all_draft_data[~all_draft_data['round'].isin(EXCLUDED_ROUNDS)]
+    # Early K/DEF (or unlabelled) picks have no model class.
+    unknown = ~draft_data['position_drafted'].isin(POSITION_CLASSES)
+    if unknown.any():
+        print(f"Dropped {unknown.sum()} picks before round {min(EXCLUDED_ROUNDS)} that are not "
+              f"{'/'.join(POSITION_CLASSES)}")
+        draft_data = draft_data[~unknown]
+    return draft_data[MODEL_FEATURES + ['position_drafted']].reset_index(drop=True)
+
+
+def fit_minmax(draft_data, columns=MODEL_FEATURES):
+    return {col: (float(draft_data[col].min()), float(draft_data[col].max())) for col in columns}
+
+
+def scale_features(draft_data, minmax, columns=MODEL_FEATURES):
+    X = np.empty((len(draft_data), len(columns)), dtype=np.float32)
+    for j, col in enumerate(columns):
+        lo, hi = minmax[col]
+        X[:, j] = (draft_data[col].to_numpy(dtype=float) - lo) / (hi - lo) if hi > lo else 0.0
+    return X
+
+
+def encode_labels(positions):
+    codes = pd.Categorical(positions, categories=POSITION_CLASSES).codes.astype(np.int64)
+    if (codes < 0).any():
+        unknown = sorted({str(p) for p, code in zip(positions, codes) if code < 0})
+        raise ValueError(f"Labels outside {POSITION_CLASSES}: {', '.join(unknown)}")
+    return codes
+
+
+def notebook_split(X, y):
+    # Same 60/20/20 split (and seeds) as the notebook.
+    from sklearn.model_selection import train_test_split
+
+    X_train_val, X_test, y_train_val, y_test = train_test_split(X, y, test_size=0.2, random_state=42)
+    X_train, X_val, y_train, y_val = train_test_split(X_train_val, y_train_val, test_size=0.25, random_state=42)
+    return {
+        'train': (X_train, y_train),
+        'val': (X_val, y_val),
+        'test': (X_test, y_test)
+    }
+
+
+def load_training_arrays(minmax=None):
+    draft_data = training_frame(load_draft_data())
+    minmax = minmax or fit_minmax(draft_data)
+    return scale_features(draft_data, minmax), encode_labels(draft_data['position_drafted']), minmax
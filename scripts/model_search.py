@@ -0,0 +1,228 @@
+import argparse
+import itertools
+import json
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import numpy as np
+import pandas as pd
+
+from model_data import encode_labels, load_draft_data, notebook_split, scale_features, training_frame
+from normalization_stats import training_minmax
+from train_model import CACHE_DIR, data_key
+
+OUTPUT_DIR = '../models/search'
+
+SEARCH_SPACE = {
+    'dense': {
+        'hidden_units': [[1028, 512, 256, 128], [512, 256, 128], [256, 128], [128, 64]],
+        'dropout': [0.1, 0.2, 0.3]
+    },
+    'xgb': {
+        'max_depth': [3, 6, 9],
+        'n_estimators': [100, 300],
+        'learning_rate': [0.05, 0.1, 0.3]
+    },
+    'rf': {
+        'max_depth': [None, 8, 16],
+        'n_estimators': [100, 300],
+        'min_samples_leaf': [1, 5]
+    }
+}
+
+
+def expand_configs(families, n_random=0, seed=42):
+    configs = []
+    for family in families:
+        space = SEARCH_SPACE[family]
+        for values in itertools.product(*space.values()):
+            configs.append({'family': family, **dict(zip(space.keys(), values))})
+    if n_random and n_random < len(configs):
+        configs = random.Random(seed).sample(configs, n_random)
+    return configs
+
+
+def config_name(config):
+    params = ','.join(f'{k}={v}' for k, v in config.items() if k != 'family')
+    return f"{config['family']}({params})"
+
+
+def prepare_folds(n_folds=5, seed=42, smote=True, cache_dir=CACHE_DIR):
+    # Folds are cut once from the train+val rows (the notebook's test split
+    # stays held out) and cached, so every trial and every worker scores on
+    # identical, already resampled data.
+    from sklearn.model_selection import StratifiedKFold
+
+    minmax = training_minmax()
+    draft_data = training_frame(load_draft_data())
+    key = data_key(draft_data, [minmax, n_folds], seed, smote)
+    path = os.path.join(cache_dir, f'folds_{key}.npz')
+    if not os.path.exists(path):
+        X = scale_features(draft_data, minmax)
+        y = encode_labels(draft_data['position_drafted'])
+        split = notebook_split(X, y)
+        X_fit = np.concatenate([split['train'][0], split['val'][0]])
+        y_fit = np.concatenate([split['train'][1], split['val'][1]])
+
+        arrays = {}
+        folds = StratifiedKFold(n_splits=n_folds, shuffle=True, random_state=seed).split(X_fit, y_fit)
+        for i, (train_idx, val_idx) in enumerate(folds):
+            X_train, y_train = X_fit[train_idx], y_fit[train_idx]
+            if smote:
+                from imblearn.over_sampling import SMOTE
+
+                X_train, y_train = SMOTE(random_state=seed).fit_resample(X_train, y_train)
+            arrays[f'X_train_{i}'] = X_train.astype(np.float32)
+            arrays[f'y_train_{i}'] = y_train
+            arrays[f'X_val_{i}'] = X_fit[val_idx]
+            arrays[f'y_val_{i}'] = y_fit[val_idx]
+
+        os.makedirs(cache_dir, exist_ok=True)
+        tmp_path = f'{path}.tmp.npz'
+        np.savez(tmp_path, **arrays)
+        os.replace(tmp_path, path)
+    return path, n_folds
+
+
+def fit_model(config, X_train, y_train, X_val, y_val, seed=42):
+    params = {k: v for k, v in config.items() if k != 'family'}
+    if config['family'] == 'dense':
+        import tensorflow as tf
+        from tensorflow.keras.callbacks import EarlyStopping
+
+        from draft_model import build_model
+        from train_model import make_dataset
+
+        # One thread per trial; the pool already spreads trials over cores.
+        tf.config.threading.set_intra_op_parallelism_threads(1)
+        tf.config.threading.set_inter_op_parallelism_threads(1)
+        tf.keras.utils.set_random_seed(seed)
+        model = build_model(n_features=X_train.shape[1], **params)
+        model.fit(
+            make_dataset(X_train, y_train, 64, shuffle=True, seed=seed),
+            validation_data=make_dataset(X_val, y_val, 4096),
+            epochs=200,
+            callbacks=[EarlyStopping(monitor='val_loss', patience=10, restore_best_weights=True)],
+            verbose=0
+        )
+        return lambda X: model.predict_on_batch(X).argmax(axis=1)
+    if config['family'] == 'xgb':
+        import xgboost as xgb
+
+        model = xgb.XGBClassifier(eval_metric='mlogloss', n_jobs=1, random_state=seed, **params)
+    elif config['family'] == 'rf':
+        from sklearn.ensemble import RandomForestClassifier
+
+        model = RandomForestClassifier(n_jobs=1, random_state=seed, **params)
+    else:
+        raise ValueError(f"Unknown model family {config['family']}")
+    model.fit(X_train, y_train)
+    return model.predict
+
+
+def run_trial(config, folds_path, fold, seed=42):
+    from sklearn.metrics import balanced_accuracy_score, cohen_kappa_score
+
+    with np.load(folds_path) as folds:
+        X_train, y_train = folds[f'X_train_{fold}'], folds[f'y_train_{fold}']
+        X_val, y_val = folds[f'X_val_{fold}'], folds[f'y_val_{fold}']
+    try:
+        t0 = time.perf_counter()
+        predict = fit_model(config, X_train, y_train, X_val, y_val, seed)
+        fit_seconds = time.perf_counter() - t0
+        predict(X_val)
+        t0 = time.perf_counter()
+        y_pred = predict(X_val)
+        infer_seconds = time.perf_counter() - t0
+    except Exception as e:
+        return {'fold': fold, 'error': f'{type(e).__name__}: {e}'}
+    return {
+        'fold': fold,
+        'balanced_accuracy': float(balanced_accuracy_score(y_val, y_pred)),
+        'kappa': float(cohen_kappa_score(y_val, y_pred)),
+        'fit_seconds': fit_seconds,
+        'inference_us_per_row': infer_seconds / len(X_val) * 1e6
+    }
+
+
+def run_folds(executor, configs, folds_path, fold_ids, seed, results):
+    futures = {executor.submit(run_trial, configs[i], folds_path, fold, seed): i
+               for i in configs for fold in fold_ids}
+    for future in as_completed(futures):
+        i = futures[future]
+        result = future.result()
+        results[i].append(result)
+        status = result.get('error') or f"bal acc {result['balanced_accuracy']:.4f}"
+        print(f"  {config_name(configs[i])} fold {result['fold']}: {status}")
+
+
+def prune(configs, results, margin, keep_fraction):
+    # Trials that fail or trail the best first-fold score by more than the
+    # margin are dropped before spending the remaining folds on them.
+    scores = {i: results[i][0].get('balanced_accuracy') for i in configs}
+    scores = {i: s for i, s in scores.items() if s is not None}
+    if not scores:
+        return {}
+    best = max(scores.values())
+    ranked = sorted(scores, key=scores.get, reverse=True)
+    n_keep = max(1, int(np.ceil(len(ranked) * keep_fraction)))
+    return {i: configs[i] for i in ranked[:n_keep] if scores[i] >= best - margin}
+
+
+def leaderboard(configs, results, n_folds):
+    rows = []
+    for i, config in configs.items():
+        scored = [r for r in results[i] if 'error' not in r]
+        errors = [r['error'] for r in results[i] if 'error' in r]
+        row = {'model': config_name(config), 'family': config['family'], 'folds': len(scored),
+               'complete': len(scored) == n_folds, 'error': errors[0] if errors else ''}
+        for metric in ['balanced_accuracy', 'kappa', 'inference_us_per_row', 'fit_seconds']:
+            row[metric] = np.mean([r[metric] for r in scored]) if scored else np.nan
+        row['balanced_accuracy_std'] = np.std([r['balanced_accuracy'] for r in scored]) if scored else np.nan
+        rows.append(row)
+    board = pd.DataFrame(rows)
+    return board.sort_values(['complete', 'balanced_accuracy', 'kappa'], ascending=False).reset_index(drop=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Search model families and hyperparameters in parallel.')
+    parser.add_argument('--families', nargs='+', default=list(SEARCH_SPACE), choices=list(SEARCH_SPACE))
+    parser.add_argument('--random', type=int, default=0, help='Sample this many configs instead of the full grid')
+    parser.add_argument('--folds', type=int, default=5)
+    parser.add_argument('--workers', type=int, default=os.cpu_count())
+    parser.add_argument('--prune-margin', type=float, default=0.03)
+    parser.add_argument('--keep-fraction', type=float, default=0.5)
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--no-smote', action='store_true')
+    parser.add_argument('--output', default=OUTPUT_DIR)
+    args = parser.parse_args()
+
+    t0 = time.perf_counter()
+    folds_path, n_folds = prepare_folds(args.folds, args.seed, not args.no_smote)
+    configs = dict(enumerate(expand_configs(args.families, args.random, args.seed)))
+    results = {i: [] for i in configs}
+    print(f"{len(configs)} configs, {n_folds} folds, {args.workers} workers")
+
+    with ProcessPoolExecutor(max_workers=args.workers) as executor:
+        print('Fold 0 for every config')
+        run_folds(executor, configs, folds_path, [0], args.seed, results)
+        survivors = prune(configs, results, args.prune_margin, args.keep_fraction)
+        print(f'{len(survivors)} configs survive pruning; remaining folds')
+        run_folds(executor, survivors, folds_path, range(1, n_folds), args.seed, results)
+
+    board = leaderboard(configs, results, n_folds)
+    os.makedirs(args.output, exist_ok=True)
+    board.to_csv(os.path.join(args.output, 'leaderboard.csv'), index=False)
+    with open(os.path.join(args.output, 'leaderboard.json'), 'w') as f:
+        # Configs that errored have NaN scores; JSON has no NaN, so write null.
+        json.dump(board.replace({np.nan: None}).to_dict(orient='records'), f, indent=2, default=float)
+
+    columns = ['model', 'folds', 'balanced_accuracy', 'kappa', 'inference_us_per_row', 'fit_seconds']
+    print(board[columns].head(15).to_string(index=False, float_format=lambda v: f'{v:.4f}'))
+    print(f"Search finished in {time.perf_counter() - t0:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+import hashlib
+import json
+import os
+
+import numpy as np
+import pandas as pd
+
+from feature_store import STORE_DIR, FeatureStore
+from model_data import DRAFT_DATA_CSV, EXCLUDED_ROUNDS
+
+STATS_PATH = '../data/2025/normalization_stats.json'
+STATS_VERSION = 1
+
+# Bounded columns for min-max scaling
+BOUNDED_COLS = [
+    'pick_no', 'round',
+    'qb_need', 'rb_need', 'wr_need', 'te_need', 'flex_need',
+    'other_qb_need', 'other_rb_need', 'other_wr_need', 'other_te_need', 'other_flex_need',
+    'qb_available', 'rb_available', 'wr_available', 'te_available', 'flex_available'
+]
+
+# VOR columns for standardization
+VOR_COLS = ['qb_vor', 'rb_vor', 'wr_vor', 'te_vor', 'k_vor', 'flex_vor']
+
+
+class RunningStats:
+    # Min/max plus mean/variance merged chunk by chunk with Chan et al.'s
+    # parallel update, so memory is constant in the number of rows.
+    def __init__(self, n_cols):
+        self.n = np.zeros(n_cols)
+        self.mean = np.zeros(n_cols)
+        self.m2 = np.zeros(n_cols)
+        self.min = np.full(n_cols, np.inf)
+        self.max = np.full(n_cols, -np.inf)
+
+    def update(self, values):
+        values = np.asarray(values, dtype=float)
+        valid = ~np.isnan(values)
+        n_b = valid.sum(axis=0)
+        if not n_b.any():
+            return
+        filled = np.where(valid, values, 0.0)
+        safe_n_b = np.maximum(n_b, 1)
+        mean_b = filled.sum(axis=0) / safe_n_b
+        m2_b = (np.where(valid, values - mean_b, 0.0) ** 2).sum(axis=0)
+
+        n = self.n + n_b
+        safe_n = np.maximum(n, 1)
+        delta = mean_b - self.mean
+        self.mean = self.mean + delta * n_b / safe_n
+        self.m2 = self.m2 + m2_b + delta ** 2 * self.n * n_b / safe_n
+        self.n = n
+        self.min = np.fmin(self.min, np.nanmin(np.where(valid, values, np.inf), axis=0))
+        self.max = np.fmax(self.max, np.nanmax(np.where(valid, values, -np.inf), axis=0))
+
+    def std(self, ddof=1):
+        return np.sqrt(self.m2 / np.maximum(self.n - ddof, 1))
+
+
+def iter_training_chunks(columns, store_dir=STORE_DIR, csv_path=DRAFT_DATA_CSV, chunksize=100000):
+    # Same rows the model trains on (rounds 14/15 are forced K/DEF picks).
+    needed = list(dict.fromkeys(columns + ['round']))
+    store = FeatureStore(store_dir)
+    if len(store):
+        chunks = (pd.DataFrame(chunk) for chunk in store.iter_chunks(needed))
+    else:
+        chunks = pd.read_csv(csv_path, usecols=needed, chunksize=chunksize)
+    for chunk in chunks:
+        yield chunk.loc[~chunk['round'].isin(EXCLUDED_ROUNDS), columns]
+
+
+def compute_stats(bounded_cols=BOUNDED_COLS, vor_cols=VOR_COLS, store_dir=STORE_DIR, csv_path=DRAFT_DATA_CSV):
+    columns = bounded_cols + vor_cols
+    running = RunningStats(len(columns))
+    for chunk in iter_training_chunks(columns, store_dir, csv_path):
+        running.update(chunk.to_numpy(dtype=float))
+
+    std = running.std()
+    stats = {
+        'version': STATS_VERSION,
+        'rows': int(running.n.max()),
+        'excluded_rounds': EXCLUDED_ROUNDS,
+        'minmax': {col: {'min': float(running.min[i]), 'max': float(running.max[i])}
+                   for i, col in enumerate(columns) if col in bounded_cols},
+        'standard': {col: {'mean': float(running.mean[i]), 'std': float(std[i])}
+                     for i, col in enumerate(columns) if col in vor_cols}
+    }
+    # Fingerprint of the values, so consumers can tell which fit they hold.
+    payload = json.dumps([stats['minmax'], stats['standard']], sort_keys=True).encode()
+    stats['fingerprint'] = hashlib.sha256(payload).hexdigest()[:16]
+    return stats
+
+
+def write_stats(stats, path=STATS_PATH):
+    tmp_path = f'{path}.tmp'
+    with open(tmp_path, 'w') as f:
+        json.dump(stats, f, indent=2)
+    os.replace(tmp_path, path)
+
+
+def load_stats(path=STATS_PATH):
+    with open(path) as f:
+        stats = json.load(f)
+    if stats.get('version') != STATS_VERSION:
+        raise ValueError(f"Unsupported normalization stats version in {path}")
+    return stats
+
+
+def minmax_ranges(stats, columns=BOUNDED_COLS):
+    return {col: (stats['minmax'][col]['min'], stats['minmax'][col]['max']) for col in columns}
+
+
+def training_minmax(path=STATS_PATH):
+    # The artifact is the single source of scaling for training, evaluation
+    # and the draft page; it is only computed here if it has never been built.
+    if not os.path.exists(path):
+        write_stats(compute_stats(), path)
+    return minmax_ranges(load_stats(path))
@@ -0,0 +1,113 @@
+import json
+import os
+
+import numpy as np
+
+from draft_model import MODEL_DIR, POSITION_CLASSES
+from instrumentation import stage
+
+DTYPES = {
+    'float32': np.float32,
+    'int32': np.int32
+}
+
+# Keras defaults used by the notebook's layers.
+LEAKY_RELU_ALPHA = 0.3
+LAYER_NORM_EPSILON = 1e-3
+
+
+def load_weights(model_dir=MODEL_DIR, manifest_name='model.json'):
+    # Reads a TensorFlow.js layers-model weights manifest. Weights are
+    # memory-mapped straight out of the shard files rather than copied.
+    with open(os.path.join(model_dir, manifest_name)) as f:
+        manifest = json.load(f)
+    weights = {}
+    for group in manifest['weightsManifest']:
+        shards = [np.memmap(os.path.join(model_dir, path), dtype=np.uint8, mode='r') for path in group['paths']]
+        buffer = shards[0] if len(shards) == 1 else np.concatenate(shards)
+        offset = 0
+        for spec in group['weights']:
+            size = int(np.prod(spec['shape'])) if spec['shape'] else 1
+            weights[spec['name']], offset = _read_weight(buffer, offset, spec, size)
+    return weights
+
+
+def _read_weight(buffer, offset, spec, size):
+    quantization = spec.get('quantization')
+    if quantization is None:
+        dtype = DTYPES[spec['dtype']]
+        end = offset + size * np.dtype(dtype).itemsize
+        return buffer[offset:end].view(dtype).reshape(spec['shape']), end
+
+    q_dtype = np.dtype(quantization['dtype'])
+    end = offset + size * q_dtype.itemsize
+    raw = buffer[offset:end].view(q_dtype)
+    if q_dtype == np.float16:
+        values = raw.astype(np.float32)
+    else:
+        values = raw.astype(np.float32) * quantization['scale'] + quantization['min']
+    return values.reshape(spec['shape']), end
+
+
+def _layer_groups(weights):
+    # Layer name -> {'kernel': ..., 'bias': ...}, in manifest order.
+    layers = {}
+    for name, value in weights.items():
+        layer, param = name.rsplit('/', 1)
+        layers.setdefault(layer, {})[param] = value
+    return list(layers.values())
+
+
+def leaky_relu(x, alpha=LEAKY_RELU_ALPHA):
+    return np.where(x >= 0, x, x * alpha)
+
+
+def layer_norm(x, gamma, beta, epsilon=LAYER_NORM_EPSILON):
+    mean = x.mean(axis=-1, keepdims=True)
+    var = x.var(axis=-1, keepdims=True)
+    return (x - mean) / np.sqrt(var + epsilon) * gamma + beta
+
+
+def softmax(x):
+    z = np.exp(x - x.max(axis=-1, keepdims=True))
+    return z / z.sum(axis=-1, keepdims=True)
+
+
+class NumpyDraftModel:
+    # Inference-only copy of the notebook network: four Dense -> LeakyReLU ->
+    # LayerNorm blocks (dropout is a no-op at inference) and a softmax head over
+    # the concatenation of the input and every block output.
+    def __init__(self, model_dir=MODEL_DIR, manifest_name='model.json', chunk_size=8192):
+        layers = _layer_groups(load_weights(model_dir, manifest_name))
+        hidden, head = layers[:-1], layers[-1]
+        self.blocks = [(dense['kernel'], dense['bias'], norm['gamma'], norm['beta'])
+                       for dense, norm in zip(hidden[0::2], hidden[1::2])]
+        self.head_bias = head['bias']
+        # Split the head kernel by concat segment so the concatenated
+        # activations never need to be materialised.
+        widths = [self.blocks[0][0].shape[0]] + [kernel.shape[1] for kernel, _, _, _ in self.blocks]
+        bounds = np.cumsum([0] + widths)
+        if bounds[-1] != head['kernel'].shape[0]:
+            raise ValueError(f"Head expects {head['kernel'].shape[0]} inputs, blocks produce {bounds[-1]}")
+        self.head_kernels = [head['kernel'][start:end] for start, end in zip(bounds[:-1], bounds[1:])]
+        self.n_features = widths[0]
+        self.classes = POSITION_CLASSES
+        self.chunk_size = chunk_size
+
+    def _forward(self, x):
+        logits = x @ self.head_kernels[0] + self.head_bias
+        for (kernel, bias, gamma, beta), head_kernel in zip(self.blocks, self.head_kernels[1:]):
+            x = layer_norm(leaky_relu(x @ kernel + bias), gamma, beta)
+            logits += x @ head_kernel
+        return softmax(logits)
+
+    def predict(self, features):
+        features = np.asarray(features, dtype=np.float32)
+        if features.ndim == 1:
+            features = features[None, :]
+        with stage('inference') as s:
+            s.add(items=len(features))
+            if len(features) <= self.chunk_size:
+                return self._forward(features)
+            return np.concatenate([self._forward(features[i:i + self.chunk_size])
+                                   for i in range(0, len(features), self.chunk_size)])
@@ -0,0 +1,155 @@
+import argparse
+import json
+import os
+
+import numpy as np
+from scipy.special import ndtr
+
+from batch_replay import cached_draft_paths
+from draft_state import SCORING_MAP
+from sleeper_client import CACHE_DIR
+
+SURVIVAL_PATH = '../data/2025/pick_survival.npz'
+SCORING_TYPES = list(SCORING_MAP)
+
+# Pseudo-draft weight of the normal fit blended into the empirical survival
+# curve; players seen in only a handful of drafts lean on the fit.
+PRIOR_WEIGHT = 4.0
+MIN_SD = 1.5
+
+
+def read_cached_picks(paths):
+    # {scoring_type: [(n_picks, {player_id: pick_no})]}, one entry per draft.
+    drafts = {scoring: [] for scoring in SCORING_TYPES}
+    for path in paths:
+        with open(path) as f:
+            raw = json.load(f)
+        scoring = raw['draft'].get('metadata', {}).get('scoring_type')
+        if scoring not in drafts or not raw['picks']:
+            continue
+        picks = {str(p['player_id']): int(p['pick_no']) for p in raw['picks']}
+        drafts[scoring].append((max(picks.values()), picks))
+    return drafts
+
+
+def survival_table(player_ids, drafts, max_pick):
+    n_players = len(player_ids)
+    rows = {pid: i for i, pid in enumerate(player_ids)}
+    n_drafts = len(drafts)
+    picks_axis = np.arange(max_pick + 2)
+
+    # Empirical survival: share of drafts in which the player was still on
+    # the board at pick n (undrafted counts as surviving the whole draft).
+    taken_at = np.zeros((n_players, max_pick + 2))
+    picks = [[] for _ in range(n_players)]
+    for _, draft in drafts:
+        for pid, pick_no in draft.items():
+            i = rows[pid]
+            taken_at[i, pick_no] += 1
+            picks[i].append(pick_no)
+    empirical = 1.0 - np.cumsum(taken_at, axis=1)[:, :-1] / max(n_drafts, 1)
+    empirical = np.hstack([np.ones((n_players, 1)), empirical])[:, :max_pick + 2]
+
+    count = np.array([len(p) for p in picks], dtype=np.int32)
+    adp = np.array([np.mean(p) if p else np.nan for p in picks])
+    sd = np.array([np.std(p, ddof=1) if len(p) > 1 else np.nan for p in picks])
+
+    # Spread prior grows with ADP (late picks scatter more); fitted as the
+    # median sd/ADP ratio of well-observed players.
+    well_observed = count >= 5
+    ratio = np.nanmedian(sd[well_observed] / adp[well_observed]) if well_observed.any() else 0.15
+    prior_sd = np.maximum(MIN_SD, ratio * np.nan_to_num(adp))
+    sd = np.where(np.isnan(sd), prior_sd,
+                  np.sqrt((np.nan_to_num(sd) ** 2 * np.maximum(count - 1, 0) + prior_sd ** 2 * PRIOR_WEIGHT)
+                          / (np.maximum(count - 1, 0) + PRIOR_WEIGHT)))
+
+    drafted_share = count / max(n_drafts, 1)
+    z = (picks_axis[None, :] - 0.5 - np.nan_to_num(adp)[:, None]) / sd[:, None]
+    fitted = 1.0 - drafted_share[:, None] * ndtr(z)
+    fitted[:, :2] = 1.0
+
+    survival = (n_drafts * empirical + PRIOR_WEIGHT * fitted) / (n_drafts + PRIOR_WEIGHT)
+    return {
+        'survival': np.round(np.clip(survival, 0, 1) * 255).astype(np.uint8),
+        'adp': adp.astype(np.float32),
+        'sd': sd.astype(np.float32),
+        'count': count,
+        'n_drafts': np.int32(n_drafts)
+    }
+
+
+class PickSurvival:
+    # Per scoring type, a (players x picks) uint8 table of P(player is still
+    # available at pick n). Lookups are a dict hit plus an array index.
+    def __init__(self, player_ids, tables):
+        self.player_ids = np.asarray(player_ids)
+        self.rows = {pid: i for i, pid in enumerate(self.player_ids.tolist())}
+        self.tables = tables
+
+    @classmethod
+    def build(cls, cache_dir=CACHE_DIR):
+        drafts = read_cached_picks(cached_draft_paths(cache_dir))
+        if not any(drafts.values()):
+            raise ValueError(f"No cached drafts in {cache_dir}")
+        player_ids = sorted({pid for scoring in drafts.values() for _, picks in scoring for pid in picks})
+        max_pick = max(n for scoring in drafts.values() for n, _ in scoring)
+        tables = {scoring: survival_table(player_ids, drafts[scoring], max_pick) for scoring in SCORING_TYPES}
+        return cls(player_ids, tables)
+
+    def save(self, path=SURVIVAL_PATH):
+        arrays = {'player_ids': self.player_ids.astype(str)}
+        for scoring, table in self.tables.items():
+            for name, values in table.items():
+                arrays[f'{scoring}_{name}'] = values
+        tmp_path = f'{path}.tmp.npz'
+        np.savez_compressed(tmp_path, **arrays)
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path=SURVIVAL_PATH):
+        with np.load(path) as f:
+            tables = {scoring: {name: f[f'{scoring}_{name}'] for name in
+                                ['survival', 'adp', 'sd', 'count', 'n_drafts']}
+                      for scoring in SCORING_TYPES}
+            return cls(f['player_ids'], tables)
+
+    def survival(self, player_id, pick_no, scoring_type='ppr'):
+        # Players never drafted in the history are assumed to survive.
+        row = self.rows.get(str(player_id))
+        if row is None:
+            return 1.0
+        table = self.tables[scoring_type]['survival']
+        return table[row, min(pick_no, table.shape[1] - 1)] / 255.0
+
+    def survival_many(self, player_ids, pick_no, scoring_type='ppr'):
+        table = self.tables[scoring_type]['survival']
+        rows = np.array([self.rows.get(str(pid), -1) for pid in player_ids])
+        probs = table[np.maximum(rows, 0), min(pick_no, table.shape[1] - 1)] / 255.0
+        return np.where(rows >= 0, probs, 1.0)
+
+    def adp(self, player_id, scoring_type='ppr'):
+        row = self.rows.get(str(player_id))
+        if row is None:
+            return None
+        table = self.tables[scoring_type]
+        return float(table['adp'][row]), float(table['sd'][row]), int(table['count'][row])
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Build pick-survival tables from cached Sleeper drafts.')
+    parser.add_argument('--cache-dir', default=CACHE_DIR)
+    parser.add_argument('--output', default=SURVIVAL_PATH)
+    args = parser.parse_args()
+
+    index = PickSurvival.build(args.cache_dir)
+    index.save(args.output)
+    print(f"Wrote {args.output}: {len(index.player_ids)} players, {os.path.getsize(args.output)} bytes")
+    for scoring in SCORING_TYPES:
+        table = index.tables[scoring]
+        order = np.argsort(np.nan_to_num(table['adp'], nan=np.inf))[:5]
+        top = ', '.join(f"{index.player_ids[i]} ({table['adp'][i]:.1f}±{table['sd'][i]:.1f})" for i in order)
+        print(f"{scoring:<8} {int(table['n_drafts'])} drafts; earliest ADP: {top}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,241 @@
+import argparse
+import fnmatch
+import glob
+import hashlib
+import json
+import os
+import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+DATA_DIR = '../data/2025'
+STATE_PATH = '../data/cache/pipeline_state.json'
+LOG_DIR = '../data/cache/pipeline_logs'
+
+RAW_PROJECTIONS = [f'{DATA_DIR}/projections_{name}.csv' for name in ['non_ppr', 'half_ppr', 'ppr']]
+POSITION_PROJECTIONS = [f'{DATA_DIR}/{pos}_projections.csv' for pos in ['qb', 'rb', 'wr', 'te', 'k']]
+PROJECTIONS_FULL = f'{DATA_DIR}/projections_full.csv'
+DST_PROJECTIONS = f'{DATA_DIR}/dst_projections.csv'
+BYE_FILES = POSITION_PROJECTIONS + [PROJECTIONS_FULL, DST_PROJECTIONS]
+CACHED_DRAFTS = '../data/cache/sleeper/drafts/*.json'
+
+
+class Stage:
+    # A script run from this directory. Inputs and outputs are paths or glob
+    # patterns; a stage depends on every stage whose outputs it reads.
+    def __init__(self, name, command, inputs, outputs):
+        self.name = name
+        self.command = command
+        self.inputs = [os.path.normpath(p) for p in inputs]
+        self.outputs = [os.path.normpath(p) for p in outputs]
+
+    def input_paths(self):
+        return expand(self.inputs)
+
+    def missing_outputs(self):
+        return [p for p in self.outputs if not glob.glob(p)]
+
+    def reads(self, other):
+        return self is not other and any(
+            fnmatch.fnmatch(i, o) or fnmatch.fnmatch(o, i) for i in self.inputs for o in other.outputs)
+
+
+STAGES = [
+    Stage('projections', ['prediction_data_preprocessing.py'],
+          inputs=RAW_PROJECTIONS + [f'{DATA_DIR}/player_universe.npz', 'prediction_data_preprocessing.py',
+                                    'player_index.py', 'player_universe.py'],
+          outputs=POSITION_PROJECTIONS + [PROJECTIONS_FULL]),
+    # add_byes.py edits its inputs in place; it only rewrites files whose
+    # bye weeks changed, so an unchanged schedule leaves the hashes alone.
+    Stage('byes', ['add_byes.py'] + [os.path.basename(p) for p in BYE_FILES],
+          inputs=BYE_FILES + ['add_byes.py'],
+          outputs=BYE_FILES),
+    # Collection only fills the draft cache; 'features' replays the whole
+    # cache whenever new drafts land or projections or the feature code change.
+    Stage('drafts', ['draft_data_collection.py'],
+          inputs=['draft_data_collection.py', 'sleeper_client.py'],
+          outputs=[CACHED_DRAFTS]),
+    Stage('features', ['batch_replay.py', '--rebuild'],
+          inputs=POSITION_PROJECTIONS + [DST_PROJECTIONS, CACHED_DRAFTS, 'batch_replay.py', 'draft_state.py',
+                                         'feature_store.py'],
+          outputs=[f'{DATA_DIR}/all_draft_data.csv']),
+    Stage('survival', ['pick_survival.py'],
+          inputs=[CACHED_DRAFTS, 'pick_survival.py'],
+          outputs=[f'{DATA_DIR}/pick_survival.npz']),
+    Stage('formats', ['format_features.py'],
+          inputs=POSITION_PROJECTIONS + ['format_features.py', 'draft_simulator.py', 'draft_state.py'],
+          outputs=[f'{DATA_DIR}/format_draft_data.csv', f'{DATA_DIR}/replacement_levels.csv']),
+    Stage('stats', ['calculate_stats.py'],
+          inputs=[f'{DATA_DIR}/all_draft_data.csv', 'calculate_stats.py', 'normalization_stats.py'],
+          outputs=[f'{DATA_DIR}/normalization_stats.json']),
+    Stage('bundle', ['build_frontend_bundle.py'],
+          inputs=BYE_FILES + [f'{DATA_DIR}/normalization_stats.json', f'{DATA_DIR}/pick_survival.npz',
+                              'build_frontend_bundle.py'],
+          outputs=[f'{DATA_DIR}/bundle.json.gz']),
+    Stage('seasons', ['cleaning_past_data.py'],
+          inputs=['../data/20[0-9][0-9]/*_actual[0-9][0-9].csv', '../data/20[0-9][0-9]/*_projections[0-9][0-9].csv',
+                  '../data/20[0-9][0-9]/adp[0-9][0-9].csv', 'cleaning_past_data.py'],
+          outputs=['../data/20[0-9][0-9]/season[0-9][0-9]full.csv'])
+]
+
+
+def expand(patterns):
+    paths = []
+    for pattern in patterns:
+        paths.extend(sorted(glob.glob(pattern)) if glob.has_magic(pattern) else [pattern])
+    return paths
+
+
+def file_hash(path):
+    if not os.path.exists(path):
+        return None
+    h = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            h.update(block)
+    return h.hexdigest()
+
+
+def hash_inputs(stage):
+    return {path: file_hash(path) for path in stage.input_paths()}
+
+
+def levels(stages):
+    # Topological layers: every stage in a layer only reads outputs of
+    # earlier layers, so a layer's stages can run side by side.
+    deps = {s.name: {o.name for o in stages if s.reads(o)} for s in stages}
+    done = set()
+    layers = []
+    while len(done) < len(stages):
+        layer = [s for s in stages if s.name not in done and deps[s.name] <= done]
+        if not layer:
+            raise ValueError(f"Dependency cycle among {sorted(set(deps) - done)}")
+        layers.append(layer)
+        done.update(s.name for s in layer)
+    return layers, deps
+
+
+def select(stages, targets):
+    # The requested stages plus everything upstream of them.
+    if not targets:
+        return stages
+    _, deps = levels(stages)
+    wanted = set()
+    pending = list(targets)
+    while pending:
+        name = pending.pop()
+        if name not in wanted:
+            wanted.add(name)
+            pending.extend(deps[name])
+    return [s for s in stages if s.name in wanted]
+
+
+def stale_reason(stage, previous, force=False):
+    if force:
+        return 'forced'
+    if previous is None:
+        return 'never built'
+    missing = stage.missing_outputs()
+    if missing:
+        return f"missing {', '.join(missing)}"
+    changed = [path for path, h in hash_inputs(stage).items() if previous['inputs'].get(path) != h]
+    changed += [path for path in previous['inputs'] if path not in stage.input_paths()]
+    if changed:
+        return f"changed {', '.join(os.path.basename(p) for p in changed)}"
+    return None
+
+
+def run_stage(stage, log_dir=LOG_DIR):
+    os.makedirs(log_dir, exist_ok=True)
+    log_path = os.path.join(log_dir, f'{stage.name}.log')
+    t0 = time.perf_counter()
+    with open(log_path, 'w') as log:
+        result = subprocess.run([sys.executable] + stage.command, stdout=log, stderr=subprocess.STDOUT)
+    return result.returncode, time.perf_counter() - t0, log_path
+
+
+def load_state(path=STATE_PATH):
+    if not os.path.exists(path):
+        return {}
+    with open(path) as f:
+        return json.load(f)
+
+
+def save_state(state, path=STATE_PATH):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f'{path}.tmp'
+    with open(tmp_path, 'w') as f:
+        json.dump(state, f, indent=2)
+    os.replace(tmp_path, path)
+
+
+def run_pipeline(stages=STAGES, targets=None, force=False, dry_run=False, workers=None, state_path=STATE_PATH):
+    state = load_state(state_path)
+    layers, deps = levels(select(stages, targets))
+    report = []
+    failed = set()
+
+    for layer in layers:
+        to_run = []
+        for stage in layer:
+            blocked = deps[stage.name] & failed
+            if blocked:
+                failed.add(stage.name)
+                report.append((stage.name, 'blocked', 0.0, f"upstream {', '.join(sorted(blocked))} failed"))
+                continue
+            reason = stale_reason(stage, state.get(stage.name), force)
+            if reason is None:
+                report.append((stage.name, 'up to date', 0.0, ''))
+            elif dry_run:
+                report.append((stage.name, 'would run', 0.0, reason))
+            else:
+                to_run.append((stage, reason))
+
+        with ThreadPoolExecutor(max_workers=workers or max(len(to_run), 1)) as executor:
+            results = list(executor.map(lambda item: run_stage(item[0]), to_run))
+
+        for (stage, reason), (returncode, seconds, log_path) in zip(to_run, results):
+            if returncode:
+                failed.add(stage.name)
+                report.append((stage.name, 'failed', seconds, f"{reason}; see {log_path}"))
+                continue
+            # Inputs are hashed after the run, so a stage that edits its own
+            # inputs in place (add_byes.py) is not stale on the next run.
+            state[stage.name] = {
+                'inputs': hash_inputs(stage),
+                'outputs': {path: file_hash(path) for path in expand(stage.outputs)},
+                'seconds': round(seconds, 3),
+                'finished': time.strftime('%Y-%m-%dT%H:%M:%S')
+            }
+            report.append((stage.name, 'ran', seconds, reason))
+        if to_run:
+            save_state(state, state_path)
+
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Rebuild the data pipeline stages whose inputs changed.')
+    parser.add_argument('targets', nargs='*',
+                        help='Stages to bring up to date (with their upstream stages); default all')
+    parser.add_argument('--force', action='store_true', help='Rerun every selected stage')
+    parser.add_argument('--dry-run', action='store_true', help='Only show which stages would run')
+    parser.add_argument('--workers', type=int, default=None)
+    args = parser.parse_args()
+    unknown = set(args.targets) - {s.name for s in STAGES}
+    if unknown:
+        parser.error(f"unknown stages: {', '.join(sorted(unknown))}")
+
+    t0 = time.perf_counter()
+    report = run_pipeline(STAGES, args.targets, args.force, args.dry_run, args.workers)
+    print(f"{'stage':<12} {'status':<11} {'seconds':>8}  reason")
+    for name, status, seconds, reason in report:
+        print(f"{name:<12} {status:<11} {seconds:>8.2f}  {reason}")
+    print(f"Total wall time {time.perf_counter() - t0:.2f}s")
+    if any(status in ('failed', 'blocked') for _, status, _, _ in report):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
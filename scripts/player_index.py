@@ -0,0 +1,222 @@
+import difflib
+import json
+import os
+import re
+import unicodedata
+
+import pandas as pd
+
+PLAYER_DATA = '../data/2025/player_data.csv'
+INDEX_PATH = '../data/2025/player_index.json'
+INDEX_VERSION = 1
+
+FANTASY_POSITIONS = ['QB', 'RB', 'WR', 'TE', 'K', 'DEF']
+
+# Projection sources and Sleeper disagree on a few abbreviations.
+TEAM_ALIASES = {
+    'JAC': 'JAX',
+    'LVR': 'LV',
+    'OAK': 'LV',
+    'WSH': 'WAS',
+    'LA': 'LAR',
+    'STL': 'LAR',
+    'SD': 'LAC'
+}
+
+POSITION_ALIASES = {
+    'DST': 'DEF',
+    'D/ST': 'DEF',
+    'PK': 'K'
+}
+
+SUFFIXES = {'jr', 'sr', 'ii', 'iii', 'iv', 'v'}
+
+
+def normalize_name(name):
+    if not isinstance(name, str):
+        return ''
+    name = unicodedata.normalize('NFKD', name).encode('ascii', 'ignore').decode()
+    words = re.sub(r"[.'\-]", '', name.lower()).split()
+    while len(words) > 1 and words[-1] in SUFFIXES:
+        words.pop()
+    return ' '.join(words)
+
+
+def normalize_team(team):
+    if not isinstance(team, str):
+        return ''
+    team = team.strip().upper()
+    return TEAM_ALIASES.get(team, team)
+
+
+def normalize_position(position):
+    if not isinstance(position, str):
+        return ''
+    position = re.sub(r'\d+$', '', position.strip().upper())
+    return POSITION_ALIASES.get(position, position)
+
+
+def _key(*parts):
+    return '|'.join(parts)
+
+
+def load_player_data(path=PLAYER_DATA):
+    if path.endswith('.npz'):
+        from player_universe import load_universe
+        df = load_universe(path)[['player_id', 'full_name', 'team', 'position', 'active']]
+    else:
+        df = pd.read_csv(
+            path,
+            usecols=['player_id', 'full_name', 'team', 'position', 'active'],
+            dtype={'player_id': str, 'full_name': str, 'team': 'category', 'position': 'category', 'active': 'boolean'}
+        )
+    return df[df['position'].isin(FANTASY_POSITIONS)]
+
+
+def entry_keys(full_name, team, position):
+    # Every (table, key) a player occupies; buckets are keyed by (bucket, name).
+    name = normalize_name(full_name)
+    if not name:
+        return set()
+    team = normalize_team(team)
+    pos = normalize_position(position)
+    keys = {('exact', _key(name, team, pos)), ('name_pos', _key(name, pos))}
+    if team:
+        keys.add(('last_team_pos', _key(name.split()[-1], team, pos)))
+        keys.add(('buckets', (_key(team, pos), name)))
+    return keys
+
+
+class PlayerIndex:
+    # Name/team/position -> Sleeper player_id. Lookups try the exact key first,
+    # then progressively looser keys, and only fall back to fuzzy string
+    # matching within a small team/position bucket.
+    def __init__(self, data, source=None):
+        self.source = source
+        self.exact = data['exact']
+        self.name_pos = data['name_pos']
+        self.last_team_pos = data['last_team_pos']
+        self.buckets = data['buckets']
+
+    @classmethod
+    def build(cls, player_df, source=None):
+        exact, name_pos, last_team_pos, buckets = {}, {}, {}, {}
+        # Rostered, active players win key collisions over retired namesakes.
+        rank = (~player_df['active'].fillna(False)).astype(int) + player_df['team'].isna().astype(int)
+        for row in player_df.assign(_rank=rank).sort_values('_rank', kind='stable').itertuples():
+            name = normalize_name(row.full_name)
+            if not name:
+                continue
+            team = normalize_team(row.team)
+            pos = normalize_position(row.position)
+            exact.setdefault(_key(name, team, pos), row.player_id)
+            name_pos.setdefault(_key(name, pos), []).append(row.player_id)
+            if team:
+                last_team_pos.setdefault(_key(name.split()[-1], team, pos), []).append(row.player_id)
+                buckets.setdefault(_key(team, pos), {}).setdefault(name, row.player_id)
+        return cls({'exact': exact, 'name_pos': name_pos, 'last_team_pos': last_team_pos, 'buckets': buckets}, source)
+
+    def update(self, player_df, old_rows, new_rows, source=None):
+        # Re-derive only the keys the changed players held before or hold
+        # now, from every player sharing one of those keys; the result matches
+        # a full rebuild without rescanning the whole universe.
+        affected = set()
+        for rows in (old_rows, new_rows):
+            for row in rows.itertuples():
+                affected |= entry_keys(row.full_name, row.team, row.position)
+        if affected:
+            sharing = [bool(entry_keys(row.full_name, row.team, row.position) & affected)
+                       for row in player_df.itertuples()]
+            partial = PlayerIndex.build(player_df[sharing])
+            for table, key in affected:
+                if table == 'buckets':
+                    bucket, name = key
+                    value = partial.buckets.get(bucket, {}).get(name)
+                    target = self.buckets.setdefault(bucket, {})
+                    key = name
+                else:
+                    value = getattr(partial, table).get(key)
+                    target = getattr(self, table)
+                if value is None:
+                    target.pop(key, None)
+                else:
+                    target[key] = value
+        self.source = source
+
+    @classmethod
+    def load(cls, path=INDEX_PATH):
+        with open(path) as f:
+            data = json.load(f)
+        if data.get('version') != INDEX_VERSION:
+            raise ValueError(f"Unsupported player index version in {path}")
+        return cls(data, data.get('source'))
+
+    @classmethod
+    def load_or_build(cls, player_data_path=PLAYER_DATA, index_path=INDEX_PATH):
+        source = _source_signature(player_data_path)
+        if os.path.exists(index_path):
+            index = cls.load(index_path)
+            if index.source == source:
+                return index
+        index = cls.build(load_player_data(player_data_path), source)
+        index.save(index_path)
+        return index
+
+    def save(self, path=INDEX_PATH):
+        data = {
+            'version': INDEX_VERSION,
+            'source': self.source,
+            'exact': self.exact,
+            'name_pos': self.name_pos,
+            'last_team_pos': self.last_team_pos,
+            'buckets': self.buckets
+        }
+        tmp_path = f'{path}.tmp'
+        with open(tmp_path, 'w') as f:
+            json.dump(data, f, separators=(',', ':'))
+        os.replace(tmp_path, path)
+
+    def match(self, name, team=None, position=None):
+        name = normalize_name(name)
+        team = normalize_team(team)
+        pos = normalize_position(position)
+
+        player_id = self.exact.get(_key(name, team, pos))
+        if player_id is not None:
+            return player_id
+        candidates = self.name_pos.get(_key(name, pos), [])
+        if len(candidates) == 1:
+            return candidates[0]
+        # Nicknames (Chig/Chigoziem, Cam/Cameron) usually keep the last name.
+        candidates = self.last_team_pos.get(_key(name.split()[-1] if name else '', team, pos), [])
+        if len(candidates) == 1:
+            return candidates[0]
+        bucket = self.buckets.get(_key(team, pos), {})
+        close = difflib.get_close_matches(name, list(bucket), n=1, cutoff=0.8)
+        if close:
+            return bucket[close[0]]
+        return None
+
+    def match_frame(self, df, name_col='name', team_col='team', position_col='position'):
+        return pd.Series(
+            [self.match(name, team, pos) for name, team, pos in zip(df[name_col], df[team_col], df[position_col])],
+            index=df.index,
+            dtype=object
+        )
+
+
+def _source_signature(path):
+    if path.endswith('.npz'):
+        # Tagged with the snapshot's content version, so a sync that changes
+        # nothing the index uses never forces a rebuild.
+        from player_universe import snapshot_version
+        return {'universe': snapshot_version(path)}
+    stat = os.stat(path)
+    return {'path': os.path.basename(path), 'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns}
+
+
+def report_matches(df, player_ids, name_col='name'):
+    matched = player_ids.notna()
+    print(f"Matched {matched.sum()}/{len(df)} players to Sleeper IDs ({matched.mean():.1%})")
+    for _, row in df[~matched].iterrows():
+        print(f"  Unmatched: {row[name_col]} ({row.get('team', '')} {row.get('position', '')})")
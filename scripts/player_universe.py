@@ -0,0 +1,296 @@
+import argparse
+import hashlib
+import json
+import os
+import time
+
+import numpy as np
+import pandas as pd
+import requests
+
+from instrumentation import stage
+from sleeper_client import SLEEPER_API, SleeperClient
+
+UNIVERSE_PATH = '../data/2025/player_universe.npz'
+CHANGES_PATH = '../data/cache/player_universe_changes.jsonl'
+PLAYER_DATA = '../data/2025/player_data.csv'
+PLAYERS_ENDPOINT = '/players/nfl'
+UNIVERSE_VERSION = 1
+
+# Sleeper asks callers to fetch the full player list at most once a day.
+REFRESH_INTERVAL = 24 * 3600
+
+STRING_COLUMNS = ['player_id', 'full_name', 'first_name', 'last_name']
+CATEGORY_COLUMNS = ['team', 'position', 'status', 'injury_status']
+NUMERIC_COLUMNS = ['years_exp', 'age', 'search_rank', 'depth_chart_order', 'number']
+BOOLEAN_COLUMNS = ['active']
+COLUMNS = STRING_COLUMNS + CATEGORY_COLUMNS + NUMERIC_COLUMNS + BOOLEAN_COLUMNS
+# A change in any of these counts as a changed player.
+TRACKED_COLUMNS = COLUMNS[1:]
+# The fields PlayerIndex keys on; other changes never touch the index.
+INDEX_COLUMNS = ['full_name', 'team', 'position', 'active']
+
+
+def typed_frame(df):
+    df = df.reindex(columns=COLUMNS)
+    typed = {}
+    for col in STRING_COLUMNS:
+        typed[col] = df[col].astype('string')
+    for col in CATEGORY_COLUMNS:
+        typed[col] = df[col].astype('string').astype('category')
+    for col in NUMERIC_COLUMNS:
+        typed[col] = pd.to_numeric(df[col], errors='coerce').astype('float32')
+    for col in BOOLEAN_COLUMNS:
+        values = df[col].map({True: True, False: False, 'True': True, 'False': False, 'true': True, 'false': False})
+        typed[col] = values.astype('boolean')
+    typed = pd.DataFrame(typed)
+    typed = typed[typed['player_id'].notna()].reset_index(drop=True)
+    typed['row_hash'] = row_hashes(typed)
+    return typed
+
+
+def row_hashes(df):
+    # Hashed on the string form so categories and float widths never make
+    # equal rows look different.
+    return pd.util.hash_pandas_object(df[TRACKED_COLUMNS].astype('string'), index=False).to_numpy()
+
+
+def frame_from_payload(players):
+    return typed_frame(pd.DataFrame.from_records(list(players.values()), columns=COLUMNS))
+
+
+def universe_version(df):
+    # Content hash independent of row order, used as the index's source tag.
+    player_ids = df['player_id'].to_numpy(dtype=str)
+    order = np.argsort(player_ids, kind='stable')
+    h = hashlib.sha256('\n'.join(player_ids[order]).encode())
+    h.update(df['row_hash'].to_numpy(dtype=np.uint64)[order].tobytes())
+    return h.hexdigest()[:16]
+
+
+def save_universe(df, path=UNIVERSE_PATH):
+    arrays = {}
+    for col in STRING_COLUMNS:
+        arrays[col] = df[col].fillna('').to_numpy(dtype=str)
+    for col in CATEGORY_COLUMNS:
+        arrays[f'{col}.codes'] = df[col].cat.codes.to_numpy(dtype=np.int16)
+        arrays[f'{col}.categories'] = df[col].cat.categories.to_numpy(dtype=str)
+    for col in NUMERIC_COLUMNS:
+        arrays[col] = df[col].to_numpy(dtype=np.float32)
+    for col in BOOLEAN_COLUMNS:
+        arrays[col] = df[col].astype('Int8').fillna(-1).to_numpy(dtype=np.int8)
+    arrays['row_hash'] = df['row_hash'].to_numpy(dtype=np.uint64)
+    tmp_path = f'{path}.tmp.npz'
+    np.savez_compressed(tmp_path, **arrays)
+    os.replace(tmp_path, path)
+
+
+def load_universe(path=UNIVERSE_PATH):
+    with np.load(path) as f:
+        data = {}
+        for col in STRING_COLUMNS:
+            data[col] = pd.array(f[col], dtype='string')
+            data[col][data[col] == ''] = pd.NA
+        for col in CATEGORY_COLUMNS:
+            data[col] = pd.Categorical.from_codes(f[f'{col}.codes'], categories=f[f'{col}.categories'])
+        for col in NUMERIC_COLUMNS:
+            data[col] = f[col]
+        for col in BOOLEAN_COLUMNS:
+            data[col] = pd.array(np.where(f[col] < 0, None, f[col] > 0), dtype='boolean')
+        data['row_hash'] = f['row_hash']
+    return pd.DataFrame(data)
+
+
+def meta_path(universe_path=UNIVERSE_PATH):
+    # Sync state is rewritten on every check, so it lives in the git-ignored
+    # cache dir beside the snapshot's season dir rather than next to the
+    # committed snapshot. Interval checks never open the snapshot itself.
+    root = os.path.dirname(os.path.dirname(os.path.abspath(universe_path)))
+    name = os.path.splitext(os.path.basename(universe_path))[0]
+    return os.path.join(root, 'cache', f'{name}.json')
+
+
+def snapshot_version(universe_path=UNIVERSE_PATH):
+    # A fresh checkout has no sync state yet, so fall back to hashing the
+    # snapshot.
+    return load_meta(meta_path(universe_path)).get('version') or universe_version(load_universe(universe_path))
+
+
+def load_meta(path):
+    if not os.path.exists(path):
+        return {}
+    with open(path) as f:
+        meta = json.load(f)
+    return meta if meta.get('format') == UNIVERSE_VERSION else {}
+
+
+def save_meta(meta, path):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f'{path}.tmp'
+    with open(tmp_path, 'w') as f:
+        json.dump({'format': UNIVERSE_VERSION, **meta}, f, indent=2)
+    os.replace(tmp_path, path)
+
+
+def diff_universe(old, new):
+    old_hash = pd.Series(old['row_hash'].to_numpy(), index=old['player_id'].to_numpy())
+    new_hash = pd.Series(new['row_hash'].to_numpy(), index=new['player_id'].to_numpy())
+    common = old_hash.index.intersection(new_hash.index)
+    changed = common[old_hash[common].to_numpy() != new_hash[common].to_numpy()]
+
+    fields = {}
+    if len(changed):
+        before = old.set_index('player_id').loc[changed, TRACKED_COLUMNS].astype('string')
+        after = new.set_index('player_id').loc[changed, TRACKED_COLUMNS].astype('string')
+        differs = before.fillna('\0').ne(after.fillna('\0'))
+        for player_id, row in differs.iterrows():
+            fields[player_id] = [col for col in TRACKED_COLUMNS if row[col]]
+    return {
+        'added': new_hash.index.difference(old_hash.index).tolist(),
+        'removed': old_hash.index.difference(new_hash.index).tolist(),
+        'changed': fields
+    }
+
+
+def apply_diff(old, new, diff):
+    # Surviving players keep their row positions and new ones are appended,
+    # so anything keyed by row stays valid for unchanged players.
+    removed = set(diff['removed'])
+    order = [pid for pid in old['player_id'] if pid not in removed] + list(diff['added'])
+    return new.set_index('player_id').loc[order].reset_index()[new.columns]
+
+
+def diff_summary(diff):
+    counts = {}
+    for cols in diff['changed'].values():
+        for col in cols:
+            counts[col] = counts.get(col, 0) + 1
+    return {'added': len(diff['added']), 'removed': len(diff['removed']), 'changed': len(diff['changed']),
+            'fields': counts}
+
+
+def update_player_index(diff, old, new, old_version, new_version):
+    # Invalidation hook: patch the persisted PlayerIndex for just the players
+    # whose index fields moved. An index built from anything else is left
+    # for load_or_build to rebuild.
+    from player_index import FANTASY_POSITIONS, INDEX_PATH, PlayerIndex
+
+    if not os.path.exists(INDEX_PATH):
+        return
+    index = PlayerIndex.load(INDEX_PATH)
+    if index.source != {'universe': old_version}:
+        return
+    touched = [pid for pid, cols in diff['changed'].items() if set(cols) & set(INDEX_COLUMNS)]
+    old_rows = old[old['player_id'].isin(touched + diff['removed'])]
+    new_rows = new[new['player_id'].isin(touched + diff['added'])]
+    fantasy = new[new['position'].isin(FANTASY_POSITIONS)]
+    index.update(fantasy, old_rows[old_rows['position'].isin(FANTASY_POSITIONS)],
+                 new_rows[new_rows['position'].isin(FANTASY_POSITIONS)], {'universe': new_version})
+    index.save(INDEX_PATH)
+
+
+INVALIDATION_HOOKS = [update_player_index]
+
+
+def log_changes(diff, old_version, new_version, path=CHANGES_PATH):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'a') as f:
+        f.write(json.dumps({'at': time.strftime('%Y-%m-%dT%H:%M:%S'), 'from': old_version, 'to': new_version,
+                            **diff}) + '\n')
+
+
+def fetch_players(client, meta):
+    # Conditional GET: with a stored ETag / Last-Modified an unchanged list
+    # costs one empty 304.
+    headers = {}
+    if meta.get('etag'):
+        headers['If-None-Match'] = meta['etag']
+    if meta.get('last_modified'):
+        headers['If-Modified-Since'] = meta['last_modified']
+    with stage('http_fetch') as s:
+        response = client.session.get(f'{client.base_url}{PLAYERS_ENDPOINT}', headers=headers, timeout=client.timeout)
+        s.add(nbytes=len(response.content), items=1)
+    if response.status_code == 304:
+        return None, response
+    response.raise_for_status()
+    return response.json(), response
+
+
+def sync_players(client=None, interval=REFRESH_INTERVAL, force=False, universe_path=UNIVERSE_PATH, hooks=None):
+    hooks = INVALIDATION_HOOKS if hooks is None else hooks
+    meta_file = meta_path(universe_path)
+    meta = load_meta(meta_file)
+    have_snapshot = os.path.exists(universe_path)
+    now = time.time()
+    if have_snapshot and not force and now - meta.get('checked_at', 0) < interval:
+        return {'status': 'fresh', 'bytes': 0}
+
+    client = client or SleeperClient(cache_dir=None)
+    payload, response = fetch_players(client, meta if have_snapshot else {})
+    meta.update(checked_at=now, etag=response.headers.get('ETag', meta.get('etag')),
+                last_modified=response.headers.get('Last-Modified', meta.get('last_modified')))
+    received = len(response.content)
+    if payload is None:
+        save_meta(meta, meta_file)
+        return {'status': 'not modified', 'bytes': received}
+
+    new = frame_from_payload(payload)
+    new_version = universe_version(new)
+    if not have_snapshot:
+        save_universe(new, universe_path)
+        save_meta({**meta, 'version': new_version, 'players': len(new)}, meta_file)
+        return {'status': 'created', 'bytes': received, 'players': len(new)}
+
+    old = load_universe(universe_path)
+    old_version = meta.get('version') or universe_version(old)
+    diff = diff_universe(old, new)
+    summary = diff_summary(diff)
+    if any(diff.values()):
+        updated = apply_diff(old, new, diff)
+        new_version = universe_version(updated)
+        save_universe(updated, universe_path)
+        log_changes(diff, old_version, new_version)
+        for hook in hooks:
+            hook(diff, old, updated, old_version, new_version)
+    else:
+        new_version = old_version
+    save_meta({**meta, 'version': new_version, 'players': len(new)}, meta_file)
+    return {'status': 'updated' if any(diff.values()) else 'unchanged', 'bytes': received, **summary}
+
+
+def seed_from_csv(csv_path=PLAYER_DATA, universe_path=UNIVERSE_PATH):
+    # One-off import of the old player_data.csv dump. No validators are
+    # stored, so the next sync downloads once and diffs against it.
+    df = typed_frame(pd.read_csv(csv_path, usecols=COLUMNS, dtype=str, keep_default_na=False, na_values=['']))
+    save_universe(df, universe_path)
+    save_meta({'checked_at': 0, 'etag': None, 'last_modified': None, 'version': universe_version(df),
+               'players': len(df)}, meta_path(universe_path))
+    return df
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Sync the local Sleeper player universe snapshot.')
+    parser.add_argument('--base-url', default=SLEEPER_API)
+    parser.add_argument('--interval', type=float, default=REFRESH_INTERVAL,
+                        help='Seconds before the snapshot is checked against Sleeper again')
+    parser.add_argument('--force', action='store_true', help='Check now, ignoring the interval')
+    parser.add_argument('--seed-csv', nargs='?', const=PLAYER_DATA,
+                        help='Build the snapshot from a player_data.csv dump instead of fetching')
+    args = parser.parse_args()
+
+    t0 = time.perf_counter()
+    if args.seed_csv:
+        df = seed_from_csv(args.seed_csv)
+        print(f"Seeded {UNIVERSE_PATH} with {len(df)} players from {args.seed_csv} "
+              f"({os.path.getsize(UNIVERSE_PATH)} bytes)")
+        return
+    try:
+        result = sync_players(SleeperClient(args.base_url, cache_dir=None), args.interval, args.force)
+    except requests.RequestException as e:
+        print(f"Player sync failed ({e}); keeping the existing snapshot")
+        return
+    print(f"{result.pop('status')} in {time.perf_counter() - t0:.2f}s: {result}")
+
+
+if __name__ == "__main__":
+    main()
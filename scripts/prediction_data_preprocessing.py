@@ -2,9 +2,18 @@ import pandas as pd
 import numpy as np
 import requests
 
-half_ppr = pd.read_csv('../data/2025/projections_half_ppr.csv')
-std = pd.read_csv('../data/2025/projections_non_ppr.csv')
-ppr = pd.read_csv('../data/2025/projections_ppr.csv')
+from instrumentation import stage
+from player_index import PlayerIndex, report_matches
+from player_universe import UNIVERSE_PATH, sync_players
+
+# add_byes.py also stamps the raw files; BYE is re-added downstream.
+with stage('csv_read') as s:
+    half_ppr = pd.read_csv('../data/2025/projections_half_ppr.csv').drop(columns=['BYE'], errors='ignore')
+    std = pd.read_csv('../data/2025/projections_non_ppr.csv').drop(columns=['BYE'], errors='ignore')
+    ppr = pd.read_csv('../data/2025/projections_ppr.csv').drop(columns=['BYE'], errors='ignore')
+    for scoring in ['half_ppr', 'non_ppr', 'ppr']:
+        s.add_file(f'../data/2025/projections_{scoring}.csv')
+std.rename(columns={'non_ppr': 'std'}, inplace=True)
 
 def split_position_ranks(df,note):
     df.drop(columns=['rank'],inplace=True)
@@ -14,36 +23,33 @@ split_position_ranks(half_ppr,'half_ppr')
 split_position_ranks(std,'std')
 split_position_ranks(ppr,'ppr')
 
-projections_full = pd.merge(std, half_ppr, on=['name', 'position', 'team'], how='outer')
-projections_full = pd.merge(projections_full, ppr, on=['name', 'position', 'team'], how='outer')
+with stage('merge') as s:
+    projections_full = pd.merge(std, half_ppr, on=['name', 'position', 'team'], how='outer')
+    projections_full = pd.merge(projections_full, ppr, on=['name', 'position', 'team'], how='outer')
+    s.add(items=len(projections_full))
 
 projections_full.head()
 
-url = "https://api.sleeper.app/v1/players/nfl"
-response = requests.get(url)
-player_data = response.json()
+# At most one conditional request a day; the snapshot is used as-is offline.
+try:
+    print(f"Player universe: {sync_players()}")
+except requests.RequestException as e:
+    print(f"Player sync failed ({e}); using the existing snapshot")
+player_index = PlayerIndex.load_or_build(UNIVERSE_PATH)
 
-player_data_df = pd.DataFrame.from_dict(player_data, orient='index')
+with stage('player_match') as s:
+    projections_full['player_id'] = player_index.match_frame(projections_full)
+    s.add(items=len(projections_full))
+report_matches(projections_full, projections_full['player_id'])
 
-#player_data_df.to_csv('../data/player_data.csv', index=False)
-
-player_data_df = pd.read_csv('../data/2025/player_data.csv')
-
-player_mapping = player_data_df[['player_id', 'full_name']]
-
-projections_full = pd.merge(
-    projections_full,
-    player_mapping,
-    left_on='name',
-    right_on='full_name',
-    how='left'
-)
-
-projections_full.drop(columns=['full_name'], inplace=True)
 projections_full.dropna(subset=['player_id'], inplace=True)
+rank_cols = ['std_rank', 'half_ppr_rank', 'ppr_rank']
+projections_full[rank_cols] = projections_full[rank_cols].astype(object)
 projections_full.fillna(0, inplace=True)
 
-#projections_full.to_csv('../data/projections_full.csv', index=False)
+with stage('csv_write') as s:
+    projections_full.to_csv('../data/2025/projections_full.csv', index=False)
+    s.add_file('../data/2025/projections_full.csv')
 
 
 # Example: split by position
@@ -54,10 +60,13 @@ te_projections = projections_full[projections_full['position'] == 'TE']
 k_projections  = projections_full[projections_full['position'] == 'K']
 dst_projections = projections_full[projections_full['position'] == 'DST']
 
-qb_projections.to_csv('../data/qb_projections.csv', index=False)
-rb_projections.to_csv('../data/rb_projections.csv', index=False)
-wr_projections.to_csv('../data/wr_projections.csv', index=False)
-te_projections.to_csv('../data/te_projections.csv', index=False)
-k_projections.to_csv('../data/k_projections.csv', index=False)
+with stage('csv_write') as s:
+    qb_projections.to_csv('../data/2025/qb_projections.csv', index=False)
+    rb_projections.to_csv('../data/2025/rb_projections.csv', index=False)
+    wr_projections.to_csv('../data/2025/wr_projections.csv', index=False)
+    te_projections.to_csv('../data/2025/te_projections.csv', index=False)
+    k_projections.to_csv('../data/2025/k_projections.csv', index=False)
+    for pos in ['qb', 'rb', 'wr', 'te', 'k']:
+        s.add_file(f'../data/2025/{pos}_projections.csv')
 
 print("Projections data has been split by position and saved to CSV files.")
\ No newline at end of file
@@ -0,0 +1,97 @@
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+import pandas as pd
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from instrumentation import stage
+
+SLEEPER_API = 'https://api.sleeper.app/v1'
+CACHE_DIR = '../data/cache/sleeper'
+
+
+def picks_to_df(picks):
+    df = pd.DataFrame.from_dict(picks)
+    df['position'] = df['metadata'].apply(lambda x: x.get('position') if isinstance(x, dict) else None)
+    return df[['pick_no', 'round', 'player_id', 'draft_slot', 'draft_id', 'position']]
+
+
+class SleeperClient:
+    def __init__(self, base_url=SLEEPER_API, cache_dir=CACHE_DIR, max_workers=8, timeout=10,
+                 retries=5, backoff_factor=0.5):
+        self.base_url = base_url.rstrip('/')
+        self.cache_dir = cache_dir
+        self.max_workers = max_workers
+        self.timeout = timeout
+
+        # 429s honour Retry-After; 5xx and connection errors back off exponentially.
+        retry = Retry(
+            total=retries,
+            backoff_factor=backoff_factor,
+            status_forcelist=[429, 500, 502, 503, 504],
+            allowed_methods=['GET'],
+            respect_retry_after_header=True,
+            raise_on_status=False
+        )
+        adapter = HTTPAdapter(pool_connections=max_workers, pool_maxsize=max_workers, max_retries=retry)
+        self.session = requests.Session()
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+
+    def get_json(self, path):
+        with stage('http_fetch') as s:
+            response = self.session.get(f'{self.base_url}{path}', timeout=self.timeout)
+            s.add(nbytes=len(response.content), items=1)
+            response.raise_for_status()
+            return response.json()
+
+    def _cache_path(self, draft_id):
+        return os.path.join(self.cache_dir, 'drafts', f'{draft_id}.json')
+
+    def load_cached_draft(self, draft_id):
+        if not self.cache_dir:
+            return None
+        path = self._cache_path(draft_id)
+        if not os.path.exists(path):
+            return None
+        with open(path) as f:
+            return json.load(f)
+
+    def _store_draft(self, draft_id, raw):
+        if not self.cache_dir:
+            return
+        path = self._cache_path(draft_id)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f'{path}.tmp'
+        with open(tmp_path, 'w') as f:
+            json.dump(raw, f)
+        os.replace(tmp_path, path)
+
+    def fetch_draft(self, draft_id):
+        raw = self.load_cached_draft(draft_id)
+        if raw is not None:
+            return raw
+        raw = {
+            'draft': self.get_json(f'/draft/{draft_id}'),
+            'picks': self.get_json(f'/draft/{draft_id}/picks')
+        }
+        # Only finished drafts are immutable; anything in progress is refetched.
+        if raw['draft'].get('status') == 'complete':
+            self._store_draft(draft_id, raw)
+        return raw
+
+    def fetch_drafts(self, draft_ids):
+        drafts = {}
+        failures = {}
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = {executor.submit(self.fetch_draft, draft_id): draft_id for draft_id in draft_ids}
+            for future in as_completed(futures):
+                draft_id = futures[future]
+                try:
+                    drafts[draft_id] = future.result()
+                except (requests.RequestException, ValueError) as e:
+                    failures[draft_id] = e
+        return drafts, failures
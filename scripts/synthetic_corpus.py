@@ -0,0 +1,228 @@
+import argparse
+import json
+import os
+
+import numpy as np
+import pandas as pd
+
+from draft_simulator import DEFAULT_SETTINGS
+from draft_state import POSITIONS, SCORING_MAP
+
+CORPUS_DIR = '../data/cache/benchmarks'
+CORPUS_VERSION = 1
+
+# Size of the real data at 1x: projected players per position, collected
+# drafts, and the Sleeper player universe.
+BASE_PLAYERS = {'qb': 22, 'rb': 48, 'wr': 71, 'te': 32, 'k': 17, 'dst': 32}
+BASE_DRAFTS = 30
+BASE_UNIVERSE = 11315
+SCALES = [10, 100, 1000]
+
+TEAMS = ['ARI', 'ATL', 'BAL', 'BUF', 'CAR', 'CHI', 'CIN', 'CLE', 'DAL', 'DEN', 'DET', 'GB', 'HOU', 'IND', 'JAX', 'KC',
+         'LAC', 'LAR', 'LV', 'MIA', 'MIN', 'NE', 'NO', 'NYG', 'NYJ', 'PHI', 'PIT', 'SEA', 'SF', 'TB', 'TEN', 'WAS']
+BYES = dict(zip(TEAMS, [8, 5, 7, 7, 14, 5, 10, 9, 10, 12, 8, 5, 6, 11, 8, 10,
+                        12, 8, 8, 12, 6, 14, 11, 14, 9, 9, 5, 8, 14, 9, 10, 12]))
+FIRST_NAMES = ['Aaron', 'Brian', 'Caleb', 'Derrick', 'Eli', 'Frank', 'Gabe', 'Hunter', 'Isaiah', 'Jalen', 'Kyle',
+               'Lamar', 'Marcus', 'Nico', 'Omar', 'Patrick', 'Quinn', 'Rashee', 'Sam', 'Tyreek', 'Umar', 'Vince',
+               'Will', 'Xavier', 'Yusuf', 'Zach']
+SYLLABLES = ['ba', 'ker', 'son', 'mor', 'lin', 'wat', 'ham', 'dor', 'ric', 'ley', 'ton', 'man', 'ger', 'vis', 'kel',
+             'sto', 'rey', 'nol', 'pet', 'bur', 'fin', 'gal', 'hur', 'jen', 'ko', 'lu', 'mac', 'ne', 'os', 'qui']
+
+# Season points for the best player at each position, and its catches.
+TOP_POINTS = {'qb': 330.0, 'rb': 280.0, 'wr': 260.0, 'te': 180.0, 'k': 150.0}
+TOP_RECEPTIONS = {'qb': 0.0, 'rb': 60.0, 'wr': 110.0, 'te': 80.0, 'k': 0.0}
+
+
+def player_names(n, rng):
+    first = rng.choice(FIRST_NAMES, n)
+    last = [''.join(parts).capitalize() for parts in rng.choice(SYLLABLES, (n, 3))]
+    return [f'{f} {l}' for f, l in zip(first, last)]
+
+
+def make_projections(scale, rng):
+    # Per-position tables shaped like data/2025/{pos}_projections.csv.
+    tables = {}
+    next_id = 100000
+    for pos in POSITIONS:
+        n = BASE_PLAYERS[pos] * scale
+        teams = rng.choice(TEAMS, n)
+        if pos == 'dst':
+            tables[pos] = pd.DataFrame({
+                'rank': np.arange(1, n + 1),
+                'name': [f'{team} Defense {i}' for i, team in enumerate(teams)],
+                'team': teams,
+                'player_id': [f'D{next_id + i}' for i in range(n)],
+                'BYE': [BYES[team] for team in teams]
+            })
+        else:
+            depth = (1 - np.arange(n) / n) ** 1.5
+            std = np.round(TOP_POINTS[pos] * depth + rng.normal(0, 5, n), 1)
+            receptions = TOP_RECEPTIONS[pos] * depth
+            df = pd.DataFrame({
+                'name': player_names(n, rng),
+                'team': teams,
+                'position': pos.upper(),
+                'std': std,
+                'half_ppr': np.round(std + 0.5 * receptions, 1),
+                'ppr': np.round(std + receptions, 1)
+            })
+            for scoring in SCORING_MAP:
+                df[f'{scoring}_rank'] = df[scoring].rank(ascending=False, method='first').astype(int)
+            df['player_id'] = [str(next_id + i) for i in range(n)]
+            df['BYE'] = [BYES[team] for team in teams]
+            tables[pos] = df[['name', 'team', 'position', 'std', 'std_rank', 'half_ppr', 'half_ppr_rank', 'ppr',
+                              'ppr_rank', 'player_id', 'BYE']]
+        next_id += n
+    return tables
+
+
+def draft_pool(tables):
+    # Column arrays per pick group, built once per corpus.
+    def columns(df, position):
+        first_last = [name.partition(' ') for name in df['name']]
+        return {
+            'player_id': df['player_id'].to_numpy(dtype=str),
+            'position': np.full(len(df), position) if position else df['position'].to_numpy(dtype=str),
+            'first_name': [first for first, _, _ in first_last],
+            'last_name': [last for _, _, last in first_last],
+            'team': df['team'].to_numpy(dtype=str)
+        }
+
+    skill = pd.concat([tables[pos] for pos in ['qb', 'rb', 'wr', 'te']], ignore_index=True)
+    return {
+        'skill': columns(skill, None),
+        'skill_points': skill['ppr'].to_numpy(dtype=float),
+        'k': columns(tables['k'], 'K'),
+        'dst': columns(tables['dst'], 'DEF')
+    }
+
+
+def make_draft(draft_id, pool, rng, teams=12, adp_noise=12.0):
+    # A completed snake draft in the SleeperClient cache layout: skill players
+    # by noisy ADP, then a round of kickers and a round of defenses.
+    settings = dict(DEFAULT_SETTINGS, teams=teams)
+    rounds = settings['rounds']
+    board = pool['skill_points'] + rng.normal(0, adp_noise, len(pool['skill_points']))
+    chosen = [(pool['skill'], i) for i in np.argsort(-board)[:teams * (rounds - 2)]]
+    for group in ['k', 'dst']:
+        chosen.extend((pool[group], i) for i in rng.permutation(len(pool[group]['player_id']))[:teams])
+
+    picks = []
+    for pick_index, (group, i) in enumerate(chosen):
+        round_index, index = divmod(pick_index, teams)
+        picks.append({
+            'pick_no': pick_index + 1,
+            'round': round_index + 1,
+            'player_id': str(group['player_id'][i]),
+            'draft_slot': index + 1 if round_index % 2 == 0 else teams - index,
+            'draft_id': str(draft_id),
+            'metadata': {
+                'position': str(group['position'][i]),
+                'first_name': group['first_name'][i],
+                'last_name': group['last_name'][i],
+                'team': str(group['team'][i])
+            }
+        })
+    draft = {
+        'draft_id': str(draft_id),
+        'status': 'complete',
+        'type': 'snake',
+        'metadata': {'scoring_type': str(rng.choice(list(SCORING_MAP)))},
+        'settings': settings
+    }
+    return {'draft': draft, 'picks': picks}
+
+
+def make_universe(tables, scale, rng):
+    # /players/nfl payload: every projected player plus the long tail of
+    # non-fantasy and inactive players, a fraction renamed the way projection
+    # sources disagree with Sleeper (suffixes, nicknames).
+    players = {}
+    for pos, df in tables.items():
+        if pos == 'dst':
+            continue
+        for name, team, player_id in zip(df['name'], df['team'], df['player_id']):
+            roll = rng.random()
+            if roll < 0.05:
+                name = f'{name} Jr.'
+            elif roll < 0.07:
+                first, _, last = name.partition(' ')
+                name = f'{first[:3]} {last}'
+            first, _, last = name.partition(' ')
+            players[player_id] = {'player_id': player_id, 'full_name': name, 'first_name': first, 'last_name': last,
+                                  'team': team, 'position': pos.upper(), 'active': True, 'status': 'Active'}
+    n_tail = max(BASE_UNIVERSE * min(scale, 10) - len(players), 0)
+    names = player_names(n_tail, rng)
+    positions = rng.choice(['LB', 'CB', 'DB', 'DE', 'DT', 'OL', 'WR', 'RB', 'TE', 'QB'], n_tail)
+    for i, (name, pos) in enumerate(zip(names, positions)):
+        player_id = str(900000 + i)
+        first, _, last = name.partition(' ')
+        players[player_id] = {'player_id': player_id, 'full_name': name, 'first_name': first, 'last_name': last,
+                              'team': rng.choice(TEAMS) if rng.random() < 0.6 else None, 'position': pos,
+                              'active': bool(rng.random() < 0.6), 'status': 'Active'}
+    return players
+
+
+def corpus_dir(scale, seed, root=CORPUS_DIR):
+    return os.path.join(root, f'{scale}x_seed{seed}')
+
+
+def write_corpus(scale, seed=0, root=CORPUS_DIR):
+    # Reused while the manifest matches, so repeated benchmark runs only pay
+    # for generation once per scale.
+    out_dir = corpus_dir(scale, seed, root)
+    manifest_path = os.path.join(out_dir, 'manifest.json')
+    if os.path.exists(manifest_path):
+        with open(manifest_path) as f:
+            manifest = json.load(f)
+        if manifest.get('version') == CORPUS_VERSION:
+            return manifest
+
+    rng = np.random.default_rng(seed)
+    data_dir = os.path.join(out_dir, 'data')
+    drafts_dir = os.path.join(out_dir, 'cache', 'drafts')
+    os.makedirs(data_dir, exist_ok=True)
+    os.makedirs(drafts_dir, exist_ok=True)
+
+    tables = make_projections(scale, rng)
+    for pos, df in tables.items():
+        df.to_csv(os.path.join(data_dir, f'{pos}_projections.csv'), index=False)
+    pool = draft_pool(tables)
+    n_drafts = BASE_DRAFTS * scale
+    for i in range(n_drafts):
+        draft_id = 1000000 + i
+        with open(os.path.join(drafts_dir, f'{draft_id}.json'), 'w') as f:
+            json.dump(make_draft(draft_id, pool, rng, teams=int(rng.choice([10, 12]))), f)
+    with open(os.path.join(data_dir, 'players_nfl.json'), 'w') as f:
+        json.dump(make_universe(tables, scale, rng), f)
+
+    manifest = {
+        'version': CORPUS_VERSION,
+        'scale': scale,
+        'seed': seed,
+        'data_dir': data_dir,
+        'cache_dir': os.path.join(out_dir, 'cache'),
+        'players_path': os.path.join(data_dir, 'players_nfl.json'),
+        'drafts': n_drafts,
+        'projected_players': sum(len(df) for df in tables.values())
+    }
+    with open(manifest_path, 'w') as f:
+        json.dump(manifest, f, indent=2)
+    return manifest
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Generate seeded synthetic draft corpora for benchmarking.')
+    parser.add_argument('--scales', nargs='+', type=int, default=SCALES)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--root', default=CORPUS_DIR)
+    args = parser.parse_args()
+
+    for scale in args.scales:
+        manifest = write_corpus(scale, args.seed, args.root)
+        print(f"{scale}x: {manifest['drafts']} drafts, {manifest['projected_players']} projected players "
+              f"in {corpus_dir(scale, args.seed, args.root)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,145 @@
+import argparse
+import hashlib
+import json
+import os
+import time
+
+import numpy as np
+
+from draft_model import build_model
+from export_quantized import export_weights
+from model_data import encode_labels, load_draft_data, notebook_split, scale_features, training_frame
+from normalization_stats import STATS_PATH, load_stats, training_minmax
+
+CACHE_DIR = '../models/cache'
+# Kept apart from models/: KerasDraftModel reads best_model.weights.h5 there,
+# which this script does not write, so a run exported over it would leave the
+# served weights out of step. export_quantized.py --model-dir reads a run.
+OUTPUT_DIR = '../models/trained'
+
+
+def data_key(draft_data, minmax, seed, smote):
+    # Hash of everything the prepared arrays depend on, so new drafts or a
+    # new normalization fit invalidate the cache and nothing else does.
+    h = hashlib.sha256()
+    for col in draft_data.columns:
+        h.update(col.encode())
+        h.update(np.ascontiguousarray(draft_data[col].to_numpy(dtype=str if col == 'position_drafted' else float)).tobytes())
+    h.update(json.dumps([minmax, seed, smote], sort_keys=True).encode())
+    return h.hexdigest()[:16]
+
+
+def prepare_arrays(minmax, seed=42, smote=True, cache_dir=CACHE_DIR):
+    draft_data = training_frame(load_draft_data())
+    key = data_key(draft_data, minmax, seed, smote)
+    path = os.path.join(cache_dir, f'{key}.npz')
+    if os.path.exists(path):
+        with np.load(path) as cached:
+            return {name: cached[name] for name in cached.files}, key, True
+
+    X = scale_features(draft_data, minmax)
+    y = encode_labels(draft_data['position_drafted'])
+    split = notebook_split(X, y)
+    X_train, y_train = split['train']
+    if smote:
+        from imblearn.over_sampling import SMOTE
+
+        X_train, y_train = SMOTE(random_state=seed).fit_resample(X_train, y_train)
+    arrays = {
+        'X_train': X_train.astype(np.float32), 'y_train': y_train,
+        'X_val': split['val'][0], 'y_val': split['val'][1],
+        'X_test': split['test'][0], 'y_test': split['test'][1]
+    }
+
+    os.makedirs(cache_dir, exist_ok=True)
+    tmp_path = f'{path}.tmp.npz'
+    np.savez(tmp_path, **arrays)
+    os.replace(tmp_path, path)
+    return arrays, key, False
+
+
+def make_dataset(X, y, batch_size, shuffle=False, seed=42):
+    import tensorflow as tf
+
+    ds = tf.data.Dataset.from_tensor_slices((X, y))
+    if shuffle:
+        ds = ds.shuffle(len(X), seed=seed, reshuffle_each_iteration=True)
+    return ds.batch(batch_size).prefetch(tf.data.AUTOTUNE)
+
+
+def train(arrays, epochs=1000, batch_size=32, patience=25, seed=42, verbose=2):
+    import tensorflow as tf
+    from tensorflow.keras.callbacks import EarlyStopping
+
+    tf.keras.utils.set_random_seed(seed)
+    model = build_model(n_features=arrays['X_train'].shape[1])
+    early_stopping = EarlyStopping(monitor='val_loss', patience=patience, restore_best_weights=True)
+    history = model.fit(
+        make_dataset(arrays['X_train'], arrays['y_train'], batch_size, shuffle=True, seed=seed),
+        validation_data=make_dataset(arrays['X_val'], arrays['y_val'], 4096),
+        epochs=epochs,
+        callbacks=[early_stopping],
+        verbose=verbose
+    )
+    return model, history.history, early_stopping.best_epoch
+
+
+def model_weights(model):
+    return {layer.name: layer.get_weights() for layer in model.layers if layer.weights}
+
+
+def evaluate(model, X_test, y_test):
+    from sklearn.metrics import balanced_accuracy_score, cohen_kappa_score
+
+    y_pred = model.predict(X_test, batch_size=4096, verbose=0).argmax(axis=1)
+    return {
+        'accuracy': float((y_pred == y_test).mean()),
+        'balanced_accuracy': float(balanced_accuracy_score(y_test, y_pred)),
+        'kappa': float(cohen_kappa_score(y_test, y_pred))
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Train the draft position model and export it for TensorFlow.js.')
+    parser.add_argument('--output', default=OUTPUT_DIR)
+    parser.add_argument('--epochs', type=int, default=1000)
+    parser.add_argument('--batch-size', type=int, default=32)
+    parser.add_argument('--patience', type=int, default=25)
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--no-smote', action='store_true')
+    parser.add_argument('--cache-dir', default=CACHE_DIR)
+    args = parser.parse_args()
+
+    t0 = time.perf_counter()
+    minmax = training_minmax()
+    arrays, key, hit = prepare_arrays(minmax, args.seed, not args.no_smote, args.cache_dir)
+    print(f"Prepared arrays {key} ({'cached' if hit else 'built'}) in {time.perf_counter() - t0:.1f}s: "
+          f"{len(arrays['X_train'])} train, {len(arrays['X_val'])} val, {len(arrays['X_test'])} test")
+
+    t0 = time.perf_counter()
+    model, history, best_epoch = train(arrays, args.epochs, args.batch_size, args.patience, args.seed)
+    train_seconds = time.perf_counter() - t0
+    metrics = evaluate(model, arrays['X_test'], arrays['y_test'])
+
+    export_weights(model_weights(model), args.output)
+    report = {
+        'data_key': key,
+        'normalization_fingerprint': load_stats(STATS_PATH)['fingerprint'],
+        'seed': args.seed,
+        'epochs_run': len(history['loss']),
+        'best_epoch': best_epoch + 1,
+        'best_val_loss': float(min(history['val_loss'])),
+        'train_seconds': round(train_seconds, 1),
+        **metrics
+    }
+    with open(os.path.join(args.output, 'training_report.json'), 'w') as f:
+        json.dump(report, f, indent=2)
+
+    print(f"Stopped after {report['epochs_run']} epochs (best {report['best_epoch']}, "
+          f"val_loss {report['best_val_loss']:.4f}) in {train_seconds:.1f}s")
+    print(f"Test balanced accuracy {metrics['balanced_accuracy']:.4f}, kappa {metrics['kappa']:.4f}")
+    print(f"Exported model.json and weights to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
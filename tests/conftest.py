@@ -0,0 +1,43 @@
+import os
+import sys
+
+import numpy as np
+import pytest
+
+SCRIPTS_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'scripts')
+sys.path.insert(0, SCRIPTS_DIR)
+
+from fake_sleeper_server import FakeSleeperServer  # noqa: E402
+from synthetic_corpus import draft_pool, make_draft, make_projections  # noqa: E402
+
+DRAFT_IDS = [1000001, 1000002, 1000003]
+
+
+@pytest.fixture(scope='session')
+def projection_tables():
+    return make_projections(1, np.random.default_rng(0))
+
+
+@pytest.fixture
+def data_dir(tmp_path, projection_tables):
+    # Synthetic {pos}_projections.csv files, so tests never read the
+    # committed season data.
+    path = tmp_path / 'data'
+    path.mkdir()
+    for pos, df in projection_tables.items():
+        df.to_csv(path / f'{pos}_projections.csv', index=False)
+    return str(path)
+
+
+@pytest.fixture(scope='session')
+def drafts(projection_tables):
+    rng = np.random.default_rng(1)
+    pool = draft_pool(projection_tables)
+    return {str(draft_id): make_draft(draft_id, pool, rng) for draft_id in DRAFT_IDS}
+
+
+@pytest.fixture
+def sleeper_server(drafts):
+    server = FakeSleeperServer(drafts).start()
+    yield server
+    server.stop()
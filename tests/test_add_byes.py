@@ -0,0 +1,30 @@
+import sys
+
+import pandas as pd
+import pytest
+
+import add_byes
+
+
+def run_main(monkeypatch, data_dir, *names):
+    monkeypatch.setattr(sys, 'argv', ['add_byes.py', '--data-dir', str(data_dir), *names])
+    add_byes.main()
+
+
+def test_adds_byes_and_leaves_current_files_alone(tmp_path, monkeypatch):
+    path = tmp_path / 'qb_projections.csv'
+    pd.DataFrame({'player': ['a', 'b'], 'team': ['CHI', 'XXX']}).to_csv(path, index=False)
+    run_main(monkeypatch, tmp_path, 'qb_projections.csv')
+    assert pd.read_csv(path, keep_default_na=False)['BYE'].tolist() == ['5', 'N/A']
+
+    mtime = path.stat().st_mtime_ns
+    assert not add_byes.add_byes(str(path))
+    assert path.stat().st_mtime_ns == mtime
+
+
+def test_failures_exit_non_zero(tmp_path, monkeypatch):
+    pd.DataFrame({'player': ['a'], 'team': ['CHI']}).to_csv(tmp_path / 'qb_projections.csv', index=False)
+    (tmp_path / 'rb_projections.csv').write_text('')
+    with pytest.raises(SystemExit) as exc:
+        run_main(monkeypatch, tmp_path, 'qb_projections.csv', 'rb_projections.csv', 'te_projections.csv')
+    assert exc.value.code == 'Failed to process 2 of 3 files: rb_projections.csv, te_projections.csv'
@@ -0,0 +1,67 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from backtest import SEASON_GAMES, SEASON_WEEKS, SeasonActuals
+from draft_simulator import QB, RB, SUPERFLEX_POSITIONS, TE, WR, lineup_totals
+
+
+def brute_force_lineup(points, pos, slots, flex_slots, superflex_slots):
+    # Every way of seating the roster, for rosters small enough to enumerate.
+    open_slots = [('pos', p) for p, n in enumerate(slots) for _ in range(n)]
+    open_slots += [('flex', None)] * flex_slots + [('superflex', None)] * superflex_slots
+
+    def fits(slot, p):
+        kind, want = slot
+        if kind == 'pos':
+            return p == want
+        return p in ((RB, WR, TE) if kind == 'flex' else SUPERFLEX_POSITIONS)
+
+    def best(i, remaining):
+        if i == len(points):
+            return 0.0
+        options = [best(i + 1, remaining)]
+        for j, slot in enumerate(remaining):
+            if pos[i] >= 0 and fits(slot, pos[i]):
+                options.append(points[i] + best(i + 1, remaining[:j] + remaining[j + 1:]))
+        return max(options)
+
+    return best(0, open_slots)
+
+
+@pytest.mark.parametrize('superflex_slots', [0, 1])
+def test_lineup_totals_matches_brute_force(superflex_slots):
+    rng = np.random.default_rng(0)
+    slots = np.array([1, 1, 1, 1, 0, 0])
+    points = rng.uniform(0, 20, size=(40, 8)).round(1)
+    pos = rng.choice([-1, QB, RB, WR, TE], size=(40, 8))
+    totals = lineup_totals(points, pos, slots, 1, superflex_slots)
+    expected = [brute_force_lineup(p, q, slots, 1, superflex_slots) for p, q in zip(points, pos)]
+    np.testing.assert_allclose(totals, expected)
+
+
+@pytest.fixture
+def actuals(tmp_path):
+    season_dir = tmp_path / '2030'
+    season_dir.mkdir()
+    pd.DataFrame({'Player': ['Early Qb (AAA)', 'Late Qb (BBB)'], 'FPTS': [340.0, 170.0]}).to_csv(
+        season_dir / 'qb_actual30.csv', index=False)
+    pd.DataFrame({'Player': ['Some Wr (BBB)'], 'REC(Recieving)': [85], 'FPTS': [170.0]}).to_csv(
+        season_dir / 'wr_actual30.csv', index=False)
+    return SeasonActuals(2030, str(tmp_path), byes={'AAA': 5, 'BBB': 6})
+
+
+def test_season_score_plays_the_backup_in_bye_weeks(actuals):
+    rosters = actuals.rows_for(['QB|early qb', 'QB|late qb', 'WR|some wr', 'QB|nobody'])
+    assert rosters[-1] == actuals.missing
+    slots = np.array([1, 0, 1, 0, 0, 0])
+    early, late, wr = 340 / SEASON_GAMES, 170 / SEASON_GAMES, 170 / SEASON_GAMES
+    # Weeks 5 and 6 are bye weeks; the WR sits out week 6 with nobody behind him.
+    expected = (early + wr) * (SEASON_WEEKS - 2) + (late + wr) + early
+    assert actuals.score(rosters, 'std', slots, 0) == pytest.approx(expected)
+    assert actuals.score(rosters, 'ppr', slots, 0) == pytest.approx(expected + 85 / SEASON_GAMES * (SEASON_WEEKS - 1))
+
+    # A superflex slot starts the second QB in every week but the byes.
+    superflex = actuals.score(rosters, 'std', slots, 0, superflex_slots=1)
+    assert superflex == pytest.approx(expected + late * (SEASON_WEEKS - 2))
+    np.testing.assert_allclose(actuals.score(np.stack([rosters, rosters]), 'std', slots, 0), [expected] * 2)
@@ -0,0 +1,41 @@
+import json
+import os
+
+import pandas as pd
+import pytest
+
+from batch_replay import cached_draft_paths, replay_drafts, shard
+from draft_state import replay_draft
+from sleeper_client import picks_to_df
+
+
+@pytest.fixture
+def cache_dir(tmp_path, drafts):
+    # Written in reverse id order, so the merge cannot lean on listing order.
+    drafts_dir = tmp_path / 'cache' / 'drafts'
+    drafts_dir.mkdir(parents=True)
+    for draft_id in sorted(drafts, reverse=True):
+        (drafts_dir / f'{draft_id}.json').write_text(json.dumps(drafts[draft_id]))
+    return str(tmp_path / 'cache')
+
+
+def test_shards_cover_items_in_order():
+    items = list(range(10))
+    shards = shard(items, 4)
+    assert len(shards) == 4
+    assert [i for s in shards for i in s] == items
+    assert shard(items[:2], 8) == [[0], [1]]
+
+
+def test_merged_shards_match_sequential_replay(cache_dir, drafts, data_dir):
+    paths = cached_draft_paths(cache_dir)
+    assert [os.path.basename(p) for p in paths] == [f'{d}.json' for d in sorted(drafts, key=int)]
+
+    merged = replay_drafts(paths, workers=2, shards_per_worker=2, data_dir=data_dir)
+    frames = []
+    for draft_id in sorted(drafts, key=int):
+        raw = drafts[draft_id]
+        df = replay_draft(raw['draft'], picks_to_df(raw['picks']), data_dir)
+        df['draft_id'] = int(draft_id)
+        frames.append(df)
+    pd.testing.assert_frame_equal(merged, pd.concat(frames, ignore_index=True), check_dtype=False)
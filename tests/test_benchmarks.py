@@ -0,0 +1,17 @@
+from benchmarks import compare
+
+
+def result(seconds, peak_mb, units=100):
+    return {'units': units, 'seconds': seconds, 'throughput': units / seconds, 'peak_mb': peak_mb}
+
+
+def test_small_absolute_differences_are_noise():
+    baseline = {'10x': {'features_per_draft': result(0.010, 0.3)}}
+    rows = compare({'10x': {'features_per_draft': result(0.014, 0.4)}}, baseline, 0.2)
+    assert rows[0][-1] == 'ok'
+
+
+def test_regressions_past_the_floor_are_flagged():
+    baseline = {'10x': {'corpus_rebuild': result(2.0, 60.0)}}
+    assert compare({'10x': {'corpus_rebuild': result(3.0, 60.0)}}, baseline, 0.2)[0][-1] == 'SLOWER'
+    assert compare({'10x': {'corpus_rebuild': result(2.0, 90.0)}}, baseline, 0.2)[0][-1] == 'MORE MEMORY'
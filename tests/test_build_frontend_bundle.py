@@ -0,0 +1,47 @@
+import gzip
+import json
+
+import numpy as np
+import pandas as pd
+
+from build_frontend_bundle import FLEX_POSITIONS, POSITIONS, build_bundle, projected_points, write_bundle
+
+
+def test_projected_points_falls_back_to_std():
+    df = pd.DataFrame({'std': [10.0, np.nan, 4.0], 'ppr': [12.0, 8.0, np.nan]})
+    points = projected_points(df)
+    assert points['std'].tolist() == [10.0, 0.0, 4.0]
+    assert points['half_ppr'].tolist() == [10.0, 0.0, 4.0]
+    assert points['ppr'].tolist() == [12.0, 8.0, 4.0]
+
+
+def test_bundle_orders_match_projections(projection_tables, tmp_path):
+    season_dir = tmp_path / 'data' / '2025'
+    season_dir.mkdir(parents=True)
+    for pos, df in projection_tables.items():
+        df.to_csv(season_dir / f'{pos}_projections.csv', index=False)
+
+    bundle = build_bundle(2025, str(tmp_path / 'data'))
+    assert set(bundle['positions']) == set(POSITIONS)
+    assert bundle['normalization'] is None and 'survival' not in bundle
+    for pos in POSITIONS:
+        block = bundle['positions'][pos]
+        assert block['player_id'] == projection_tables[pos]['player_id'].astype(str).tolist()
+        for scoring in ['std', 'half_ppr', 'ppr']:
+            points = [block[scoring][i] for i in block['order'][scoring]]
+            assert points == sorted(points, reverse=True)
+    # DST has no projections, so every order keeps the CSV order.
+    assert bundle['positions']['dst']['order']['ppr'] == list(range(len(projection_tables['dst'])))
+
+    flex = [bundle['positions'][pos]['ppr'][i] for pos, i in bundle['flex']['order']['ppr']]
+    assert flex == sorted(flex, reverse=True)
+    assert len(flex) == sum(len(projection_tables[pos]) for pos in FLEX_POSITIONS)
+
+    path = str(season_dir / 'bundle.json.gz')
+    write_bundle(bundle, path)
+    with open(path, 'rb') as f:
+        first = f.read()
+    write_bundle(bundle, path)
+    with open(path, 'rb') as f:
+        assert f.read() == first
+    assert json.loads(gzip.decompress(first)) == bundle
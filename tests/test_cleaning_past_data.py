@@ -0,0 +1,56 @@
+import json
+import os
+import shutil
+
+import pytest
+
+from cleaning_past_data import load_season, manifest_path, run_etl, season_paths
+from conftest import SCRIPTS_DIR
+
+SEASON_DATA = os.path.join(os.path.dirname(SCRIPTS_DIR), 'docs', 'data')
+
+
+@pytest.fixture
+def etl_dir(tmp_path):
+    for season, names in {2024: ['qb_actual24.csv', 'qb_projections24.csv', 'rb_actual24.csv',
+                                 'rb_projections24.csv', 'adp24.csv'],
+                          2022: ['qb_actual22.csv']}.items():
+        (tmp_path / str(season)).mkdir()
+        for name in names:
+            shutil.copy(os.path.join(SEASON_DATA, str(season), name), tmp_path / str(season) / name)
+    return str(tmp_path)
+
+
+def test_manifest_skips_unchanged_positions(etl_dir, capsys):
+    results = run_etl([2024], ['qb', 'rb'], etl_dir, workers=1)
+    assert set(results[2024]) == {'qb', 'rb'}
+    with open(manifest_path(2024, etl_dir)) as f:
+        manifest = json.load(f)
+    assert set(manifest) == {'qb', 'rb'}
+    rows = len(load_season(2024, etl_dir))
+
+    assert run_etl([2024], ['qb', 'rb'], etl_dir, workers=1) == {}
+
+    with open(season_paths(2024, 'rb', etl_dir)['projections'], 'a') as f:
+        f.write('\n')
+    capsys.readouterr()
+    run_etl([2024], ['qb', 'rb'], etl_dir, workers=1)
+    assert '2024: rebuilt rb (' in capsys.readouterr().out
+    with open(manifest_path(2024, etl_dir)) as f:
+        rebuilt = json.load(f)
+    assert rebuilt['qb'] == manifest['qb'] and rebuilt['rb'] != manifest['rb']
+    assert len(load_season(2024, etl_dir)) == rows
+
+
+def test_actuals_only_season_writes_no_full_files(etl_dir, capsys):
+    run_etl([2022], ['qb'], etl_dir, workers=1)
+    assert 'no projections' in capsys.readouterr().out
+    assert not os.path.exists(season_paths(2022, 'qb', etl_dir)['full'])
+    assert len(load_season(2022, etl_dir))
+
+
+def test_partial_projections_fail_before_caching(etl_dir):
+    os.remove(season_paths(2024, 'rb', etl_dir)['projections'])
+    with pytest.raises(ValueError, match='rb'):
+        run_etl([2024], ['qb', 'rb'], etl_dir, workers=1)
+    assert not os.path.exists(manifest_path(2024, etl_dir))
@@ -0,0 +1,46 @@
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from draft_simulator import DEFAULT_SETTINGS, POSITION_LABELS, DraftSimulator
+from draft_state import NUMERIC_COLUMNS, replay_columns
+
+
+@pytest.mark.parametrize('superflex', [0, 1])
+def test_recorded_features_match_replay(data_dir, superflex):
+    # Simulated drafts replayed through DraftState with Sleeper's 'DEF'
+    # labels must rebuild exactly the rows the simulator recorded.
+    settings = dict(DEFAULT_SETTINGS, teams=10, slots_super_flex=superflex)
+    simulator = DraftSimulator(settings, 'half_ppr', data_dir)
+    result = simulator.run(3, 'adp', 'adp', seed=0, record_features=True)
+    pool = simulator.pool
+    n_picks = simulator.teams * simulator.rounds
+    rnd, idx = np.divmod(np.arange(n_picks), simulator.teams)
+    draft_slot = np.where(rnd % 2 == 0, idx, simulator.teams - 1 - idx) + 1
+
+    draft = {'metadata': {'scoring_type': 'half_ppr'}, 'settings': simulator.settings}
+    for sim, picks in enumerate(result['picks']):
+        picks_data = pd.DataFrame({'pick_no': np.arange(1, n_picks + 1), 'round': rnd + 1,
+                                   'draft_slot': draft_slot, 'player_id': pool.player_ids[picks],
+                                   'position': POSITION_LABELS[pool.pos[picks]]})
+        columns = replay_columns(draft, picks_data, data_dir)
+        replayed = np.column_stack([columns[col] for col in NUMERIC_COLUMNS]).astype(float)
+        np.testing.assert_allclose(result['features'][sim], replayed, equal_nan=True)
+
+
+def test_defenses_go_in_rank_order(data_dir):
+    simulator = DraftSimulator(dict(DEFAULT_SETTINGS, teams=8), 'ppr', data_dir, adp_noise=0)
+    picks = simulator.run(1, 'adp', 'adp', record_features=True)['picks'][0]
+    pool = simulator.pool
+    last_round = picks[-simulator.teams:]
+    assert (POSITION_LABELS[pool.pos[last_round]] == 'DEF').all()
+    assert (last_round - pool.starts[pool.pos[last_round]]).tolist() == list(range(simulator.teams))
+
+
+def test_missing_scoring_column_fails(data_dir):
+    path = os.path.join(data_dir, 'qb_projections.csv')
+    pd.read_csv(path).drop(columns=['ppr']).to_csv(path, index=False)
+    with pytest.raises(ValueError, match='qb'):
+        DraftSimulator(scoring_type='ppr', data_dir=data_dir)
@@ -0,0 +1,116 @@
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from conftest import DRAFT_IDS
+from draft_simulator import DEFAULT_SETTINGS
+from draft_state import (NUMERIC_COLUMNS, POSITIONS, SCORING_MAP, VOR_POSITIONS, DraftState, get_team_total_needs,
+                         league_format, load_projections, replacement_levels, replay_columns)
+from sleeper_client import picks_to_df
+
+
+def rescan_replay(draft_data, picks_data, data_dir, bases):
+    # The DataFrame loop DraftState replaced: every pick rescans the
+    # projection tables for availability and the best undrafted player.
+    team_needs, total_needs = get_team_total_needs(draft_data)
+    scoring_type = draft_data['metadata']['scoring_type']
+    tables = {}
+    for pos in POSITIONS:
+        df = pd.read_csv(os.path.join(data_dir, f'{pos}_projections.csv'))
+        df['player_id'] = df['player_id'].astype(str)
+        df['drafted'] = False
+        tables[pos] = df
+    pos_map = {'QB': 'qb_slots', 'RB': 'rb_slots', 'WR': 'wr_slots', 'TE': 'te_slots', 'K': 'k_slots',
+               'DEF': 'dst_slots'}
+
+    rows = []
+    for pick_no, round_num, draft_slot, player_id, position in zip(
+            picks_data['pick_no'], picks_data['round'], picks_data['draft_slot'], picks_data['player_id'],
+            picks_data['position']):
+        needs = team_needs[draft_slot - 1]
+        undrafted = {pos: df[df['drafted'] == False] for pos, df in tables.items()}  # noqa: E712
+        available = {pos: len(df) for pos, df in undrafted.items()}
+        vor = {pos: undrafted[pos][scoring_type].max() - bases[pos] for pos in VOR_POSITIONS}
+        flex_need = needs['flex_slots'] + needs['superflex_slots']
+        rows.append([
+            pick_no, round_num, SCORING_MAP[scoring_type],
+            *(needs[f'{pos}_slots'] for pos in POSITIONS), flex_need,
+            *(total_needs[f'{pos}_slots'] - needs[f'{pos}_slots'] for pos in POSITIONS),
+            total_needs['flex_slots'] + total_needs['superflex_slots'] - flex_need,
+            *(available[pos] for pos in POSITIONS), available['rb'] + available['wr'] + available['te'],
+            *(vor[pos] for pos in VOR_POSITIONS), pd.Series([vor['rb'], vor['wr'], vor['te']]).max()
+        ])
+
+        if position not in ['QB', 'RB', 'WR', 'TE', 'K', 'DST']:
+            continue
+        slot_key = pos_map.get(position)
+        if slot_key and needs[slot_key] > 0:
+            needs[slot_key] -= 1
+            total_needs[slot_key] -= 1
+        elif position in ['RB', 'WR', 'TE'] and needs['flex_slots'] > 0:
+            needs['flex_slots'] -= 1
+            total_needs['flex_slots'] -= 1
+        elif position in ['QB', 'RB', 'WR', 'TE'] and needs['superflex_slots'] > 0:
+            needs['superflex_slots'] -= 1
+            total_needs['superflex_slots'] -= 1
+        table = tables['dst' if position == 'DST' else position.lower()]
+        table.loc[table['player_id'] == str(player_id), 'drafted'] = True
+    return np.array(rows, dtype=float)
+
+
+@pytest.mark.parametrize('draft_id', DRAFT_IDS)
+@pytest.mark.parametrize('dst_label', ['DEF', 'DST'])
+def test_replay_matches_dataframe_rescan(drafts, data_dir, draft_id, dst_label):
+    raw = drafts[str(draft_id)]
+    picks_data = picks_to_df(raw['picks'])
+    picks_data['position'] = picks_data['position'].replace('DEF', dst_label)
+    bases = DraftState(raw['draft'], data_dir).bases
+
+    columns = replay_columns(raw['draft'], picks_data, data_dir)
+    replayed = np.column_stack([columns[col] for col in NUMERIC_COLUMNS]).astype(float)
+    np.testing.assert_allclose(replayed, rescan_replay(raw['draft'], picks_data, data_dir, bases), equal_nan=True)
+    assert list(columns['position_drafted']) == list(picks_data['position'])
+
+
+@pytest.fixture
+def zero_filled_dir(data_dir):
+    # Preprocessing writes 0 for a quarterback without a std projection.
+    path = os.path.join(data_dir, 'qb_projections.csv')
+    qb = pd.read_csv(path)
+    qb.loc[len(qb) - 1, 'std'] = 0.0
+    qb.to_csv(path, index=False)
+    return data_dir, qb
+
+
+def test_zero_filled_projections_are_unprojected(zero_filled_dir):
+    data_dir, qb = zero_filled_dir
+    assert load_projections('std', data_dir)['qb'].projected == len(qb) - 1
+    assert load_projections('ppr', data_dir)['qb'].projected == len(qb)
+
+
+def test_starters_past_the_projected_pool_warn(zero_filled_dir):
+    data_dir, qb = zero_filled_dir
+    fmt = league_format(dict(DEFAULT_SETTINGS, teams=len(qb) // 2, slots_qb=2))
+    with pytest.warns(UserWarning, match='qb'):
+        levels = replacement_levels('std', fmt, data_dir)
+    assert levels['qb'] == qb['std'][qb['std'] > 0].min()
+
+
+def test_bases_are_replacement_levels_not_the_legacy_index(data_dir, projection_tables):
+    # The original loop took ascending .iloc[qb_slots * teams] for every
+    # position; VOR now subtracts the first player past the league's starters.
+    draft = {'metadata': {'scoring_type': 'std'}, 'settings': dict(DEFAULT_SETTINGS)}
+    bases = DraftState(draft, data_dir).bases
+    _, total_needs = get_team_total_needs(draft)
+    teams = DEFAULT_SETTINGS['teams']
+    for pos in ['qb', 'k']:
+        points = projection_tables[pos]['std']
+        assert bases[pos] == points.sort_values(ascending=False).iloc[teams]
+        assert bases[pos] != points.sort_values().iloc[total_needs['qb_slots']]
+    # Flex spots raise the rb/wr/te starter counts, so their bases sit
+    # deeper than their dedicated slots alone.
+    for pos in ['rb', 'wr', 'te']:
+        points = projection_tables[pos]['std'].sort_values(ascending=False)
+        assert bases[pos] <= points.iloc[DEFAULT_SETTINGS[f'slots_{pos}'] * teams]
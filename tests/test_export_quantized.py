@@ -0,0 +1,59 @@
+import json
+import os
+
+import numpy as np
+import pytest
+
+from conftest import SCRIPTS_DIR
+from draft_model import MODEL_FEATURES, POSITION_CLASSES
+from export_quantized import export_report, quantize
+
+MODELS_DIR = os.path.join(os.path.dirname(SCRIPTS_DIR), 'models')
+
+
+def test_uint8_round_trip_is_within_half_a_step():
+    values = np.random.default_rng(0).normal(size=(64, 8)).astype(np.float32)
+    data, spec = quantize(values, 'uint8')
+    restored = np.frombuffer(data, dtype=np.uint8) * spec['scale'] + spec['min']
+    assert np.abs(restored.reshape(values.shape) - values).max() <= spec['scale'] / 2 + 1e-6
+    data, spec = quantize(values, 'float16')
+    assert len(data) == values.size * 2 and spec == {'dtype': 'float16'}
+
+
+def test_report_compares_variants_with_float32(tmp_path, monkeypatch):
+    pytest.importorskip('h5py')
+    from draft_model import read_h5_weights
+
+    # export_weights reads the template manifest relative to scripts/.
+    monkeypatch.chdir(SCRIPTS_DIR)
+    weights = read_h5_weights(os.path.join(MODELS_DIR, 'best_model.weights.h5'))
+    rng = np.random.default_rng(0)
+    X_test = rng.random((400, len(MODEL_FEATURES)), dtype=np.float32)
+    y_test = rng.integers(0, len(POSITION_CLASSES), len(X_test))
+    report = export_report(weights, str(tmp_path), X_test, y_test)
+
+    assert json.loads((tmp_path / 'report.json').read_text()) == report
+    assert report['float32']['max_prob_diff'] == 0 and report['float32']['prediction_agreement'] == 1
+    assert report['float16']['shard_bytes'] * 2 == report['float32']['shard_bytes']
+    assert report['uint8']['shard_bytes'] * 4 == report['float32']['shard_bytes']
+    assert report['float16']['max_prob_diff'] < 1e-2
+    assert report['uint8']['prediction_agreement'] > 0.9
+
+
+def test_tfjs_model_dir_reads_like_the_h5_weights(tmp_path):
+    pytest.importorskip('h5py')
+    from draft_model import read_h5_weights
+    from export_quantized import read_tfjs_weights
+
+    h5 = list(read_h5_weights(os.path.join(MODELS_DIR, 'best_model.weights.h5')).values())
+    tfjs = list(read_tfjs_weights(MODELS_DIR).values())
+    assert len(tfjs) == len(h5)
+    for tfjs_layer, h5_layer in zip(tfjs, h5):
+        for a, b in zip(tfjs_layer, h5_layer):
+            np.testing.assert_allclose(a, b)
+
+    rng = np.random.default_rng(0)
+    X_test = rng.random((50, len(MODEL_FEATURES)), dtype=np.float32)
+    report = export_report(read_tfjs_weights(MODELS_DIR), str(tmp_path), X_test, rng.integers(0, len(POSITION_CLASSES), 50),
+                           variants=['float32'], template_path=os.path.join(MODELS_DIR, 'model.json'))
+    assert report['float32']['shard_bytes'] == os.path.getsize(os.path.join(MODELS_DIR, 'group1-shard1of1.bin'))
@@ -0,0 +1,31 @@
+import pandas as pd
+import pytest
+
+from draft_state import replay_draft
+from feature_store import FeatureStore, open_store
+from sleeper_client import picks_to_df
+
+
+@pytest.fixture
+def draft_csv(tmp_path, drafts, data_dir):
+    frames = []
+    for draft_id, raw in drafts.items():
+        df = replay_draft(raw['draft'], picks_to_df(raw['picks']), data_dir)
+        df['draft_id'] = int(draft_id)
+        frames.append(df)
+    path = tmp_path / 'all_draft_data.csv'
+    pd.concat(frames, ignore_index=True).to_csv(path, index=False)
+    return str(path)
+
+
+def test_empty_store_is_seeded_from_the_csv(tmp_path, draft_csv, drafts):
+    store = open_store(str(tmp_path / 'store'), draft_csv)
+    assert store.draft_ids == {int(d) for d in drafts}
+    before = pd.read_csv(draft_csv)
+    store.export_csv(draft_csv)
+    assert len(pd.read_csv(draft_csv)) == len(before)
+
+
+def test_export_refuses_to_drop_drafts(tmp_path, draft_csv):
+    with pytest.raises(ValueError):
+        FeatureStore(str(tmp_path / 'empty')).export_csv(draft_csv)
@@ -0,0 +1,97 @@
+import json
+import threading
+import urllib.error
+import urllib.request
+
+import numpy as np
+import pytest
+
+from draft_model import MODEL_FEATURES, POSITION_CLASSES
+from inference_server import InferenceServer, MicroBatcher, parse_features
+
+
+class RecordingModel:
+    # Returns each row's first four features as its "probabilities" and
+    # remembers batch sizes; rows whose first feature is negative fail.
+    def __init__(self):
+        self.batch_sizes = []
+        self.entered = threading.Event()
+        self.release = threading.Event()
+        self.release.set()
+
+    def predict(self, batch):
+        self.entered.set()
+        self.release.wait()
+        self.batch_sizes.append(len(batch))
+        if (batch[:, 0] < 0).any():
+            raise RuntimeError('bad batch')
+        return batch[:, :len(POSITION_CLASSES)]
+
+
+def rows(values):
+    return np.tile(np.asarray(values, dtype=np.float32)[:, None], (1, len(MODEL_FEATURES)))
+
+
+def test_concurrent_requests_share_a_batch_and_get_their_own_rows():
+    model = RecordingModel()
+    model.release.clear()
+    batcher = MicroBatcher(model, max_batch=64, max_wait_ms=50)
+    # The first batch blocks inside the model, so the rest queue up behind it.
+    first = batcher.submit(rows([0]))
+    assert model.entered.wait(timeout=5)
+    futures = [batcher.submit(rows([i, i + 0.5])) for i in range(1, 6)]
+    model.release.set()
+    assert first.result(timeout=5)[:, 0].tolist() == [0]
+    for i, future in enumerate(futures, start=1):
+        assert future.result(timeout=5)[:, 0].tolist() == [i, i + 0.5]
+    assert model.batch_sizes == [1, 10]
+    assert batcher.rows == 11
+
+
+def test_max_batch_closes_a_batch_early():
+    model = RecordingModel()
+    model.release.clear()
+    batcher = MicroBatcher(model, max_batch=4, max_wait_ms=200)
+    batcher.submit(rows([0]))
+    assert model.entered.wait(timeout=5)
+    futures = [batcher.submit(rows([1, 2])) for _ in range(3)]
+    model.release.set()
+    for future in futures:
+        future.result(timeout=5)
+    assert model.batch_sizes == [1, 4, 2]
+
+
+def test_model_errors_fail_the_batch_but_not_the_batcher():
+    batcher = MicroBatcher(RecordingModel(), max_wait_ms=1)
+    with pytest.raises(RuntimeError):
+        batcher.submit(rows([-1])).result(timeout=5)
+    assert batcher.submit(rows([1])).result(timeout=5).shape == (1, len(POSITION_CLASSES))
+
+
+def test_parse_features_checks_row_width():
+    assert parse_features({'features': [0] * len(MODEL_FEATURES)}).shape == (1, len(MODEL_FEATURES))
+    with pytest.raises(ValueError):
+        parse_features({'instances': [[0] * (len(MODEL_FEATURES) - 1)]})
+
+
+def post(url, payload):
+    request = urllib.request.Request(f'{url}/predict', json.dumps(payload).encode(),
+                                     {'Content-Type': 'application/json'})
+    try:
+        with urllib.request.urlopen(request, timeout=5) as response:
+            return response.status, json.loads(response.read())
+    except urllib.error.HTTPError as e:
+        return e.code, json.loads(e.read())
+
+
+def test_server_predicts_and_rejects_bad_payloads():
+    server = InferenceServer(MicroBatcher(RecordingModel(), max_wait_ms=1), port=0).start()
+    try:
+        status, body = post(server.url, {'features': [0.9] + [0.1] * (len(MODEL_FEATURES) - 1)})
+        assert status == 200 and body['best_position'] == POSITION_CLASSES[0]
+        status, body = post(server.url, {'instances': [[0.5] * len(MODEL_FEATURES)] * 3})
+        assert status == 200 and len(body['predictions']) == 3
+        assert post(server.url, {'features': [1, 2]})[0] == 400
+        assert post(server.url, {'features': [-1] * len(MODEL_FEATURES)})[0] == 503
+    finally:
+        server.stop()
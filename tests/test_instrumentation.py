@@ -0,0 +1,69 @@
+import json
+import os
+import subprocess
+import sys
+import time
+
+import pytest
+
+import instrumentation
+from conftest import SCRIPTS_DIR
+from instrumentation import NULL_STAGE, Recorder, peak_rss_mb
+
+
+def test_stage_is_a_no_op_when_disabled(monkeypatch):
+    monkeypatch.setattr(instrumentation, '_recorder', None)
+    with instrumentation.stage('anything') as s:
+        s.add(nbytes=10, items=1)
+    assert s is NULL_STAGE
+
+
+def test_recorder_aggregates_calls(tmp_path):
+    recorder = Recorder(profile=False)
+    for n in range(3):
+        with recorder.stage('read') as s:
+            s.add(nbytes=100, items=n)
+    (tmp_path / 'file.bin').write_bytes(b'x' * 64)
+    with recorder.stage('read') as s:
+        s.add_file(str(tmp_path / 'file.bin'))
+        s.add_file(str(tmp_path / 'missing.bin'))
+    with pytest.raises(RuntimeError):
+        with recorder.stage('parse'):
+            raise RuntimeError('bad row')
+
+    path, report = recorder.write(str(tmp_path / 'reports' / 'run.json'))
+    read = report['stages']['read']
+    assert (read['calls'], read['bytes'], read['items'], read['failures']) == (4, 364, 3, 0)
+    assert report['stages']['parse']['failures'] == 1
+    assert read['max_seconds'] <= read['seconds']
+    assert report['peak_rss_mb'] > 0 and 'profile' not in report
+    with open(path) as f:
+        assert json.load(f) == report
+
+
+def test_peak_rss_is_in_megabytes():
+    # Any Python process holds more than a megabyte and far less than a terabyte.
+    assert 1 < peak_rss_mb() < 2 ** 20
+
+
+@pytest.mark.skipif(not hasattr(instrumentation.signal, 'setitimer'), reason='needs setitimer')
+def test_profiled_stage_collects_samples():
+    recorder = Recorder(profile=True)
+    with recorder.stage('spin', profile=True):
+        deadline = time.perf_counter() + 5
+        while sum(recorder.sampler.stacks.values()) < 5 and time.perf_counter() < deadline:
+            pass
+    summary = recorder.report()['profile']
+    assert summary['samples'] >= 5
+    assert any('test_instrumentation.py' in entry['line'] for entry in summary['top_lines'])
+    assert recorder.sampler.active == 0
+
+
+def test_enabled_process_writes_a_report_at_exit(tmp_path):
+    env = dict(os.environ, FF_INSTRUMENT='1', FF_INSTRUMENT_DIR=str(tmp_path))
+    code = "from instrumentation import stage\nwith stage('work') as s:\n    s.add(items=7)\n"
+    subprocess.run([sys.executable, '-c', code], cwd=SCRIPTS_DIR, env=env, check=True, capture_output=True)
+    [name] = os.listdir(tmp_path)
+    with open(tmp_path / name) as f:
+        report = json.load(f)
+    assert report['stages']['work']['items'] == 7
@@ -0,0 +1,36 @@
+import pytest
+
+from conftest import DRAFT_IDS, SCRIPTS_DIR
+from draft_model import MODEL_FEATURES
+from live_draft_tracker import LiveDraftTracker
+from sleeper_client import SleeperClient
+
+
+@pytest.fixture
+def tracker(sleeper_server, data_dir, monkeypatch):
+    # NumpyDraftModel reads the committed weights relative to scripts/.
+    monkeypatch.chdir(SCRIPTS_DIR)
+    minmax = {col: (0.0, 1.0) for col in MODEL_FEATURES}
+    return LiveDraftTracker(DRAFT_IDS[0], SleeperClient(sleeper_server.base_url, cache_dir=None),
+                            data_dir=data_dir, minmax=minmax)
+
+
+def test_drafted_defense_is_marked(tracker):
+    dst = tracker.state.positions['dst']
+    row = dst.best_row()
+    player_id = str(dst.table.player_ids[row])
+    available = dst.available
+
+    tracker.ingest([{'pick_no': 1, 'round': 1, 'draft_slot': 1, 'player_id': player_id,
+                     'metadata': {'position': 'DEF'}}])
+    assert dst.available == available - 1
+    assert dst.best_row() != row
+
+
+def test_last_round_defense_is_still_available(tracker, drafts):
+    picks = drafts[str(DRAFT_IDS[0])]['picks']
+    tracker.ingest(picks[:-1])
+    recommendation = tracker.recommend()
+    assert recommendation['position'] == 'DST'
+    taken = {str(p['player_id']) for p in picks[:-1]}
+    assert recommendation['player_id'] not in taken
@@ -0,0 +1,42 @@
+import pandas as pd
+import pytest
+
+from draft_state import replay_draft
+from feature_store import FeatureStore
+from model_data import CSV_ORDER, encode_labels, load_draft_data, training_frame
+from sleeper_client import picks_to_df
+
+
+def test_unknown_labels_raise():
+    assert encode_labels(['QB', 'RB', 'TE', 'WR']).tolist() == [0, 1, 2, 3]
+    with pytest.raises(ValueError, match='K'):
+        encode_labels(['QB', 'K', None])
+
+
+def test_training_frame_drops_early_kickers_and_defenses(drafts, data_dir, capsys):
+    raw = next(iter(drafts.values()))
+    df = replay_draft(raw['draft'], picks_to_df(raw['picks']), data_dir)
+    df.loc[[3, 40], 'position_drafted'] = ['K', 'DEF']
+    frame = training_frame(df)
+    assert len(frame) == (df['round'] <= 13).sum() - 2
+    assert set(frame['position_drafted']) <= {'QB', 'RB', 'TE', 'WR'}
+    assert 'Dropped 2 picks' in capsys.readouterr().out
+
+
+def test_store_rows_come_back_in_csv_order(tmp_path, drafts, data_dir):
+    frames = []
+    for draft_id, raw in drafts.items():
+        df = replay_draft(raw['draft'], picks_to_df(raw['picks']), data_dir)
+        df['draft_id'] = int(draft_id)
+        frames.append(df)
+    store = FeatureStore(str(tmp_path / 'store'))
+    # Appended newest first, so append order differs from CSV order.
+    for df in reversed(frames):
+        store.append(df)
+
+    expected = pd.concat(frames).sort_values(CSV_ORDER, kind='stable', ignore_index=True)
+    loaded = load_draft_data(store_dir=str(tmp_path / 'store'))
+    pd.testing.assert_frame_equal(loaded[expected.columns], expected, check_dtype=False)
+    subset = load_draft_data(['pick_no', 'position_drafted'], store_dir=str(tmp_path / 'store'))
+    assert list(subset.columns) == ['pick_no', 'position_drafted']
+    assert subset['pick_no'].tolist() == expected['pick_no'].tolist()
@@ -0,0 +1,38 @@
+import json
+
+import numpy as np
+
+from model_search import config_name, expand_configs, leaderboard, prune
+
+
+def scored(fold, balanced_accuracy, kappa=0.5):
+    return {'fold': fold, 'balanced_accuracy': balanced_accuracy, 'kappa': kappa,
+            'inference_us_per_row': 1.0, 'fit_seconds': 2.0}
+
+
+def test_expand_configs_grid_and_sample():
+    grid = expand_configs(['rf'])
+    assert len(grid) == 12 and all(c['family'] == 'rf' for c in grid)
+    sample = expand_configs(['rf', 'xgb'], n_random=5, seed=1)
+    assert len(sample) == 5 and sample == expand_configs(['rf', 'xgb'], n_random=5, seed=1)
+
+
+def test_prune_drops_errors_and_trailing_configs():
+    configs = dict(enumerate(expand_configs(['rf'])[:5]))
+    results = {0: [scored(0, 0.80)], 1: [scored(0, 0.79)], 2: [scored(0, 0.70)], 3: [{'fold': 0, 'error': 'boom'}],
+               4: [scored(0, 0.78)]}
+    assert list(prune(configs, results, margin=0.03, keep_fraction=1.0)) == [0, 1, 4]
+    assert list(prune(configs, results, margin=0.03, keep_fraction=0.5)) == [0, 1]
+    assert prune(configs, {i: [{'fold': 0, 'error': 'boom'}] for i in configs}, 0.03, 0.5) == {}
+
+
+def test_leaderboard_ranks_complete_configs_first():
+    configs = dict(enumerate(expand_configs(['rf'])[:3]))
+    results = {0: [scored(0, 0.80), scored(1, 0.82)], 1: [scored(0, 0.90)], 2: [{'fold': 0, 'error': 'boom'}]}
+    board = leaderboard(configs, results, n_folds=2)
+    assert board['model'].tolist() == [config_name(configs[i]) for i in [0, 1, 2]]
+    assert board.loc[0, 'complete'] and np.isclose(board.loc[0, 'balanced_accuracy'], 0.81)
+    assert board.loc[2, 'error'] == 'boom' and np.isnan(board.loc[2, 'balanced_accuracy'])
+    # main() writes errored rows as null, not NaN.
+    records = json.loads(json.dumps(board.replace({np.nan: None}).to_dict(orient='records'), default=float))
+    assert records[2]['balanced_accuracy'] is None
@@ -0,0 +1,35 @@
+import numpy as np
+import pandas as pd
+
+from normalization_stats import BOUNDED_COLS, VOR_COLS, RunningStats, compute_stats
+
+
+def test_merged_chunks_match_one_pass():
+    rng = np.random.default_rng(0)
+    values = rng.normal(50, 20, (1000, 4))
+    values[rng.random(values.shape) < 0.1] = np.nan
+    running = RunningStats(values.shape[1])
+    for chunk in np.array_split(values, [1, 7, 300, 301, 650]):
+        running.update(chunk)
+    running.update(np.full((5, 4), np.nan))
+
+    np.testing.assert_array_equal(running.n, (~np.isnan(values)).sum(axis=0))
+    np.testing.assert_allclose(running.mean, np.nanmean(values, axis=0))
+    np.testing.assert_allclose(running.std(), np.nanstd(values, axis=0, ddof=1))
+    np.testing.assert_array_equal(running.min, np.nanmin(values, axis=0))
+    np.testing.assert_array_equal(running.max, np.nanmax(values, axis=0))
+
+
+def test_compute_stats_skips_forced_rounds(tmp_path):
+    rng = np.random.default_rng(1)
+    df = pd.DataFrame(rng.normal(size=(300, len(BOUNDED_COLS + VOR_COLS))), columns=BOUNDED_COLS + VOR_COLS)
+    df['round'] = np.tile(np.arange(1, 16), 20)
+    path = tmp_path / 'all_draft_data.csv'
+    df.to_csv(path, index=False)
+
+    stats = compute_stats(store_dir=str(tmp_path / 'store'), csv_path=str(path))
+    kept = df[df['round'] <= 13]
+    assert stats['rows'] == len(kept)
+    assert stats['minmax']['round'] == {'min': 1, 'max': 13}
+    assert np.isclose(stats['standard']['qb_vor']['mean'], kept['qb_vor'].mean())
+    assert np.isclose(stats['standard']['qb_vor']['std'], kept['qb_vor'].std())
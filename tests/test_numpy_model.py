@@ -0,0 +1,34 @@
+import os
+
+import numpy as np
+import pytest
+
+from conftest import SCRIPTS_DIR
+from draft_model import MODEL_FEATURES, POSITION_CLASSES
+from numpy_model import NumpyDraftModel
+
+MODELS_DIR = os.path.join(os.path.dirname(SCRIPTS_DIR), 'models')
+
+
+@pytest.fixture(scope='module')
+def features():
+    return np.random.default_rng(0).random((512, len(MODEL_FEATURES)), dtype=np.float32)
+
+
+def test_chunked_forward_matches_one_pass(features):
+    model = NumpyDraftModel(MODELS_DIR)
+    chunked = NumpyDraftModel(MODELS_DIR, chunk_size=100).predict(features)
+    probs = model.predict(features)
+    assert probs.shape == (len(features), len(POSITION_CLASSES))
+    np.testing.assert_allclose(probs.sum(axis=1), 1, rtol=1e-5)
+    np.testing.assert_allclose(chunked, probs, atol=1e-6)
+    np.testing.assert_allclose(model.predict(features[0]), probs[:1], atol=1e-6)
+
+
+def test_matches_keras(features):
+    pytest.importorskip('tensorflow')
+    pytest.importorskip('h5py')
+    from draft_model import KerasDraftModel
+
+    keras_probs = KerasDraftModel(os.path.join(MODELS_DIR, 'best_model.weights.h5')).predict(features)
+    np.testing.assert_allclose(NumpyDraftModel(MODELS_DIR).predict(features), keras_probs, atol=1e-5)
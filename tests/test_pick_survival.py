@@ -0,0 +1,60 @@
+import numpy as np
+import pytest
+
+from pick_survival import MIN_SD, SCORING_TYPES, PickSurvival, survival_table
+
+
+@pytest.fixture
+def history():
+    # 'often' goes around pick 10 in all 20 drafts, 'once' in a single
+    # draft, and 'never' is on no board at all.
+    rng = np.random.default_rng(0)
+    drafts = []
+    for i in range(20):
+        picks = {'often': int(rng.integers(8, 13)), 'late': int(rng.integers(25, 40))}
+        if i == 0:
+            picks['once'] = 30
+        drafts.append((40, picks))
+    return ['late', 'never', 'often', 'once'], drafts
+
+
+def test_survival_is_monotone_and_bounded(history):
+    player_ids, drafts = history
+    table = survival_table(player_ids, drafts, 40)
+    survival = table['survival'].astype(int)
+    assert survival.shape == (4, 42)
+    assert (np.diff(survival, axis=1) <= 0).all()
+    assert (survival[:, :2] == 255).all()
+    assert (survival[1] == 255).all()
+    # Drafted in every draft, so nearly gone once the empirical picks pass.
+    assert survival[2, 13] < 0.2 * 255 and survival[2, 7] > 0.8 * 255
+
+
+def test_sparse_players_lean_on_the_prior(history):
+    player_ids, drafts = history
+    table = survival_table(player_ids, drafts, 40)
+    assert table['count'].tolist() == [20, 0, 20, 1]
+    assert table['n_drafts'] == 20
+    assert np.isnan(table['adp'][1]) and table['adp'][3] == 30
+    assert table['sd'][1] == MIN_SD
+    # One sighting has no spread of its own, so its sd is the prior: ADP
+    # times the median sd/ADP ratio of the well-observed players.
+    ratio = np.median([np.std([p[pid] for _, p in drafts], ddof=1) / np.mean([p[pid] for _, p in drafts])
+                       for pid in ('late', 'often')])
+    assert table['sd'][3] == pytest.approx(max(MIN_SD, 30 * ratio), rel=1e-5)
+    # A single sighting only moves its curve part of the way to zero.
+    assert table['survival'][3, -1] > 0.5 * 255
+
+
+def test_lookups_round_trip(history, tmp_path):
+    player_ids, drafts = history
+    tables = {scoring: survival_table(player_ids, drafts, 40) for scoring in SCORING_TYPES}
+    path = str(tmp_path / 'pick_survival.npz')
+    PickSurvival(player_ids, tables).save(path)
+    index = PickSurvival.load(path)
+    assert index.survival('unknown', 5) == 1.0
+    assert index.survival('often', 100) == tables['ppr']['survival'][2, -1] / 255.0
+    np.testing.assert_array_equal(index.survival_many(['often', 'unknown', 'late'], 20),
+                                  [index.survival('often', 20), 1.0, index.survival('late', 20)])
+    assert index.adp('never') == (pytest.approx(np.nan, nan_ok=True), MIN_SD, 0)
+    assert index.adp('unknown') is None
@@ -0,0 +1,82 @@
+import pytest
+
+from pipeline import STAGES, Stage, levels, load_state, run_pipeline, select
+
+
+def layer_of(layers):
+    return {stage.name: i for i, layer in enumerate(layers) for stage in layer}
+
+
+def test_levels_order_real_stages():
+    layers, deps = levels(STAGES)
+    layer = layer_of(layers)
+    assert deps['byes'] == {'projections'}
+    assert deps['features'] == {'projections', 'byes', 'drafts'}
+    assert deps['bundle'] == {'projections', 'byes', 'stats', 'survival'}
+    for name, upstream in deps.items():
+        assert all(layer[u] < layer[name] for u in upstream)
+    assert layer['seasons'] == layer['drafts'] == layer['projections'] == 0
+
+
+def test_levels_rejects_cycles():
+    stages = [Stage('a', [], inputs=['b.csv'], outputs=['a.csv']),
+              Stage('b', [], inputs=['a.csv'], outputs=['b.csv'])]
+    with pytest.raises(ValueError, match='cycle'):
+        levels(stages)
+
+
+def test_select_pulls_in_upstream_only():
+    assert [s.name for s in select(STAGES, ['stats'])] == ['projections', 'byes', 'drafts', 'features', 'stats']
+    assert select(STAGES, []) == STAGES
+
+
+def copy_stage(name, src, dst):
+    # Writes dst from src, so a change to src changes dst's hash too.
+    code = f"open({str(dst)!r}, 'w').write(open({str(src)!r}).read() + '+')"
+    return Stage(name, ['-c', code], inputs=[str(src)], outputs=[str(dst)])
+
+
+@pytest.fixture
+def chain(tmp_path, monkeypatch):
+    # run_stage logs to ../data/cache relative to the working directory.
+    (tmp_path / 'scripts').mkdir()
+    monkeypatch.chdir(tmp_path / 'scripts')
+    (tmp_path / 'a.txt').write_text('a')
+    stages = [copy_stage('first', tmp_path / 'a.txt', tmp_path / 'b.txt'),
+              copy_stage('second', tmp_path / 'b.txt', tmp_path / 'c.txt')]
+    return tmp_path, stages, str(tmp_path / 'state.json')
+
+
+def statuses(report):
+    return {name: (status, reason) for name, status, _, reason in report}
+
+
+def test_run_pipeline_reruns_only_stale_stages(chain):
+    tmp_path, stages, state_path = chain
+    report = statuses(run_pipeline(stages, state_path=state_path))
+    assert report == {'first': ('ran', 'never built'), 'second': ('ran', 'never built')}
+    assert (tmp_path / 'c.txt').read_text() == 'a++'
+
+    report = statuses(run_pipeline(stages, state_path=state_path))
+    assert report == {'first': ('up to date', ''), 'second': ('up to date', '')}
+
+    (tmp_path / 'c.txt').unlink()
+    report = statuses(run_pipeline(stages, dry_run=True, state_path=state_path))
+    assert report['first'] == ('up to date', '')
+    assert report['second'] == ('would run', f"missing {tmp_path / 'c.txt'}")
+    assert not (tmp_path / 'c.txt').exists()
+    run_pipeline(stages, targets=['second'], state_path=state_path)
+
+    (tmp_path / 'a.txt').write_text('z')
+    report = statuses(run_pipeline(stages, state_path=state_path))
+    assert report == {'first': ('ran', 'changed a.txt'), 'second': ('ran', 'changed b.txt')}
+    assert (tmp_path / 'c.txt').read_text() == 'z++'
+
+
+def test_failed_stage_blocks_downstream(chain):
+    tmp_path, stages, state_path = chain
+    stages[0].command = ['-c', 'raise SystemExit(1)']
+    report = statuses(run_pipeline(stages, state_path=state_path))
+    assert report['first'][0] == 'failed'
+    assert report['second'] == ('blocked', 'upstream first failed')
+    assert load_state(state_path) == {}
@@ -0,0 +1,45 @@
+import pandas as pd
+import pytest
+
+from player_index import PlayerIndex, normalize_name
+
+
+@pytest.fixture
+def index():
+    players = pd.DataFrame({
+        'player_id': ['1', '2', '3', '4', '5', '6'],
+        'full_name': ['Marvin Harrison Jr.', 'Marvin Harrison', 'Chigoziem Okonkwo', 'Josh Allen', 'Josh Allen',
+                      "Ja'Marr Chase"],
+        'team': ['ARI', None, 'TEN', 'BUF', 'JAX', 'CIN'],
+        'position': ['WR', 'WR', 'TE', 'QB', 'LB', 'WR'],
+        'active': [True, False, True, True, True, True]
+    })
+    return PlayerIndex.build(players)
+
+
+def test_normalize_name_drops_punctuation_and_suffixes():
+    assert normalize_name('Marvin Harrison Jr.') == 'marvin harrison'
+    assert normalize_name("Ja'Marr Chase") == 'jamarr chase'
+
+
+def test_exact_key_prefers_active_rostered_player(index):
+    assert index.match('Marvin Harrison', 'ARI', 'WR') == '1'
+
+
+def test_name_and_position_without_team(index):
+    assert index.match('Chigoziem Okonkwo', 'FA', 'TE') == '3'
+    assert index.match('Josh Allen', 'BUF', 'QB') == '4'
+
+
+def test_nickname_matches_on_last_name_team_and_position(index):
+    assert index.match('Chig Okonkwo', 'TEN', 'TE') == '3'
+
+
+def test_fuzzy_match_stays_inside_team_position_bucket(index):
+    assert index.match('Jamar Chase', 'CIN', 'WR') == '6'
+    assert index.match('Jamar Chase', 'BUF', 'WR') is None
+
+
+def test_team_and_position_aliases(index):
+    assert index.match('Chigoziem Okonkwo', 'TEN', 'TE1') == '3'
+    assert index.match('Josh Allen', 'JAC', 'LB') == '5'
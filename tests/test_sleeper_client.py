@@ -0,0 +1,38 @@
+import os
+
+from conftest import DRAFT_IDS
+from sleeper_client import SleeperClient
+
+
+def client_for(server, cache_dir):
+    return SleeperClient(server.base_url, cache_dir=cache_dir, backoff_factor=0)
+
+
+def test_retries_throttled_requests(sleeper_server, drafts):
+    sleeper_server.throttle_every = 2
+    drafts_fetched, failures = client_for(sleeper_server, None).fetch_drafts(DRAFT_IDS)
+    assert failures == {}
+    assert {str(d) for d in drafts_fetched} == set(drafts)
+    # Two endpoints per draft, plus the 429s that were retried.
+    assert sleeper_server.request_count > 2 * len(DRAFT_IDS)
+
+
+def test_completed_drafts_are_served_from_cache(sleeper_server, drafts, tmp_path):
+    client = client_for(sleeper_server, str(tmp_path))
+    raw = client.fetch_draft(DRAFT_IDS[0])
+    assert raw == drafts[str(DRAFT_IDS[0])]
+    assert os.path.exists(tmp_path / 'drafts' / f'{DRAFT_IDS[0]}.json')
+
+    requests_before = sleeper_server.request_count
+    assert client.fetch_draft(DRAFT_IDS[0]) == raw
+    assert sleeper_server.request_count == requests_before
+
+
+def test_no_cache_dir_always_fetches(sleeper_server, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    client = client_for(sleeper_server, None)
+    assert client.load_cached_draft(DRAFT_IDS[0]) is None
+    client.fetch_draft(DRAFT_IDS[0])
+    client.fetch_draft(DRAFT_IDS[0])
+    assert sleeper_server.request_count == 4
+    assert os.listdir(tmp_path) == []